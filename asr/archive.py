@@ -0,0 +1,120 @@
+"""
+Opt-in rolling archive of captured utterances.
+
+With ASR_ARCHIVE_DIR set, every utterance listen() recognizes is kept as a
+compressed audio file (FLAC or Opus, via ffmpeg) next to a .json file with
+the Vosk and Whisper text, intent, confidence and stage timings. Encoding and
+writing happen on a background thread; the oldest utterances are deleted once
+the archive grows past ASR_ARCHIVE_MAX_MB.
+
+Archived files replay like any recording:
+
+    python main.py --audio-source wav:$HOME/.cache/jarvis/utterances/20250101-120000-000001.flac
+    jarvis-bench asr ~/.cache/jarvis/utterances
+
+The benchmark uses the archived text as the reference when there is no .txt
+transcript, which turns the archive into a regression corpus.
+"""
+import os
+import re
+import json
+import queue
+import logging
+import threading
+from datetime import datetime
+
+from asr.audio import encode_pcm
+
+logger = logging.getLogger("ASRArchive")
+
+EXTENSIONS = {"flac": ".flac", "opus": ".opus"}
+# Only files named like submit() names them count towards the cap, so a shared
+# directory (~/.cache/jarvis) never loses calibration or NLU cache files
+ARCHIVE_FILE = re.compile(r"^(\d{8}-\d{6}-\d{6})(\.flac|\.opus|\.json)$")
+
+
+class ArchiveRecord:
+    """One archived utterance; annotate() adds fields known only later (intent)."""
+
+    def __init__(self, archive, stem, metadata):
+        self.archive = archive
+        self.stem = stem
+        self.metadata = metadata
+
+    @property
+    def audio_path(self):
+        return self.stem + EXTENSIONS[self.archive.codec]
+
+    @property
+    def metadata_path(self):
+        return self.stem + ".json"
+
+    def annotate(self, **fields):
+        self.metadata.update(fields)
+        self.archive._queue.put((self, None))
+
+
+class UtteranceArchive:
+    """Size-capped directory of compressed utterances, written on a background thread."""
+
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024, codec="flac"):
+        if codec not in EXTENSIONS:
+            raise ValueError(f"Unknown archive format: {codec} (choose from {', '.join(EXTENSIONS)})")
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.codec = codec
+        self._counter = 0
+        self._queue = queue.Queue()
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="jarvis-archive", daemon=True)
+        self._thread.start()
+
+    def submit(self, pcm, metadata):
+        """Queue an utterance for archiving and return its record. Never blocks on disk."""
+        self._counter += 1
+        now = datetime.now()
+        stem = os.path.join(self.directory, f"{now:%Y%m%d-%H%M%S}-{self._counter:06d}")
+        record = ArchiveRecord(self, stem, dict(metadata, time=now.isoformat(timespec="seconds")))
+        self._queue.put((record, pcm))
+        return record
+
+    def _run(self):
+        while True:
+            record, pcm = self._queue.get()
+            try:
+                if pcm is not None:
+                    encode_pcm(pcm, record.audio_path, self.codec)
+                    self._write_metadata(record)
+                    self._enforce_limit()
+                elif os.path.exists(record.audio_path):
+                    self._write_metadata(record)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not archive utterance {os.path.basename(record.stem)}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write_metadata(self, record):
+        metadata = dict(record.metadata, audio=os.path.basename(record.audio_path))
+        with open(record.metadata_path, "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    def _enforce_limit(self):
+        # An utterance's audio and metadata are sized and deleted together
+        utterances = {}
+        for entry in os.scandir(self.directory):
+            match = ARCHIVE_FILE.match(entry.name)
+            if match and entry.is_file():
+                utterances.setdefault(match.group(1), []).append(entry)
+        sizes = {stem: sum(entry.stat().st_size for entry in entries) for stem, entries in utterances.items()}
+        total = sum(sizes.values())
+        # Stems sort chronologically, so the oldest utterances go first
+        for stem in sorted(utterances):
+            if total <= self.max_bytes:
+                break
+            for entry in utterances[stem]:
+                os.remove(entry.path)
+            total -= sizes[stem]
+
+    def flush(self):
+        """Wait until everything queued so far has been written."""
+        self._queue.join()
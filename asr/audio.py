@@ -0,0 +1,74 @@
+"""
+In-memory audio helpers shared by the speech pipeline.
+
+Captured audio is 16 kHz mono int16 PCM. Whisper consumes float32 samples in
+[-1, 1), so the captured bytes are converted in a single pass instead of being
+written to a WAV file and decoded again through ffmpeg.
+"""
+import os
+import wave
+import subprocess
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # bytes per int16 sample
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def pcm16_to_float32(pcm, out=None):
+    """
+    Convert int16 PCM bytes to a normalized float32 array.
+
+    The int16 view over `pcm` is zero-copy; the only allocation is the float32
+    result, which can be supplied through `out` to reuse a buffer.
+    """
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    return np.multiply(samples, INT16_SCALE, out=out, dtype=np.float32)
+
+
+def duration_seconds(pcm):
+    """Length of an int16 PCM buffer in seconds."""
+    return len(pcm) / (SAMPLE_WIDTH * SAMPLE_RATE)
+
+
+def load_wav(path):
+    """
+    Read a WAV file as 16 kHz mono int16 PCM bytes.
+
+    Stereo files are averaged down to mono and other sample rates are
+    resampled linearly, which is good enough for replaying test corpora.
+    """
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != SAMPLE_WIDTH:
+            raise ValueError(f"{path}: expected 16-bit PCM, got {8 * wav.getsampwidth()}-bit")
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        duration = len(samples) / rate
+        target = np.linspace(0, duration, int(duration * SAMPLE_RATE), endpoint=False)
+        samples = np.interp(target, np.arange(len(samples)) / rate, samples)
+    return np.asarray(samples, dtype=np.int16).tobytes()
+
+
+def encode_pcm(pcm, path, codec="flac"):
+    """Compress 16 kHz mono int16 PCM to `path` with ffmpeg ("flac" or "opus")."""
+    codec_args = ["-c:a", "flac"] if codec == "flac" else ["-c:a", "libopus", "-b:a", "24k"]
+    subprocess.run(["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-f", "s16le", "-ar", str(SAMPLE_RATE),
+                    "-ac", "1", "-i", "-", *codec_args, path], input=pcm, check=True)
+
+
+def load_audio(path):
+    """
+    Read any audio file as 16 kHz mono int16 PCM bytes. WAV files are read
+    directly; anything else (FLAC, Opus, ...) is decoded with ffmpeg.
+    """
+    if os.path.splitext(path)[1].lower() == ".wav":
+        return load_wav(path)
+    result = subprocess.run(["ffmpeg", "-nostdin", "-loglevel", "error", "-i", path, "-f", "s16le",
+                             "-ar", str(SAMPLE_RATE), "-ac", "1", "-"], capture_output=True, check=True)
+    return result.stdout
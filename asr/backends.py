@@ -0,0 +1,114 @@
+"""
+Second-pass ASR backends.
+
+Vosk always does the streaming first pass and endpointing. The backend then
+turns the trimmed utterance into the final text. Every backend exposes the
+same contract:
+
+    backend.transcribe(audio, language) -> str
+
+where `audio` is a float32 numpy array of 16 kHz mono samples in [-1, 1).
+Streaming transcription additionally uses
+
+    backend.transcribe_words(audio, language, prompt) -> [(word, start, end)]
+
+with start/end in seconds from the beginning of `audio`.
+Pick one with ASR_BACKEND in config.py:
+
+    "whisper"         openai-whisper on PyTorch (default)
+    "faster-whisper"  CTranslate2 Whisper, int8 on CPU by default
+    "vosk"            no second pass, the Vosk text is final
+"""
+import json
+import logging
+
+import numpy as np
+
+logger = logging.getLogger("ASRBackends")
+
+
+class WhisperBackend:
+    """openai-whisper, the original PyTorch implementation."""
+
+    name = "whisper"
+    refines = True
+
+    def __init__(self, size="tiny"):
+        import whisper
+
+        self.size = size
+        self.model = whisper.load_model(size)
+
+    def transcribe(self, audio, language="en"):
+        result = self.model.transcribe(audio, language=language)
+        return result.get("text", "").strip()
+
+    def transcribe_words(self, audio, language="en", prompt=None):
+        result = self.model.transcribe(audio, language=language, word_timestamps=True, initial_prompt=prompt,
+                                       condition_on_previous_text=False)
+        return [(word["word"].strip(), word["start"], word["end"])
+                for segment in result.get("segments", []) for word in segment.get("words", [])]
+
+
+class FasterWhisperBackend:
+    """
+    CTranslate2 port of Whisper (faster-whisper). With int8 weights it is
+    several times faster than openai-whisper on CPU and needs no PyTorch.
+    """
+
+    name = "faster-whisper"
+    refines = True
+
+    def __init__(self, size="tiny", compute_type="int8", cpu_threads=0):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError("ASR_BACKEND 'faster-whisper' needs the faster-whisper package: "
+                              "pip install faster-whisper")
+
+        self.size = size
+        self.model = WhisperModel(size, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+
+    def transcribe(self, audio, language="en"):
+        segments, _ = self.model.transcribe(audio, language=language, beam_size=1)
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    def transcribe_words(self, audio, language="en", prompt=None):
+        segments, _ = self.model.transcribe(audio, language=language, beam_size=1, word_timestamps=True,
+                                            initial_prompt=prompt, condition_on_previous_text=False)
+        return [(word.word.strip(), word.start, word.end) for segment in segments for word in segment.words or []]
+
+
+class VoskBackend:
+    """
+    Vosk-only operation. The pipeline uses the first-pass text directly; the
+    transcribe() method exists so offline tools can score Vosk like any other
+    backend.
+    """
+
+    name = "vosk"
+    refines = False
+
+    def __init__(self, size="small", recognizer_factory=None):
+        self.size = size
+        self._recognizer_factory = recognizer_factory
+
+    def _recognize(self, audio, language):
+        recognizer = self._recognizer_factory(language)
+        pcm = np.clip(audio * 32768.0, -32768, 32767).astype(np.int16).tobytes()
+        recognizer.AcceptWaveform(pcm)
+        return json.loads(recognizer.FinalResult())
+
+    def transcribe(self, audio, language="en"):
+        return self._recognize(audio, language).get("text", "").strip()
+
+    def transcribe_words(self, audio, language="en", prompt=None):
+        result = self._recognize(audio, language)
+        return [(word["word"], word["start"], word["end"]) for word in result.get("result", [])]
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+    VoskBackend.name: VoskBackend,
+}
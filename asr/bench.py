@@ -0,0 +1,205 @@
+"""
+Offline benchmark harness for the speech pipeline.
+
+    jarvis-bench asr path/to/corpus --models tiny base --output run.json
+    jarvis-bench calibrate --force
+    jarvis-bench intents --k 0 4 8 --pca 64 128
+
+The corpus is a directory of WAV files, each with a reference transcript in a
+.txt file of the same name. Every file is replayed through
+asr.pipeline.recognize_utterance(), the same Vosk -> Whisper path as
+utils.listen(), and the report is printed or written as JSON so runs can be
+diffed against each other. The intents benchmark is described in
+nlu/evaluate.py.
+"""
+import os
+import sys
+import json
+import time
+import string
+import argparse
+import logging
+import resource
+
+import numpy as np
+
+from asr import settings
+from asr.backends import BACKENDS
+from asr.calibration import calibrate, select_sizes, cache_path
+from asr.model_registry import registry
+from asr.pipeline import recognize_utterance
+from asr.routing import ROUTE_AUTO, ROUTE_WHISPER
+from asr.sources import WavFileSource
+from nlu.evaluate import run_intent_benchmark
+
+logger = logging.getLogger("ASRBench")
+
+
+def normalize_words(text):
+    return text.lower().translate(str.maketrans("", "", string.punctuation)).split()
+
+
+def word_edit_distance(reference, hypothesis):
+    """Levenshtein distance between two word lists."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word)))
+        previous = current
+    return previous[-1]
+
+
+def percentiles(values, points=(50, 95, 99)):
+    if not values:
+        return {f"p{p}": None for p in points}
+    return {f"p{p}": round(float(np.percentile(values, p)), 4) for p in points}
+
+
+def peak_rss_bytes():
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".opus")
+
+
+def load_corpus(corpus_dir):
+    """
+    Return [(audio_path, reference_text)] for every recording with a transcript:
+    a .txt next to it or, for archived utterances, the text in their .json.
+    """
+    items = []
+    for name in sorted(os.listdir(corpus_dir)):
+        if not name.lower().endswith(AUDIO_EXTENSIONS):
+            continue
+        audio_path = os.path.join(corpus_dir, name)
+        stem = os.path.splitext(audio_path)[0]
+        if os.path.exists(stem + ".txt"):
+            with open(stem + ".txt", "r") as f:
+                items.append((audio_path, f.read().strip()))
+        elif os.path.exists(stem + ".json"):
+            with open(stem + ".json", "r") as f:
+                items.append((audio_path, json.load(f).get("text", "")))
+        else:
+            logger.warning(f"Skipping {name}: no reference transcript")
+    return items
+
+
+def transcribe_file(wav_path, model, language, route, detect, realtime, backend=None):
+    """Run every utterance in a WAV file through the pipeline."""
+    texts, latencies = [], []
+    with WavFileSource(wav_path, realtime=realtime) as source:
+        start = time.perf_counter()
+        while True:
+            utterance = recognize_utterance(source, model=model, language=language, route=route, detect=detect,
+                                            backend=backend)
+            if utterance is None:
+                break
+            texts.append(utterance["text"])
+            latencies.append(utterance["timings"]["eos_latency_seconds"])
+        elapsed = time.perf_counter() - start
+    return " ".join(texts), latencies, elapsed, source.duration_seconds
+
+
+def run_asr_benchmark(corpus_dir, models=("tiny",), language="en", route=ROUTE_WHISPER, realtime=False,
+                      backend=None):
+    corpus = load_corpus(corpus_dir)
+    if not corpus:
+        raise ValueError(f"No WAV files with transcripts found in {corpus_dir}")
+
+    detect = None
+    if route == ROUTE_AUTO:
+        from intent_classifier import detect_intent as detect
+
+    backend = backend or settings.ASR_BACKEND
+    report = {"corpus": os.path.abspath(corpus_dir), "files": len(corpus), "language": language,
+              "route": route, "realtime": realtime, "backend": backend, "models": {}}
+    registry.vosk_model(language)
+
+    for model in models:
+        # Load outside the timed region; load cost is reported separately
+        registry.backend(model, name=backend)
+        processing, audio, latencies, errors, ref_words = 0.0, 0.0, [], 0, 0
+        files = []
+        for wav_path, reference in corpus:
+            hypothesis, file_latencies, elapsed, duration = transcribe_file(
+                wav_path, model, language, route, detect, realtime, backend)
+            ref = normalize_words(reference)
+            edits = word_edit_distance(ref, normalize_words(hypothesis))
+            processing += elapsed
+            audio += duration
+            latencies.extend(file_latencies)
+            errors += edits
+            ref_words += len(ref)
+            files.append({"file": os.path.basename(wav_path), "reference": reference, "hypothesis": hypothesis,
+                          "wer": round(edits / max(len(ref), 1), 4), "rtf": round(elapsed / duration, 4)})
+            logger.info(f"{model} {os.path.basename(wav_path)}: {hypothesis!r}")
+
+        report["models"][model] = {
+            "rtf": round(processing / audio, 4),
+            "wer": round(errors / max(ref_words, 1), 4),
+            "eos_latency_seconds": percentiles(latencies),
+            "utterances": len(latencies),
+            "audio_seconds": round(audio, 2),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "files": files,
+        }
+
+    report["model_loads"] = registry.stats()["models"]
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="jarvis-bench", description="Jarvis offline benchmarks")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    asr_parser = subcommands.add_parser("asr", help="replay a WAV corpus through the listen() pipeline")
+    asr_parser.add_argument("corpus", help="directory of .wav files with same-named .txt transcripts")
+    asr_parser.add_argument("--models", nargs="+", default=["tiny"], help="Whisper sizes to compare")
+    asr_parser.add_argument("--backend", choices=sorted(BACKENDS), help="second-pass backend (default: ASR_BACKEND)")
+    asr_parser.add_argument("--language", default="en")
+    asr_parser.add_argument("--route", choices=[ROUTE_WHISPER, ROUTE_AUTO], default=ROUTE_WHISPER)
+    asr_parser.add_argument("--realtime", action="store_true", help="replay audio at 1x speed")
+    asr_parser.add_argument("--output", help="write the JSON report here instead of stdout")
+
+    calibrate_parser = subcommands.add_parser("calibrate", help="time each Whisper size and show the selection")
+    calibrate_parser.add_argument("--voice", help="Piper voice model used to synthesize the calibration clip")
+    calibrate_parser.add_argument("--backend", choices=sorted(BACKENDS), help="second-pass backend (default: ASR_BACKEND)")
+    calibrate_parser.add_argument("--force", action="store_true", help="re-measure even if a cached result exists")
+
+    intents_parser = subcommands.add_parser("intents", help="classify held-out intents.json phrases")
+    intents_parser.add_argument("--k", nargs="+", type=int, default=[0, 4, 8, 16],
+                                help="intents reranked after the prototype prefilter (0 = brute force)")
+    intents_parser.add_argument("--pca", nargs="*", type=int, default=[],
+                                help="also evaluate banks reduced to these PCA dimensions")
+    intents_parser.add_argument("--threshold", type=float, default=0.55)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+
+    if args.command == "calibrate":
+        rtfs = calibrate(voice_model=args.voice, backend=args.backend, force=args.force)
+        if rtfs is None:
+            parser.error("no calibration clip: set ASR_CALIBRATION_CLIP or pass --voice")
+        json.dump({"cache": cache_path(), "rtf": rtfs, "selection": select_sizes(rtfs)}, sys.stdout, indent=2)
+        print()
+        return
+
+    if args.command == "intents":
+        json.dump(run_intent_benchmark(ks=args.k, dims=args.pca, threshold=args.threshold), sys.stdout, indent=2)
+        print()
+        return
+
+    report = run_asr_benchmark(args.corpus, models=args.models, language=args.language,
+                               route=args.route, realtime=args.realtime, backend=args.backend)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
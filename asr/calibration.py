@@ -0,0 +1,171 @@
+"""
+Whisper model-size selection from a one-off CPU calibration.
+
+On first start a short calibration clip is transcribed with each candidate
+model size and the measured real-time factors are cached on disk, keyed by the
+backend and the machine. Every turn type then gets the largest size whose
+predicted end-of-speech latency fits its budget:
+
+    latency ≈ rtf × seconds the backend decodes after the user stops talking
+
+so fast desktops get accuracy and slow laptops stay responsive without manual
+tuning. The clip is ASR_CALIBRATION_CLIP if set, otherwise a fixed sentence
+synthesized once with Piper.
+"""
+import os
+import json
+import time
+import platform
+import subprocess
+import logging
+
+from asr import settings
+from asr.audio import load_wav, duration_seconds, pcm16_to_float32
+from asr.backends import VoskBackend
+from asr.model_registry import registry
+
+logger = logging.getLogger("ASRCalibration")
+
+# Turn types
+TURN_COMMAND = "command"      # commands and questions after the wake word
+TURN_DICTATION = "dictation"  # streamed email bodies and notes, only the tail is left at the end
+TURN_REPLY = "reply"          # short replies and triggers: yes/no, "stop the music"
+TURN_TYPES = (TURN_COMMAND, TURN_DICTATION, TURN_REPLY)
+
+CALIBRATION_TEXT = ("Jarvis, remind me to call the dentist tomorrow at nine, "
+                    "and send the quarterly report to the whole team.")
+CALIBRATION_RUNS = 2  # timed runs per size, after one warm-up
+
+
+def cache_path():
+    return os.path.join(settings.ASR_CACHE_DIR, "asr_calibration.json")
+
+
+def machine_key(backend):
+    """Identifies the measurement: a new CPU, backend or thread setting invalidates it."""
+    return {
+        "backend": backend,
+        "compute_type": settings.FASTER_WHISPER_COMPUTE_TYPE,
+        "cpu_threads": settings.ASR_CPU_THREADS,
+        "cpu_count": os.cpu_count(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def calibration_clip(voice_model=None):
+    """Return the path of the calibration WAV, synthesizing it with Piper if needed."""
+    if settings.ASR_CALIBRATION_CLIP:
+        return settings.ASR_CALIBRATION_CLIP
+
+    path = os.path.join(settings.ASR_CACHE_DIR, "calibration.wav")
+    if os.path.exists(path):
+        return path
+    if voice_model is None:
+        return None
+    os.makedirs(settings.ASR_CACHE_DIR, exist_ok=True)
+    try:
+        subprocess.run(["piper", "--model", voice_model, "--output_file", path],
+                       input=CALIBRATION_TEXT.encode(), check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"⚠️ Could not synthesize the calibration clip with Piper: {e}")
+        return None
+    return path
+
+
+def measure_rtf(clip_path, sizes, backend=None, language="en", max_rtf=None):
+    """
+    Time the clip through each size, smallest first, and return {size: rtf}.
+
+    Sizes are measured in order and measuring stops at the first one slower
+    than `max_rtf`, since every larger size would be slower still.
+    """
+    pcm = load_wav(clip_path)
+    audio = pcm16_to_float32(pcm)
+    clip_seconds = duration_seconds(pcm)
+    rtfs = {}
+    for size in sizes:
+        logger.info(f"⏱️ Calibrating {backend or settings.ASR_BACKEND} {size}...")
+        # Uncached instance: calibration must not leave every size resident
+        model = registry.new_backend(size, name=backend)
+        model.transcribe(audio, language=language)  # warm-up
+        start = time.perf_counter()
+        for _ in range(CALIBRATION_RUNS):
+            model.transcribe(audio, language=language)
+        rtf = (time.perf_counter() - start) / CALIBRATION_RUNS / clip_seconds
+        rtfs[size] = round(rtf, 4)
+        del model
+        logger.info(f"⏱️ {size}: real-time factor {rtf:.3f}")
+        if max_rtf is not None and rtf > max_rtf:
+            break
+    return rtfs
+
+
+def select_sizes(rtfs, budgets=None, turn_seconds=None, fallback="tiny"):
+    """
+    Return {turn_type: size}: the largest calibrated size (in the order they
+    were measured) whose predicted latency fits each turn type's budget.
+    """
+    budgets = budgets or settings.ASR_LATENCY_BUDGETS
+    turn_seconds = turn_seconds or settings.ASR_TURN_SECONDS
+    selection = {}
+    for turn in TURN_TYPES:
+        chosen = fallback
+        for size, rtf in rtfs.items():
+            if rtf * turn_seconds[turn] <= budgets[turn]:
+                chosen = size
+        selection[turn] = chosen
+    return selection
+
+
+def _max_useful_rtf():
+    return max(settings.ASR_LATENCY_BUDGETS[turn] / settings.ASR_TURN_SECONDS[turn] for turn in TURN_TYPES)
+
+
+def calibrate(voice_model=None, backend=None, force=False):
+    """
+    Return the cached {size: rtf} for this machine, measuring it first if the
+    cache is missing or stale. Returns None if no calibration clip is available.
+    """
+    backend = backend or settings.ASR_BACKEND
+    key = machine_key(backend)
+    sizes = list(settings.ASR_CALIBRATION_SIZES)
+    path = cache_path()
+    if not force and os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                cached = json.load(f)
+            if cached.get("key") == key and cached.get("sizes") == sizes:
+                return cached["rtf"]
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable calibration cache {path}: {e}")
+
+    clip = calibration_clip(voice_model)
+    if clip is None:
+        return None
+    rtfs = measure_rtf(clip, sizes, backend=backend, max_rtf=_max_useful_rtf())
+    os.makedirs(settings.ASR_CACHE_DIR, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"key": key, "sizes": sizes, "rtf": rtfs}, f, indent=2)
+    return rtfs
+
+
+def model_sizes(voice_model=None):
+    """
+    Return {turn_type: size}. ASR_MODEL_SIZE pins every turn to one size;
+    "auto" (the default) selects from the calibration, falling back to tiny.
+    """
+    if settings.ASR_MODEL_SIZE != "auto":
+        return {turn: settings.ASR_MODEL_SIZE for turn in TURN_TYPES}
+    if settings.ASR_BACKEND == VoskBackend.name:
+        return {turn: "tiny" for turn in TURN_TYPES}  # no second pass, size is irrelevant
+    try:
+        rtfs = calibrate(voice_model)
+    except Exception as e:
+        logger.warning(f"⚠️ ASR calibration failed, using tiny: {e}")
+        rtfs = None
+    if not rtfs:
+        return {turn: "tiny" for turn in TURN_TYPES}
+    selection = select_sizes(rtfs)
+    logger.info(f"⏱️ Whisper sizes by turn type: {selection}")
+    return selection
@@ -0,0 +1,324 @@
+"""
+Always-on microphone capture shared by every consumer of speech input.
+
+A single long-lived thread reads 16 kHz int16 frames from the default input
+device into a preallocated ring buffer. Consumers such as utils.listen() read
+from it through a CaptureCursor, starting a little in the past (pre-roll) so
+speech that begins right after a prompt is not clipped while a stream opens.
+
+The input does not have to be a microphone: any audio input from
+asr.sources (WAV file, raw PCM on stdin, UNIX socket) can feed the ring, see
+set_audio_input(). When a finite input ends the ring is closed and readers
+get AudioInputEnded from the utils helpers.
+
+While the assistant itself is talking (see playback()), the microphone hears
+its TTS output. Depending on PLAYBACK_GATING those frames are replaced with
+silence before they reach the ring, so no recognizer spends time on them, or
+only tagged, so listeners can discard utterances that overlap playback.
+"""
+import time
+import atexit
+import threading
+import logging
+import contextlib
+from collections import deque
+
+import numpy as np
+
+from asr.audio import SAMPLE_RATE, SAMPLE_WIDTH
+from asr.sources import MicrophoneInput
+from asr import settings
+
+logger = logging.getLogger("ASRCapture")
+
+CAPTURE_BLOCKSIZE = 800        # frames per device read (50 ms)
+RING_SECONDS = 30              # history kept in the ring buffer
+DEFAULT_PREROLL_MS = 500       # audio replayed from before the cursor was opened
+
+GATING_OFF = "off"             # capture playback like any other audio
+GATING_TAG = "tag"             # keep the audio, remember when playback happened
+GATING_SUPPRESS = "suppress"   # replace audio captured during playback with silence
+
+
+class AudioInputEnded(Exception):
+    """The capture service's input (file, stdin) has no more audio."""
+
+
+class RingBuffer:
+    """
+    Fixed-size int16 ring addressed by absolute sample position.
+
+    Position 0 is the first sample ever written; `write_pos` only grows. Readers
+    ask for absolute positions and are moved forward if the writer has already
+    overwritten the samples they wanted.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._write_pos = 0
+        self.closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def write_pos(self):
+        return self._write_pos
+
+    @property
+    def oldest_pos(self):
+        return max(0, self._write_pos - self.capacity)
+
+    def write(self, pcm):
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        total = len(samples)
+        if total == 0:
+            return
+        # Anything larger than the ring only keeps its newest tail
+        kept = samples[-self.capacity:]
+        with self._cond:
+            start = (self._write_pos + total - len(kept)) % self.capacity
+            first = min(len(kept), self.capacity - start)
+            self._buffer[start:start + first] = kept[:first]
+            self._buffer[:len(kept) - first] = kept[first:]
+            self._write_pos += total
+            self._cond.notify_all()
+
+    def read(self, start, max_samples):
+        """
+        Copy up to `max_samples` samples beginning at absolute position `start`.
+
+        Returns (position, pcm_bytes) where position is where the copy actually
+        began, which is later than `start` if those samples were overwritten.
+        """
+        with self._cond:
+            start = max(start, self.oldest_pos)
+            end = min(self._write_pos, start + max_samples)
+            if end <= start:
+                return start, b""
+            begin = start % self.capacity
+            count = end - start
+            first = min(count, self.capacity - begin)
+            if first == count:
+                pcm = self._buffer[begin:begin + count].tobytes()
+            else:
+                pcm = self._buffer[begin:].tobytes() + self._buffer[:count - first].tobytes()
+            return start, pcm
+
+    def wait_for(self, position, timeout=None):
+        """Block until the writer has passed `position` or the ring was closed. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._write_pos > position or self.closed, timeout)
+
+    def close(self):
+        """Mark the end of the audio: readers stop waiting for more."""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class CaptureCursor:
+    """Independent read position over a CaptureService ring buffer."""
+
+    def __init__(self, service, position):
+        self._service = service
+        self.position = position
+
+    def read(self, frames, timeout=None):
+        """
+        Return exactly `frames` frames of int16 PCM, blocking until they are
+        captured. Returns b"" if `timeout` expires first. Once the input has
+        ended the remaining audio is returned, then b"".
+        """
+        ring = self._service.ring
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while ring.write_pos < self.position + frames and not ring.closed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return b""
+            ring.wait_for(self.position + frames - 1, remaining)
+
+        start, pcm = ring.read(self.position, frames)
+        if start > self.position:
+            logger.warning(f"⚠️ Capture reader fell behind, skipped {(start - self.position) / SAMPLE_RATE:.2f}s")
+        self.position = start + len(pcm) // SAMPLE_WIDTH
+        return pcm
+
+    def close(self):
+        """Mark audio up to the cursor as consumed so the next pre-roll starts after it."""
+        self._service.mark_consumed(self.position)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EchoSuppressor:
+    """
+    Lets loud frames through while the assistant is talking so the user can
+    still interrupt. The echo level is learned as a running average of the
+    block energy heard during playback; a block passes only when it is
+    `ratio` times louder than that.
+    """
+
+    WARMUP_BLOCKS = 5
+
+    def __init__(self, ratio=3.0, smoothing=0.1):
+        self.ratio = ratio
+        self.smoothing = smoothing
+        self.echo_rms = None
+        self._blocks = 0
+
+    def passes(self, pcm):
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples))) if len(samples) else 0.0
+        if self._blocks >= self.WARMUP_BLOCKS and rms > self.ratio * self.echo_rms:
+            return True
+        self._blocks += 1
+        self.echo_rms = rms if self.echo_rms is None else self.echo_rms + self.smoothing * (rms - self.echo_rms)
+        return False
+
+
+class CaptureService:
+    """Owns the audio input and the thread that keeps the ring buffer filled."""
+
+    def __init__(self, samplerate=SAMPLE_RATE, blocksize=CAPTURE_BLOCKSIZE, ring_seconds=RING_SECONDS, device=None,
+                 audio_input=None, gating=GATING_OFF, playback_tail_ms=300, echo_suppressor=None):
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.audio_input = audio_input or MicrophoneInput(device=device, samplerate=samplerate)
+        self.ring = RingBuffer(samplerate * ring_seconds)
+        self.gating = gating
+        self.playback_tail = int(samplerate * playback_tail_ms / 1000)
+        self.echo_suppressor = echo_suppressor
+        self._consumed_pos = 0
+        self._playback_depth = 0
+        self._playback_intervals = deque(maxlen=64)  # [start, end) ring positions, end None while playing
+        self._playback_lock = threading.Lock()
+        self._running = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._running.is_set()
+
+    @property
+    def ended(self):
+        """True once a finite input (file, stdin) has delivered all of its audio."""
+        return self.ring.closed
+
+    def start(self):
+        if self.running:
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="jarvis-capture", daemon=True)
+        self._thread.start()
+        logger.info(f"🎙️ Capture service started ({self.audio_input.name})")
+
+    def stop(self):
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        while self.running:
+            try:
+                for data in self.audio_input.blocks(self.blocksize):
+                    self.ring.write(self._gate(data))
+                    if not self.running:
+                        return
+            except Exception as e:
+                logger.error(f"Audio capture from {self.audio_input.name} failed: {e}")
+                time.sleep(1)
+                continue
+            if self.audio_input.finite:
+                logger.info(f"🎙️ Audio input {self.audio_input.name} ended")
+                self.ring.close()
+                return
+
+    @contextlib.contextmanager
+    def playback(self):
+        """Mark the assistant as talking for the duration of the block (reentrant)."""
+        with self._playback_lock:
+            self._playback_depth += 1
+            if self._playback_depth == 1:
+                self._playback_intervals.append([self.ring.write_pos, None])
+        try:
+            yield
+        finally:
+            with self._playback_lock:
+                self._playback_depth -= 1
+                if self._playback_depth == 0:
+                    # The room keeps ringing for a moment after the player exits
+                    self._playback_intervals[-1][1] = self.ring.write_pos + self.playback_tail
+
+    def in_playback(self, position):
+        with self._playback_lock:
+            return any(start <= position and (end is None or position < end)
+                       for start, end in self._playback_intervals)
+
+    def playback_fraction(self, start, end):
+        """Fraction of the ring positions [start, end) captured while the assistant was talking."""
+        if end <= start:
+            return 0.0
+        with self._playback_lock:
+            overlap = sum(max(0, min(end, self.ring.write_pos if p_end is None else p_end) - max(start, p_start))
+                          for p_start, p_end in self._playback_intervals)
+        return min(overlap / (end - start), 1.0)
+
+    def _gate(self, data):
+        if self.gating != GATING_SUPPRESS or not self.in_playback(self.ring.write_pos):
+            return data
+        if self.echo_suppressor is not None and self.echo_suppressor.passes(data):
+            return data
+        return bytes(len(data))
+
+    def cursor(self, preroll_ms=DEFAULT_PREROLL_MS):
+        """
+        Open a cursor `preroll_ms` in the past, but never before audio an earlier
+        cursor already consumed.
+        """
+        preroll = int(self.samplerate * preroll_ms / 1000)
+        position = max(self.ring.write_pos - preroll, self._consumed_pos, self.ring.oldest_pos)
+        return CaptureCursor(self, position)
+
+    def mark_consumed(self, position):
+        self._consumed_pos = max(self._consumed_pos, position)
+
+
+_service = None
+_service_lock = threading.Lock()
+_audio_input = None
+
+
+def set_audio_input(audio_input):
+    """Choose the input (see asr.sources) for the capture service; call before first use."""
+    global _audio_input
+    with _service_lock:
+        if _service is not None:
+            raise RuntimeError("The capture service is already running")
+        _audio_input = audio_input
+
+
+def get_capture_service():
+    """Return the process-wide capture service, starting it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            echo_suppressor = EchoSuppressor(settings.ECHO_SUPPRESSION_RATIO) if settings.ECHO_SUPPRESSION else None
+            _service = CaptureService(audio_input=_audio_input, gating=settings.PLAYBACK_GATING,
+                                      playback_tail_ms=settings.PLAYBACK_TAIL_MS, echo_suppressor=echo_suppressor)
+            atexit.register(_service.stop)
+        _service.start()
+        return _service
+
+
+def playback():
+    """
+    Context manager for TTS playback. Gates the running capture service; does
+    nothing (and does not open the microphone) if capture has not started.
+    """
+    service = _service
+    return service.playback() if service is not None else contextlib.nullcontext()
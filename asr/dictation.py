@@ -0,0 +1,165 @@
+"""
+Long-form dictation for notes and email bodies.
+
+listen() captures a single utterance and transcribes it at the end. Dictation
+keeps capturing until the user says a stop phrase or pauses for
+DICTATION_PAUSE_SECONDS, a silence right after the prompt included. Every
+VAD-delimited chunk is handed to a background thread as soon as it ends,
+transcribed there while the user keeps talking and passed to `on_text` in
+order, so the caller can append it to the note right away. Only the chunk
+being captured is held in memory, and at the end only the last chunk is left
+to transcribe, however long the user talked.
+"""
+import json
+import time
+import queue
+import string
+import logging
+import threading
+
+from asr import settings
+from asr.audio import SAMPLE_RATE, SAMPLE_WIDTH, pcm16_to_float32
+from asr.model_registry import registry
+from asr.pipeline import READ_BLOCK
+from asr.vad import Endpointer
+
+logger = logging.getLogger("ASRDictation")
+
+PROMPT_WORDS = 30  # previous words passed to the backend as context for the next chunk
+
+
+def _words(text):
+    return text.lower().translate(str.maketrans("", "", string.punctuation.replace("'", ""))).split()
+
+
+def find_stop_phrase(words, stop_phrases):
+    """Index in `words` where a trailing stop phrase starts, or None."""
+    spoken = [word.lower() for word in words]
+    for phrase in stop_phrases:
+        phrase_words = _words(phrase)
+        if phrase_words and spoken[-len(phrase_words):] == phrase_words:
+            return len(spoken) - len(phrase_words)
+    return None
+
+
+class _ChunkTranscriber:
+    """Transcribes chunks in arrival order on one background thread."""
+
+    def __init__(self, backend, language, on_text):
+        self.backend = backend
+        self.language = language
+        self.on_text = on_text
+        self.texts = []
+        self.seconds = 0.0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="jarvis-dictation", daemon=True)
+        self._thread.start()
+
+    def submit(self, pcm=None, text=None):
+        self._queue.put((pcm, text))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            pcm, text = item
+            if text is None:
+                start = time.perf_counter()
+                prompt = " ".join(" ".join(self.texts).split()[-PROMPT_WORDS:]) or None
+                words = self.backend.transcribe_words(pcm16_to_float32(pcm), language=self.language, prompt=prompt)
+                text = " ".join(word for word, _, _ in words).strip()
+                self.seconds += time.perf_counter() - start
+            if text:
+                self.texts.append(text)
+                logger.info(f"🖊️ Dictated: {text}")
+                if self.on_text is not None:
+                    self.on_text(text)
+
+    def finish(self):
+        self._queue.put(None)
+        self._thread.join()
+        return " ".join(self.texts).strip()
+
+
+def dictate(source, model="tiny", language="en", on_text=None, stop_phrases=None, pause_seconds=None,
+            max_chunk_seconds=None, backend=None):
+    """
+    Capture dictation from `source` until a stop phrase, a long pause or the
+    end of the source. Returns a dict with the full `text`, the `stop` reason
+    and `timings`, or None if nothing was said.
+
+    Vosk listens along to spot the stop phrase; when a chunk ends with it, the
+    audio from the first word of the phrase on is cut before transcription.
+    """
+    stop_phrases = settings.DICTATION_STOP_PHRASES if stop_phrases is None else stop_phrases
+    pause_samples = int((pause_seconds or settings.DICTATION_PAUSE_SECONDS) * SAMPLE_RATE)
+    max_chunk_bytes = int((max_chunk_seconds or settings.DICTATION_MAX_CHUNK_SECONDS) * SAMPLE_RATE) * SAMPLE_WIDTH
+
+    backend = registry.backend(model, name=backend)
+    vosk_recognizer = registry.vosk_recognizer(language)
+    endpointer = Endpointer(aggressiveness=settings.VAD_AGGRESSIVENESS, hangover_ms=settings.VAD_HANGOVER_MS,
+                            padding_ms=settings.VAD_PADDING_MS)
+    transcriber = _ChunkTranscriber(backend, language, on_text)
+    chunk = bytearray()
+    consumed, silence, chunks = 0, 0, 0
+    stop = None
+
+    while stop is None:
+        data = source.read(READ_BLOCK)
+        exhausted = not data
+        consumed += len(data) // SAMPLE_WIDTH
+        speech = endpointer.feed(data)
+        if not endpointer.triggered:
+            silence += len(data) // SAMPLE_WIDTH
+            if exhausted:
+                stop = "end of input"
+            elif silence >= pause_samples:
+                # Also ends a dictation the user never starts after the prompt
+                stop = "pause"
+            continue
+        silence = 0
+        chunk += speech
+        if speech:
+            vosk_recognizer.AcceptWaveform(speech)
+        if not (endpointer.ended or exhausted or len(chunk) >= max_chunk_bytes):
+            continue
+
+        # A chunk is complete: VAD pause, end of input, or too long to hold back
+        words = json.loads(vosk_recognizer.FinalResult()).get("result", [])
+        # Fresh recognizer per chunk so word times are relative to the chunk
+        vosk_recognizer = registry.vosk_recognizer(language)
+        cut = find_stop_phrase([word["word"] for word in words], stop_phrases)
+        audio = bytes(endpointer.utterance() if endpointer.ended else chunk)
+        if cut is not None:
+            stop = "stop phrase"
+            keep = int(max(words[cut]["start"] - 0.1, 0) * SAMPLE_RATE) * SAMPLE_WIDTH if cut else 0
+            audio = audio[:keep]
+        elif exhausted:
+            stop = "end of input"
+
+        if audio and endpointer.has_speech:
+            chunks += 1
+            if backend.refines:
+                transcriber.submit(pcm=audio)
+            else:
+                transcriber.submit(text=" ".join(word["word"] for word in words[:cut]))
+        chunk = bytearray()
+        endpointer.reset()
+
+    end_time = time.perf_counter()
+    text = transcriber.finish()
+    logger.info(f"🖊️ Dictation finished ({stop}): {len(text.split())} words")
+    if not text:
+        return None
+    return {
+        "text": text,
+        "stop": stop,
+        "chunks": chunks,
+        "timings": {
+            "consumed_seconds": consumed / SAMPLE_RATE,
+            "whisper_seconds": transcriber.seconds,
+            # Wait after the user stopped: only the last chunk is still being transcribed
+            "eos_latency_seconds": time.perf_counter() - end_time,
+        },
+    }
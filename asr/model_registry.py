@@ -0,0 +1,196 @@
+"""
+Process-wide registry for speech recognition models.
+
+Loading Vosk and Whisper weights costs seconds of disk I/O and deserialization,
+so every (backend, size, language) combination is loaded once per process and
+shared by all callers of utils.listen(). Recognizer instances are cheap and are
+handed out fresh on every request. The second-pass backend comes from
+asr.backends, selected by ASR_BACKEND.
+
+Models for other languages are loaded the first time that language is heard.
+With ASR_MODEL_MEMORY_BUDGET_MB set, the least recently used models are
+dropped once the loaded models together exceed the budget, so a multilingual
+household only keeps the languages it is actually speaking resident.
+"""
+import os
+import gc
+import json
+import time
+import threading
+import logging
+from collections import OrderedDict
+
+import psutil
+from vosk import Model, KaldiRecognizer
+
+from asr import settings
+from asr.backends import BACKENDS, FasterWhisperBackend, VoskBackend
+
+logger = logging.getLogger("ASRModels")
+
+# Vosk model locations per language; add languages with VOSK_MODEL_PATHS in config.py
+VOSK_MODEL_PATH = settings.setting("VOSK_MODEL_PATH", os.path.join(os.path.expanduser("~"), "Downloads",
+                                                                   "vosk-model-small-en-us-0.15"))
+VOSK_MODEL_PATHS = {
+    "en": VOSK_MODEL_PATH,
+    #"en": "/home/khagendra/Downloads/vosk-model-small-en-in-0.4"
+    **settings.setting("VOSK_MODEL_PATHS", {}),
+}
+
+# Second-pass checkpoints are multilingual, one copy serves every language
+ANY_LANGUAGE = "*"
+
+
+class ModelRegistry:
+    """
+    Loads each ASR model once and keeps it resident until it is evicted to
+    stay within `memory_budget_bytes` (0 keeps everything).
+    """
+
+    def __init__(self, memory_budget_bytes=0):
+        self.memory_budget_bytes = memory_budget_bytes
+        self._models = OrderedDict()  # least recently used first
+        self._stats = {}
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def _lookup(self, key):
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+            return model
+
+    def _get_or_load(self, key, loader):
+        model = self._lookup(key)
+        if model is not None:
+            return model
+
+        # One lock per key so a slow Whisper load never blocks a Vosk lookup
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            model = self._lookup(key)
+            if model is not None:
+                return model
+
+            backend, size, language = key
+            logger.info(f"🔁 Loading {backend} model ({size}, {language})...")
+            process = psutil.Process()
+            rss_before = process.memory_info().rss
+            start = time.perf_counter()
+            model = loader()
+            load_seconds = time.perf_counter() - start
+            rss_delta = max(process.memory_info().rss - rss_before, 0)
+
+            self._stats[key] = {
+                "backend": backend,
+                "size": size,
+                "language": language,
+                "load_seconds": round(load_seconds, 3),
+                "rss_bytes": rss_delta,
+                "resident": True,
+            }
+            with self._lock:
+                self._models[key] = model
+            logger.info(f"✅ Loaded {backend} ({size}, {language}) in {load_seconds:.2f}s, "
+                        f"+{rss_delta / (1024 * 1024):.1f} MB resident")
+            self._enforce_budget(keep=key)
+            return model
+
+    def resident_bytes(self):
+        """Memory attributed to the models currently loaded, measured when each was loaded."""
+        with self._lock:
+            return sum(self._stats[key]["rss_bytes"] for key in self._models)
+
+    def _enforce_budget(self, keep):
+        # Process RSS includes far more than the models and is slow to shrink
+        # after a free, so the budget is checked against the per-model sizes
+        if not self.memory_budget_bytes:
+            return
+        evicted = []
+        with self._lock:
+            resident = sum(self._stats[key]["rss_bytes"] for key in self._models)
+            for key in list(self._models):
+                if resident <= self.memory_budget_bytes:
+                    break
+                if key == keep:
+                    continue
+                # Callers still holding the model keep it alive until they finish
+                del self._models[key]
+                self._stats[key]["resident"] = False
+                resident -= self._stats[key]["rss_bytes"]
+                self._evictions += 1
+                evicted.append(key)
+        if evicted:
+            gc.collect()
+            for backend, size, language in evicted:
+                logger.info(f"♻️ Evicted {backend} ({size}, {language}) to stay within the ASR memory budget")
+
+    def vosk_model(self, language="en"):
+        """Returns the shared Vosk model for a language, loading it on first use."""
+        if language not in VOSK_MODEL_PATHS:
+            raise ValueError(f"No Vosk model path configured for language: {language}")
+        path = VOSK_MODEL_PATHS[language]
+        return self._get_or_load(("vosk", os.path.basename(path), language), lambda: Model(path))
+
+    def vosk_recognizer(self, language="en", samplerate=16000, words=True, grammar=None):
+        """
+        Returns a fresh KaldiRecognizer bound to the shared Vosk model. `grammar`
+        is an optional list of phrases that restricts what can be recognized.
+        """
+        model = self.vosk_model(language)
+        if grammar is not None:
+            recognizer = KaldiRecognizer(model, samplerate, json.dumps(grammar))
+        else:
+            recognizer = KaldiRecognizer(model, samplerate)
+        recognizer.SetWords(words)
+        return recognizer
+
+    def new_backend(self, size="tiny", name=None):
+        """Creates an uncached backend instance, e.g. for calibration runs."""
+        name = name or settings.ASR_BACKEND
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown ASR backend: {name} (choose from {', '.join(BACKENDS)})")
+
+        if name == VoskBackend.name:
+            return VoskBackend(recognizer_factory=self.vosk_recognizer)
+        if name == FasterWhisperBackend.name:
+            return FasterWhisperBackend(size, compute_type=settings.FASTER_WHISPER_COMPUTE_TYPE,
+                                        cpu_threads=settings.ASR_CPU_THREADS)
+        return BACKENDS[name](size)
+
+    def backend(self, size="tiny", name=None):
+        """
+        Returns the shared second-pass backend (ASR_BACKEND unless `name` is
+        given) of the given model size, loading it on first use.
+        """
+        name = name or settings.ASR_BACKEND
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown ASR backend: {name} (choose from {', '.join(BACKENDS)})")
+        return self._get_or_load((name, size, ANY_LANGUAGE), lambda: self.new_backend(size, name))
+
+    def preload(self, size="tiny", language="en"):
+        """
+        Loads the models listen() needs so the first turn starts capturing
+        immediately. `size` may also be a list of sizes to load.
+        """
+        self.vosk_model(language)
+        for model_size in ([size] if isinstance(size, str) else size):
+            self.backend(model_size)
+        return self.stats()
+
+    def stats(self):
+        """Returns load time and resident memory for every loaded model."""
+        return {
+            "models": list(self._stats.values()),
+            "resident_model_bytes": self.resident_bytes(),
+            "memory_budget_bytes": self.memory_budget_bytes,
+            "evictions": self._evictions,
+            "process_rss_bytes": psutil.Process().memory_info().rss,
+        }
+
+
+registry = ModelRegistry(memory_budget_bytes=settings.ASR_MODEL_MEMORY_BUDGET_MB * 1024 * 1024)
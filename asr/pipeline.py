@@ -0,0 +1,160 @@
+"""
+The Vosk -> Whisper recognition path behind utils.listen().
+
+The second pass runs on the backend selected by ASR_BACKEND (asr/backends.py).
+
+recognize_utterance() pulls PCM from any audio source with a CaptureCursor
+style read(frames) method, so the live microphone and offline tools such as
+the benchmark harness exercise exactly the same code.
+"""
+import json
+import time
+import logging
+
+from asr.audio import SAMPLE_WIDTH, SAMPLE_RATE, pcm16_to_float32, duration_seconds
+from asr.model_registry import registry
+from asr.vad import Endpointer, FRAME_MS
+from asr.routing import ROUTE_AUTO, ROUTE_WHISPER, word_confidence, vosk_is_enough
+from asr.streaming import StreamingTranscriber
+from asr import settings
+
+logger = logging.getLogger("ASRPipeline")
+
+READ_BLOCK = 1600  # frames pulled from the source per step (100 ms)
+
+
+def recognize_utterance(source, model="tiny", language="en", route=ROUTE_WHISPER, detect=None,
+                        on_hypothesis=None, on_partial=None, backend=None, stream=False, keep_audio=False):
+    """
+    Recognize the next utterance from `source`.
+
+    Returns a dict with the final `text`, the `vosk_text` and `whisper_text`
+    (second-pass backend) hypotheses, the `engine` that produced the text, the Vosk word
+    `confidence` and per-stage `timings`, or None if the source ran out (read
+    returned b"") before any speech was heard. `detect` is the intent detector
+    used by ROUTE_AUTO; `on_hypothesis` is called with the Vosk text just
+    before Whisper starts and `on_partial` with every Vosk partial result.
+    `backend` overrides ASR_BACKEND for this call. With `stream`, long
+    utterances are transcribed incrementally while the user is still talking.
+    With `keep_audio`, the trimmed speech is returned as `audio` (int16 PCM).
+    """
+    vosk_recognizer = registry.vosk_recognizer(language)
+    backend = registry.backend(model, name=backend)
+    streamer = None
+
+    # VAD decides where speech starts and ends; silence never reaches a recognizer
+    endpointer = Endpointer(aggressiveness=settings.VAD_AGGRESSIVENESS, hangover_ms=settings.VAD_HANGOVER_MS,
+                            padding_ms=settings.VAD_PADDING_MS)
+    consumed = 0
+    vosk_seconds = 0.0
+
+    while True:
+        data = source.read(READ_BLOCK)
+        exhausted = not data
+        consumed += len(data) // SAMPLE_WIDTH
+        speech = endpointer.feed(data)
+        if exhausted and not endpointer.triggered:
+            return None
+        if not speech and not endpointer.ended and not exhausted:
+            continue
+
+        if stream and backend.refines and speech:
+            if streamer is None:
+                streamer = _new_streamer(backend, language)
+            streamer.feed(speech)
+
+        start = time.perf_counter()
+        vosk_final = bool(speech) and vosk_recognizer.AcceptWaveform(speech)
+        done = endpointer.ended or exhausted
+        if not (vosk_final or done):
+            partial_text = json.loads(vosk_recognizer.PartialResult()).get("partial", "").strip()
+            vosk_seconds += time.perf_counter() - start
+            if partial_text:
+                logger.info(f"📝 Vosk Partial: {partial_text}")
+                if on_partial is not None:
+                    on_partial(partial_text)
+            continue
+
+        result = json.loads(vosk_recognizer.FinalResult() if done else vosk_recognizer.Result())
+        vosk_seconds += time.perf_counter() - start
+        final_text = result.get("text", "").strip()
+        if done and (not final_text or not endpointer.has_speech):
+            if streamer is not None:
+                streamer.cancel()
+                streamer = None
+            if exhausted:
+                return None
+            # Noise or a cough, not an utterance: start over
+            endpointer.reset()
+            vosk_recognizer.Reset()
+            continue
+        if not final_text:
+            continue
+        break
+
+    # From here on the user has stopped talking and is waiting for the answer
+    endpoint_time = time.perf_counter()
+    logger.info(f"\n✅ Vosk Final: {final_text}")
+    confidence = word_confidence(result)
+    audio = endpointer.utterance()
+    utterance = {
+        "text": final_text,
+        "vosk_text": final_text,
+        "whisper_text": None,
+        "engine": "vosk",
+        "confidence": confidence,
+        "timings": {
+            "consumed_seconds": consumed / SAMPLE_RATE,
+            "audio_seconds": duration_seconds(audio),
+            "vosk_seconds": vosk_seconds,
+            "whisper_seconds": 0.0,
+            # Audio the endpointer waited through after the last voiced frame
+            "endpoint_wait_seconds": endpointer.trailing_silence_frames * FRAME_MS / 1000,
+        },
+    }
+    if keep_audio:
+        utterance["audio"] = audio
+
+    if not backend.refines:
+        # Vosk-only backend: the first pass is the final text
+        return _finish(utterance, endpoint_time)
+
+    if route == ROUTE_AUTO and detect is not None:
+        accepted, intent, intent_score = vosk_is_enough(
+            final_text, confidence, detect,
+            min_confidence=settings.FAST_PATH_MIN_CONFIDENCE,
+            max_words=settings.FAST_PATH_MAX_WORDS,
+            min_intent_score=settings.FAST_PATH_MIN_INTENT_SCORE)
+        if accepted:
+            logger.info(f"⚡ Vosk fast path ({confidence:.2f}, {intent}): skipping {backend.name}\n")
+            if streamer is not None:
+                streamer.cancel()
+            return _finish(utterance, endpoint_time)
+
+    if on_hypothesis is not None:
+        on_hypothesis(final_text)
+
+    logger.info(f"🧠 Passing to {backend.name} for better transcription...")
+    start = time.perf_counter()
+    if streamer is not None:
+        # Most of the utterance is already committed; only the tail is decoded now
+        whisper_text = streamer.finish()
+    else:
+        # Hand the backend only the trimmed speech: no temp WAV, no ffmpeg decode
+        whisper_text = backend.transcribe(pcm16_to_float32(audio), language=language)
+    utterance["timings"]["whisper_seconds"] = time.perf_counter() - start
+    logger.info(f"🔍 {backend.name}: {whisper_text}\n")
+
+    utterance.update(text=whisper_text, whisper_text=whisper_text, engine=backend.name)
+    return _finish(utterance, endpoint_time)
+
+
+def _new_streamer(backend, language):
+    return StreamingTranscriber(backend, language, step_seconds=settings.STREAMING_STEP_SECONDS,
+                                min_seconds=settings.STREAMING_MIN_SECONDS)
+
+
+def _finish(utterance, endpoint_time):
+    timings = utterance["timings"]
+    timings["eos_latency_seconds"] = timings["endpoint_wait_seconds"] + time.perf_counter() - endpoint_time
+    return utterance
@@ -0,0 +1,34 @@
+"""
+Decides whether an utterance needs Whisper or whether Vosk's text is enough.
+
+Vosk reports a confidence for every word when SetWords(True) is on. Short
+commands that Vosk heard clearly and that match a known intent are returned
+straight away; everything else (questions, dictation, low-confidence audio)
+is refined by Whisper as before.
+"""
+
+ROUTE_WHISPER = "whisper"   # always refine with Whisper (free-form answers)
+ROUTE_AUTO = "auto"         # Vosk alone for short, clear, known commands
+
+
+def word_confidence(vosk_result):
+    """Confidence of the weakest word in a Vosk result, 0.0 if there are no words."""
+    words = vosk_result.get("result") or []
+    if not words:
+        return 0.0
+    return min(float(word.get("conf", 0.0)) for word in words)
+
+
+def vosk_is_enough(text, confidence, detect, min_confidence=0.85, max_words=6, min_intent_score=0.7):
+    """
+    Returns (accepted, intent, intent_score) for a Vosk transcription.
+
+    `detect` is an intent detector with the signature of detect_intent(); it is
+    only called when the cheap checks on length and confidence pass.
+    """
+    if not text or confidence < min_confidence or len(text.split()) > max_words:
+        return False, None, 0.0
+    intent, intent_score = detect(text.lower())
+    if intent is None or intent_score < min_intent_score:
+        return False, intent, intent_score
+    return True, intent, intent_score
@@ -0,0 +1,80 @@
+"""
+Tunable settings for the speech pipeline.
+
+Every value can be overridden by defining the same name in config.py. Tools
+such as the benchmark harness run without a personal config.py, in which case
+the defaults below apply.
+"""
+import os
+
+try:
+    import config
+except ImportError:
+    config = None
+
+
+def setting(name, default):
+    return getattr(config, name, default)
+
+
+def _reply_turn(table):
+    # The "reply" turn type used to be called "wake"; accept configs that still say so
+    table = dict(table)
+    if "wake" in table:
+        table.setdefault("reply", table.pop("wake"))
+    return table
+
+
+# Speech endpointing
+VAD_AGGRESSIVENESS = setting("VAD_AGGRESSIVENESS", 2)  # 0 = permissive .. 3 = strict
+VAD_HANGOVER_MS = setting("VAD_HANGOVER_MS", 600)      # silence that ends an utterance
+VAD_PADDING_MS = setting("VAD_PADDING_MS", 300)        # silence kept around speech for Whisper
+
+# What the microphone hears while the assistant is talking: "suppress" replaces it
+# with silence, "tag" keeps it but drops utterances spoken mostly over playback, "off"
+PLAYBACK_GATING = setting("PLAYBACK_GATING", "suppress")
+PLAYBACK_TAIL_MS = setting("PLAYBACK_TAIL_MS", 300)         # room echo after the player exits
+ECHO_SUPPRESSION = setting("ECHO_SUPPRESSION", False)       # with "suppress": let speech louder than the echo through
+ECHO_SUPPRESSION_RATIO = setting("ECHO_SUPPRESSION_RATIO", 3.0)
+
+# Vosk-only fast path for short commands
+FAST_PATH_MIN_CONFIDENCE = setting("FAST_PATH_MIN_CONFIDENCE", 0.85)
+FAST_PATH_MIN_INTENT_SCORE = setting("FAST_PATH_MIN_INTENT_SCORE", 0.7)
+FAST_PATH_MAX_WORDS = setting("FAST_PATH_MAX_WORDS", 6)
+
+# Classify the Vosk hypothesis while Whisper is still running
+SPECULATIVE_INTENT = setting("SPECULATIVE_INTENT", True)
+
+# Second-pass recognizer: "whisper", "faster-whisper" or "vosk" (see asr/backends.py)
+ASR_BACKEND = setting("ASR_BACKEND", "whisper")
+FASTER_WHISPER_COMPUTE_TYPE = setting("FASTER_WHISPER_COMPUTE_TYPE", "int8")
+ASR_CPU_THREADS = setting("ASR_CPU_THREADS", 0)  # 0 lets the backend decide
+
+# Whisper size: "auto" picks per turn type from a one-off CPU calibration (asr/calibration.py)
+ASR_MODEL_SIZE = setting("ASR_MODEL_SIZE", "auto")
+ASR_CALIBRATION_SIZES = setting("ASR_CALIBRATION_SIZES", ("tiny", "base", "small", "medium"))
+ASR_CALIBRATION_CLIP = setting("ASR_CALIBRATION_CLIP", None)  # WAV to time; default is synthesized with Piper
+# Allowed end-of-speech latency (seconds) and audio the backend still decodes at that point, per turn type
+ASR_LATENCY_BUDGETS = _reply_turn(setting("ASR_LATENCY_BUDGETS", {"command": 1.0, "dictation": 1.5, "reply": 0.5}))
+ASR_TURN_SECONDS = _reply_turn(setting("ASR_TURN_SECONDS", {"command": 3.0, "dictation": 4.0, "reply": 1.5}))
+ASR_CACHE_DIR = setting("ASR_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "jarvis"))
+
+# Upper bound for loaded ASR models; least recently used languages are unloaded first
+ASR_MODEL_MEMORY_BUDGET_MB = setting("ASR_MODEL_MEMORY_BUDGET_MB", 0)  # 0 = no limit
+
+# Streaming transcription of long utterances (listen(..., stream=True))
+STREAMING_STEP_SECONDS = setting("STREAMING_STEP_SECONDS", 1.0)  # re-decode after this much new speech
+STREAMING_MIN_SECONDS = setting("STREAMING_MIN_SECONDS", 3.0)    # shorter utterances decode once at the end
+
+# Long-form dictation for notes and email bodies (asr/dictation.py)
+DICTATION_STOP_PHRASES = setting("DICTATION_STOP_PHRASES", ("stop dictation", "end of note", "end of message"))
+DICTATION_PAUSE_SECONDS = setting("DICTATION_PAUSE_SECONDS", 5.0)        # silence that ends dictation
+DICTATION_MAX_CHUNK_SECONDS = setting("DICTATION_MAX_CHUNK_SECONDS", 20.0)  # split chunks without a pause
+
+# Opt-in archive of recognized utterances (asr/archive.py); None disables it
+ASR_ARCHIVE_DIR = setting("ASR_ARCHIVE_DIR", None)
+ASR_ARCHIVE_MAX_MB = setting("ASR_ARCHIVE_MAX_MB", 200)
+ASR_ARCHIVE_FORMAT = setting("ASR_ARCHIVE_FORMAT", "flac")  # "flac" or "opus"
+
+# Decode in a separate worker process (asr/worker.py) instead of in the assistant's process
+ASR_WORKER_PROCESS = setting("ASR_WORKER_PROCESS", True)
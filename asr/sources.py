@@ -0,0 +1,207 @@
+"""
+Audio sources that can stand in for the live microphone.
+
+Sources implement the CaptureCursor interface used by
+asr.pipeline.recognize_utterance(): read(frames) returns exactly `frames`
+frames of 16 kHz mono int16 PCM, fewer at the end of the stream, and b"" once
+the stream is exhausted.
+
+Inputs feed the always-on capture service (asr.capture) instead, so the whole
+assistant runs unchanged on them: blocks(blocksize) yields PCM blocks and
+`finite` says whether the input can run out. Everything except the
+microphone is paced to `speed` times real time, because the capture ring
+behaves like a live microphone and drops audio nobody read in time.
+
+    mic            default input device (sounddevice)
+    wav:PATH       a recorded session (WAV, or FLAC/Opus such as archived utterances)
+    stdin          raw 16 kHz mono s16le PCM, e.g. `arecord -f S16_LE -r 16000 -c 1 -t raw`
+    unix:PATH      raw PCM from clients connecting to a UNIX socket, one at a time
+"""
+import os
+import sys
+import time
+import socket
+import logging
+
+from asr.audio import SAMPLE_RATE, SAMPLE_WIDTH, load_audio, duration_seconds
+
+logger = logging.getLogger("ASRSources")
+
+
+class WavFileSource:
+    """
+    Replays a WAV file (or any file ffmpeg can decode, such as the FLAC/Opus
+    files of the utterance archive) as if it were being spoken into the
+    microphone.
+
+    `tail_silence_ms` of silence is appended so the endpointer can close the
+    last utterance the same way it does live. With `realtime` the file is
+    delivered at 1x speed instead of as fast as the pipeline can consume it.
+    """
+
+    def __init__(self, path, realtime=False, tail_silence_ms=1000):
+        self.path = path
+        self.realtime = realtime
+        self.pcm = load_audio(path) + b"\x00" * (SAMPLE_WIDTH * SAMPLE_RATE * tail_silence_ms // 1000)
+        self.position = 0
+        self._started = None
+
+    @property
+    def duration_seconds(self):
+        return duration_seconds(self.pcm)
+
+    def read(self, frames, timeout=None):
+        start = self.position * SAMPLE_WIDTH
+        chunk = self.pcm[start:start + frames * SAMPLE_WIDTH]
+        self.position += len(chunk) // SAMPLE_WIDTH
+        if self.realtime and chunk:
+            if self._started is None:
+                self._started = time.monotonic()
+            delay = self._started + self.position / SAMPLE_RATE - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return chunk
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Pacer:
+    """Sleeps so samples are delivered at `speed` times real time (0 = unpaced)."""
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self._started = None
+        self._samples = 0
+
+    def wait(self, pcm):
+        if not self.speed:
+            return
+        if self._started is None:
+            self._started = time.monotonic()
+        self._samples += len(pcm) // SAMPLE_WIDTH
+        delay = self._started + self._samples / SAMPLE_RATE / self.speed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _read_blocks(stream, blocksize, pacer):
+    size = blocksize * SAMPLE_WIDTH
+    while True:
+        data = stream.read(size)
+        if not data:
+            return
+        data = data[:len(data) - len(data) % SAMPLE_WIDTH]
+        pacer.wait(data)
+        yield data
+
+
+class MicrophoneInput:
+    """The default (or given) input device."""
+
+    finite = False
+
+    def __init__(self, device=None, samplerate=SAMPLE_RATE):
+        self.device = device
+        self.samplerate = samplerate
+        self.name = "microphone" if device is None else f"microphone {device}"
+
+    def blocks(self, blocksize):
+        # Imported here so machines without PortAudio can still use the other inputs
+        import sounddevice as sd
+
+        with sd.RawInputStream(samplerate=self.samplerate, blocksize=blocksize, dtype='int16',
+                               channels=1, device=self.device) as stream:
+            while True:
+                data, overflowed = stream.read(blocksize)
+                if overflowed:
+                    logger.warning("⚠️ Input overflow, some audio was dropped")
+                yield data
+
+
+class WavFileInput:
+    """A recorded session replayed into the capture service."""
+
+    finite = True
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.name = f"wav:{path}"
+
+    def blocks(self, blocksize):
+        pcm = load_audio(self.path)
+        pacer = _Pacer(self.speed)
+        size = blocksize * SAMPLE_WIDTH
+        for start in range(0, len(pcm), size):
+            block = pcm[start:start + size]
+            pacer.wait(block)
+            yield block
+
+
+class RawPCMInput:
+    """Raw 16 kHz mono s16le PCM from a binary stream, stdin by default."""
+
+    finite = True
+
+    def __init__(self, stream=None, speed=1.0):
+        self.stream = stream if stream is not None else sys.stdin.buffer
+        self.speed = speed
+        self.name = "stdin" if stream is None else "raw PCM stream"
+
+    def blocks(self, blocksize):
+        yield from _read_blocks(self.stream, blocksize, _Pacer(self.speed))
+
+
+class UnixSocketInput:
+    """
+    Listens on a UNIX socket and reads raw PCM from one client at a time. When
+    a client disconnects the next one is accepted, so sessions can be fed in
+    one after another without restarting the assistant.
+    """
+
+    finite = False
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.name = f"unix:{path}"
+
+    def blocks(self, blocksize):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.path)
+            server.listen(1)
+            logger.info(f"🔌 Waiting for audio on {self.path}")
+            while True:
+                conn, _ = server.accept()
+                logger.info(f"🔌 Audio client connected on {self.path}")
+                with conn, conn.makefile("rb") as stream:
+                    yield from _read_blocks(stream, blocksize, _Pacer(self.speed))
+                logger.info(f"🔌 Audio client disconnected from {self.path}")
+        finally:
+            server.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+def open_audio_input(spec="mic", device=None, speed=1.0):
+    """Build an input from a command-line spec: mic, wav:PATH, stdin or unix:PATH."""
+    kind, _, target = spec.partition(":")
+    if kind == "mic":
+        return MicrophoneInput(device=device)
+    if kind == "stdin":
+        return RawPCMInput(speed=speed)
+    if kind == "wav" and target:
+        return WavFileInput(target, speed=speed)
+    if kind == "unix" and target:
+        return UnixSocketInput(target, speed=speed)
+    raise ValueError(f"Unknown audio source: {spec} (use mic, wav:PATH, stdin or unix:PATH)")
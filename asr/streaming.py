@@ -0,0 +1,121 @@
+"""
+Streaming second-pass transcription with local-agreement commit.
+
+Normally the backend only starts once the utterance has ended, so a long
+dictation pays its whole transcription cost after the user stops talking.
+StreamingTranscriber instead re-decodes the not-yet-committed audio window on
+a worker thread while speech is still arriving. Words on which two consecutive
+hypotheses agree are committed and the audio behind them is dropped from the
+window, so at end-of-speech only the short uncommitted tail is left to decode.
+"""
+import string
+import threading
+import logging
+
+from asr.audio import SAMPLE_RATE, SAMPLE_WIDTH, pcm16_to_float32
+
+logger = logging.getLogger("ASRStreaming")
+
+PROMPT_WORDS = 30  # committed words passed back as context for the next window
+
+
+def _norm(word):
+    return word.lower().strip(string.punctuation + " ")
+
+
+def agreed_prefix(previous, current):
+    """Number of leading words two hypotheses agree on, ignoring case and punctuation."""
+    count = 0
+    for (prev_word, _, _), (word, _, _) in zip(previous, current):
+        if _norm(prev_word) != _norm(word):
+            break
+        count += 1
+    return count
+
+
+class StreamingTranscriber:
+    """
+    Incrementally transcribes one utterance with a backend's transcribe_words().
+
+    Decoding only starts once `min_seconds` of speech has arrived, so short
+    commands cost a single decode exactly like the non-streaming path.
+    """
+
+    def __init__(self, backend, language="en", step_seconds=1.0, min_seconds=3.0, max_window_seconds=20.0):
+        self.backend = backend
+        self.language = language
+        self.step_samples = int(step_seconds * SAMPLE_RATE)
+        self.min_samples = int(min_seconds * SAMPLE_RATE)
+        self.max_window_samples = int(max_window_seconds * SAMPLE_RATE)
+
+        self.committed = []
+        self._window = bytearray()
+        self._previous = []
+        self._received = 0
+        self._decoded_at = 0
+        self._finishing = False
+        self._cancelled = False
+        self._cond = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="jarvis-streaming-asr", daemon=True)
+        self._worker.start()
+
+    def feed(self, pcm):
+        with self._cond:
+            self._window += pcm
+            self._received += len(pcm) // SAMPLE_WIDTH
+            self._cond.notify()
+
+    def _ready(self):
+        return (self._finishing or self._cancelled or
+                (self._received >= self.min_samples and self._received - self._decoded_at >= self.step_samples))
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(self._ready)
+                if self._finishing or self._cancelled:
+                    return
+                window = bytes(self._window)
+                self._decoded_at = self._received
+            self._step(window)
+
+    def _step(self, window):
+        words = self._decode(window)
+        agreed = agreed_prefix(self._previous, words)
+        # Never let the window grow without bound: force-commit half of it
+        if agreed == 0 and len(window) // SAMPLE_WIDTH > self.max_window_samples:
+            agreed = len(words) // 2
+        self._previous = words
+        if agreed:
+            self._commit(words[:agreed])
+
+    def _decode(self, window):
+        prompt = " ".join(self.committed[-PROMPT_WORDS:]) or None
+        return self.backend.transcribe_words(pcm16_to_float32(window), language=self.language, prompt=prompt)
+
+    def _commit(self, words):
+        self.committed.extend(word for word, _, _ in words)
+        cut_seconds = words[-1][2]
+        cut = min(int(cut_seconds * SAMPLE_RATE), len(self._window) // SAMPLE_WIDTH) * SAMPLE_WIDTH
+        with self._cond:
+            del self._window[:cut]
+        self._previous = [(word, start - cut_seconds, end - cut_seconds)
+                          for word, start, end in self._previous[len(words):]]
+        logger.info(f"📌 Committed: {' '.join(word for word, _, _ in words)}")
+
+    def finish(self):
+        """Decode the uncommitted tail and return the full transcription."""
+        with self._cond:
+            self._finishing = True
+            self._cond.notify()
+        self._worker.join()
+        window = bytes(self._window)
+        if window:
+            self.committed.extend(word for word, _, _ in self._decode(window))
+        return " ".join(self.committed).strip()
+
+    def cancel(self):
+        """Stop background decoding without producing a result."""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify()
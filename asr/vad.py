@@ -0,0 +1,108 @@
+"""
+Voice activity detection and endpointing for the capture pipeline.
+
+webrtcvad classifies 30 ms frames as speech or silence. The Endpointer uses
+that to hold back silence before the user starts talking, to declare the end
+of an utterance once speech has been absent for a hangover period, and to trim
+the audio handed to Whisper down to the spoken part plus a little padding.
+"""
+import collections
+import logging
+
+import webrtcvad
+
+from asr.audio import SAMPLE_RATE, SAMPLE_WIDTH
+
+logger = logging.getLogger("ASRVad")
+
+FRAME_MS = 30
+FRAME_BYTES = SAMPLE_RATE * FRAME_MS // 1000 * SAMPLE_WIDTH
+
+
+class Endpointer:
+    """
+    Tracks one utterance at a time over a stream of int16 PCM blocks.
+
+    feed() returns the bytes that belong to the utterance (nothing while the
+    user is silent), `ended` turns True after `hangover_ms` of silence, and
+    utterance() returns the speech with at most `padding_ms` of silence on each
+    side. Segments with less than `min_speech_ms` of voiced audio are dropped.
+    """
+
+    def __init__(self, aggressiveness=2, hangover_ms=600, padding_ms=300, start_ms=90, min_speech_ms=150):
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self.hangover_frames = max(1, hangover_ms // FRAME_MS)
+        self.padding_frames = padding_ms // FRAME_MS
+        self.start_frames = max(1, start_ms // FRAME_MS)
+        self.min_speech_frames = max(1, min_speech_ms // FRAME_MS)
+        self.reset()
+
+    def reset(self):
+        self._pending = b""
+        self._preroll = collections.deque(maxlen=self.padding_frames + self.start_frames)
+        self._frames = []
+        self._last_voiced = -1
+        self._voiced_count = 0
+        self._silent_run = 0
+        self.triggered = False
+        self.ended = False
+
+    def is_speech(self, frame):
+        return self._vad.is_speech(frame, SAMPLE_RATE)
+
+    def feed(self, pcm):
+        """Consume a block of PCM and return the part that belongs to the utterance."""
+        if self.ended:
+            return b""
+        data = self._pending + pcm
+        usable = len(data) - len(data) % FRAME_BYTES
+        self._pending = data[usable:]
+
+        accepted = []
+        for offset in range(0, usable, FRAME_BYTES):
+            frame = data[offset:offset + FRAME_BYTES]
+            voiced = self.is_speech(frame)
+            if not self.triggered:
+                self._preroll.append((frame, voiced))
+                recent = list(self._preroll)[-self.start_frames:]
+                if len(recent) == self.start_frames and all(v for _, v in recent):
+                    # Speech started: keep the padding that led into it
+                    self.triggered = True
+                    for preroll_frame, preroll_voiced in self._preroll:
+                        self._append(preroll_frame, preroll_voiced)
+                        accepted.append(preroll_frame)
+                    self._preroll.clear()
+                continue
+
+            self._append(frame, voiced)
+            accepted.append(frame)
+            if self._silent_run >= self.hangover_frames:
+                self.ended = True
+                break
+        return b"".join(accepted)
+
+    def _append(self, frame, voiced):
+        self._frames.append(frame)
+        if voiced:
+            self._last_voiced = len(self._frames) - 1
+            self._voiced_count += 1
+            self._silent_run = 0
+        else:
+            self._silent_run += 1
+
+    @property
+    def has_speech(self):
+        """True once the utterance holds enough voiced audio to be worth recognizing."""
+        return self._voiced_count >= self.min_speech_frames
+
+    @property
+    def trailing_silence_frames(self):
+        """Frames received after the last voiced one."""
+        return len(self._frames) - 1 - self._last_voiced if self._last_voiced >= 0 else 0
+
+    def utterance(self):
+        """Return the utterance audio with trailing silence trimmed to the padding."""
+        if self._last_voiced < 0:
+            return b""
+        end = min(len(self._frames), self._last_voiced + 1 + self.padding_frames)
+        return b"".join(self._frames[:end])
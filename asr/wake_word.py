@@ -0,0 +1,77 @@
+"""
+Lightweight wake-word detection for the idle loop.
+
+While Jarvis is waiting to be woken, running full Vosk + Whisper + MiniLM on
+every sound is wasted work. The WakeWordDetector instead gates audio with
+webrtcvad and feeds speech into a Vosk recognizer whose grammar only contains
+the `wake_up` phrases from intents.json, which decodes at a fraction of the
+cost of open-vocabulary recognition.
+"""
+import os
+import re
+import json
+import logging
+
+from asr.model_registry import registry
+from asr.vad import Endpointer
+
+logger = logging.getLogger("ASRWakeWord")
+
+INTENTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "intents.json")
+UNKNOWN = "[unk]"
+
+
+def grammar_phrase(phrase):
+    """
+    Spell a phrase as the Vosk grammar does: lowercase, apostrophes kept ("it's"),
+    other punctuation dropped. Unlike nlu.lookup.normalize_phrase, which removes
+    apostrophes too.
+    """
+    phrase = re.sub(r"[^\w\s']", " ", phrase.lower())
+    return re.sub(r"\s+", " ", phrase).strip()
+
+
+def load_wake_phrases(path=INTENTS_PATH, intent="wake_up"):
+    with open(path, "r") as f:
+        intents = json.load(f)
+    phrases = {grammar_phrase(p) for p in intents.get(intent, [])}
+    return sorted(p for p in phrases if p)
+
+
+class WakeWordDetector:
+    """Closed-grammar Vosk recognizer that only listens for wake phrases."""
+
+    def __init__(self, phrases=None, language="en", vad_aggressiveness=2):
+        self.phrases = set(phrases if phrases is not None else load_wake_phrases())
+        self.language = language
+        self.endpointer = Endpointer(aggressiveness=vad_aggressiveness, hangover_ms=300, padding_ms=150)
+        # "[unk]" absorbs everything else so random speech cannot match a phrase
+        self.recognizer = registry.vosk_recognizer(language, words=False, grammar=sorted(self.phrases) + [UNKNOWN])
+
+    def reset(self):
+        self.endpointer.reset()
+        self.recognizer.Reset()
+
+    def accept(self, pcm):
+        """
+        Feed a block of PCM. Returns the matched wake phrase once an utterance
+        that is only that phrase ends, otherwise None.
+        """
+        speech = self.endpointer.feed(pcm)
+        if speech:
+            self.recognizer.AcceptWaveform(speech)
+        if not self.endpointer.ended:
+            return None
+
+        text = json.loads(self.recognizer.FinalResult()).get("text", "")
+        self.reset()
+        words = text.split()
+        if words[:1] == [UNKNOWN]:
+            words = words[1:]  # one noise token before the phrase (a breath, a cough)
+        if UNKNOWN in words:
+            return None  # other speech around a wake phrase, e.g. "[unk] hello [unk]"
+        text = grammar_phrase(" ".join(words))
+        if text in self.phrases:
+            logger.info(f"👂 Wake phrase detected: {text}")
+            return text
+        return None
@@ -0,0 +1,417 @@
+"""
+Out-of-process speech recognition.
+
+VAD, Vosk and the second-pass backend run in a dedicated worker process so
+transcription never holds the GIL of the assistant's event loop. The parent
+keeps owning the microphone through the always-on capture service and pipes
+PCM blocks to the worker; the worker streams partial, hypothesis and final
+results back over a control connection.
+
+The worker is launched as `python -m asr.worker` rather than through
+multiprocessing's spawn, which would re-import main.py and everything it
+loads (intent classifier included) in the child.
+
+Control messages are (kind, request_id, payload) tuples:
+    parent -> worker: ("listen", id, params), ("dictate", id, params),
+                      ("detect_reply", id, result), ("cancel", id, None), ("stop", None, None)
+    worker -> parent: ("ready", None, None) or ("error", None, message) once the models are loaded,
+                      ("partial", id, text), ("hypothesis", id, text), ("chunk", id, text),
+                      ("detect", id, text), ("final", id, utterance), ("error", id, message)
+
+Audio messages are (id, pcm) tuples; an empty pcm ends the request's stream.
+When the parent gives up on a request before its final result (the awaiting
+task was cancelled, or a detect callback raised), it ends the stream and sends
+"cancel" so the worker finishes that request instead of waiting for audio.
+"""
+import os
+import sys
+import queue
+import socket
+import asyncio
+import logging
+import itertools
+import threading
+import subprocess
+from multiprocessing.connection import Connection
+
+from asr.audio import SAMPLE_RATE, SAMPLE_WIDTH
+from asr.routing import ROUTE_AUTO, ROUTE_WHISPER
+
+logger = logging.getLogger("ASRWorker")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FEED_BLOCK = 1600  # frames per audio message (100 ms)
+
+
+class WorkerError(RuntimeError):
+    """Raised in the parent when the worker failed to recognize an utterance."""
+
+
+class WorkerStartError(RuntimeError):
+    """Raised in the parent when the worker cannot load its models; restarting it would not help."""
+
+
+class RequestCancelled(Exception):
+    """Raised in the worker when the parent cancels the request being recognized."""
+
+
+# --- worker side -----------------------------------------------------------
+
+class Inbox(queue.Queue):
+    """
+    Queue of (request_id, pcm) audio blocks that can return a block to its
+    front. Once the parent's audio connection closes it holds a final None.
+    """
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+        self.put(None)
+
+    def put_back(self, item):
+        with self.not_empty:
+            self.queue.appendleft(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class QueueSource:
+    """Audio source over PCM blocks received from the parent for one request."""
+
+    def __init__(self, inbox, request_id):
+        self._inbox = inbox
+        self._request_id = request_id
+        self._pending = bytearray()
+        self._ended = False
+
+    def read(self, frames, timeout=None):
+        wanted = frames * SAMPLE_WIDTH
+        while len(self._pending) < wanted and not self._ended:
+            block = self._inbox.get()
+            if block is None:
+                # The parent is gone; leave the marker for whoever reads next
+                self._inbox.put_back(None)
+                self._ended = True
+                break
+            request_id, pcm = block
+            # Blocks still in flight from an earlier request are stale
+            if request_id < self._request_id:
+                continue
+            if request_id > self._request_id:
+                # The parent has moved on to a newer request: this one is over,
+                # and the block belongs to the next source
+                self._inbox.put_back((request_id, pcm))
+                self._ended = True
+                break
+            if not pcm:
+                self._ended = True  # the parent's audio input has run out
+            self._pending += pcm
+        chunk = bytes(self._pending[:wanted])
+        del self._pending[:wanted]
+        return chunk
+
+
+def _drain_audio(audio, inbox):
+    # Always read the audio pipe so the parent's writes never block
+    try:
+        while True:
+            inbox.put(audio.recv())
+    except (EOFError, OSError):
+        inbox.close()
+
+
+def serve(control, audio, preload_sizes=("tiny",), language="en"):
+    """Worker main loop: recognize one utterance per "listen" request."""
+    try:
+        from asr.model_registry import registry
+        from asr.pipeline import recognize_utterance
+        from asr.dictation import dictate
+
+        registry.preload(size=list(preload_sizes), language=language)
+    except Exception as e:
+        logger.error(f"ASR worker could not load its models: {e}", exc_info=True)
+        control.send(("error", None, f"{type(e).__name__}: {e}"))
+        return
+    control.send(("ready", None, None))
+    inbox = Inbox()
+    threading.Thread(target=_drain_audio, args=(audio, inbox), name="jarvis-worker-audio", daemon=True).start()
+
+    try:
+        while True:
+            if inbox.closed:
+                return
+            kind, request_id, params = control.recv()
+            if kind == "stop":
+                return
+            # A "cancel" read here is for a request that has already finished
+            if kind == "dictate":
+                try:
+                    # on_text runs on the dictation thread; "final" is only sent after it has finished
+                    result = dictate(QueueSource(inbox, request_id), model=params["model"],
+                                     language=params["language"],
+                                     on_text=lambda text: control.send(("chunk", request_id, text)))
+                    control.send(("final", request_id, result))
+                except (EOFError, ConnectionError):
+                    raise
+                except Exception as e:
+                    logger.error(f"Dictation failed in ASR worker: {e}", exc_info=True)
+                    control.send(("error", request_id, f"{type(e).__name__}: {e}"))
+                continue
+            if kind != "listen":
+                continue
+
+            def remote_detect(text, request_id=request_id):
+                control.send(("detect", request_id, text))
+                while True:
+                    reply_kind, reply_id, result = control.recv()
+                    if reply_id != request_id:
+                        continue
+                    if reply_kind == "detect_reply":
+                        return tuple(result)
+                    if reply_kind == "cancel":
+                        raise RequestCancelled(request_id)
+
+            try:
+                utterance = recognize_utterance(
+                    QueueSource(inbox, request_id), model=params["model"], language=params["language"],
+                    route=params["route"], stream=params["stream"], keep_audio=params["keep_audio"],
+                    detect=remote_detect if params["route"] == ROUTE_AUTO else None,
+                    on_partial=lambda text: control.send(("partial", request_id, text)),
+                    on_hypothesis=lambda text: control.send(("hypothesis", request_id, text)))
+                control.send(("final", request_id, utterance))
+            except RequestCancelled:
+                logger.info(f"Request {request_id} cancelled by the parent")
+            except (EOFError, ConnectionError):
+                raise
+            except Exception as e:
+                logger.error(f"Recognition failed in ASR worker: {e}", exc_info=True)
+                control.send(("error", request_id, f"{type(e).__name__}: {e}"))
+    except (EOFError, OSError):
+        pass  # the parent has exited: don't keep the models loaded for nobody
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    control_fd, audio_fd, preload_sizes, language = int(argv[0]), int(argv[1]), argv[2].split(","), argv[3]
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    serve(Connection(control_fd), Connection(audio_fd), preload_sizes, language)
+
+
+# --- parent side -----------------------------------------------------------
+
+class ASRWorker:
+    """Parent-side handle for the ASR worker process. One utterance at a time."""
+
+    def __init__(self, preload_sizes=("tiny",), language="en"):
+        self.preload_sizes = list(preload_sizes)
+        self.language = language
+        self._process = None
+        self._control = None
+        self._audio = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        control_parent, control_child = socket.socketpair()
+        audio_parent, audio_child = socket.socketpair()
+        fds = (control_child.fileno(), audio_child.fileno())
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "asr.worker", str(fds[0]), str(fds[1]), ",".join(self.preload_sizes),
+             self.language],
+            pass_fds=fds, cwd=PROJECT_ROOT)
+        control_child.close()
+        audio_child.close()
+        self._control = Connection(control_parent.detach())
+        self._audio = Connection(audio_parent.detach())
+        # Wait for the models so a worker that can never work fails here, not on every listen()
+        try:
+            kind, _, payload = self._control.recv()
+        except (EOFError, OSError):
+            kind, payload = "error", f"exited with code {self._process.wait()}"
+        if kind != "ready":
+            self._lost()
+            raise WorkerStartError(f"ASR worker failed to start: {payload}")
+        logger.info(f"🧵 ASR worker process started (pid {self._process.pid})")
+
+    def stop(self):
+        if not self.alive:
+            return
+        try:
+            self._control.send(("stop", None, None))
+            self._process.wait(timeout=5)
+        except Exception:
+            self._process.kill()
+
+    def _lost(self):
+        # The worker died or closed its end: reap it so the next call starts a new one
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+        return WorkerError("ASR worker process exited")
+
+    def _recv(self):
+        try:
+            return self._control.recv()
+        except (EOFError, OSError):
+            raise self._lost() from None
+
+    def _send(self, message):
+        try:
+            self._control.send(message)
+        except OSError:
+            raise self._lost() from None
+
+    def _begin(self, capture, params, kind="listen"):
+        request_id = next(self._ids)
+        cursor = capture.cursor()
+        start_pos = cursor.position
+        self._send((kind, request_id, params))
+        stop = threading.Event()
+
+        def feed():
+            try:
+                while not stop.is_set():
+                    pcm = cursor.read(FEED_BLOCK, timeout=0.2)
+                    if pcm:
+                        self._audio.send((request_id, pcm))
+                    elif capture.ended:
+                        self._audio.send((request_id, b""))
+                        return
+            except OSError:
+                pass  # the worker is gone; the control connection reports it
+
+        feeder = threading.Thread(target=feed, name="jarvis-worker-feed", daemon=True)
+        feeder.start()
+        return request_id, start_pos, stop, feeder
+
+    def _end(self, capture, request, result, finished):
+        request_id, start_pos, stop, feeder = request
+        stop.set()
+        feeder.join()
+        if not finished:
+            # Abandoned before the worker answered: end its stream and cancel a
+            # pending detect so it does not wait for audio or a reply forever
+            try:
+                self._audio.send((request_id, b""))
+                self._control.send(("cancel", request_id, None))
+            except OSError:
+                pass
+        if result is not None:
+            # Only what the worker actually consumed counts, not blocks still in flight
+            consumed = int(result["timings"]["consumed_seconds"] * SAMPLE_RATE)
+            capture.mark_consumed(start_pos + consumed)
+            result["capture_end"] = start_pos + consumed
+
+    def recognize(self, capture, model="tiny", language="en", route=ROUTE_WHISPER, stream=False,
+                  detect=None, on_partial=None, on_hypothesis=None, keep_audio=False):
+        """Blocking recognition of one utterance; returns the pipeline's utterance dict."""
+        params = {"model": model, "language": language, "route": route, "stream": stream, "keep_audio": keep_audio}
+        with self._lock:
+            request = self._begin(capture, params)
+            request_id, utterance, finished = request[0], None, False
+            try:
+                while True:
+                    kind, event_id, payload = self._recv()
+                    if event_id != request_id:
+                        continue
+                    if kind == "detect":
+                        self._send(("detect_reply", request_id, detect(payload)))
+                    elif kind == "final":
+                        utterance, finished = payload, True
+                        return utterance
+                    elif kind == "error":
+                        finished = True
+                        raise WorkerError(payload)
+                    else:
+                        _notify(kind, payload, on_partial, on_hypothesis)
+            finally:
+                self._end(capture, request, utterance, finished)
+
+    async def recognize_async(self, capture, model="tiny", language="en", route=ROUTE_WHISPER, stream=False,
+                              detect=None, on_partial=None, on_hypothesis=None, keep_audio=False):
+        """Awaitable recognize(); the event loop keeps running while the worker transcribes."""
+        loop = asyncio.get_running_loop()
+        acquire = loop.run_in_executor(None, self._lock.acquire)
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The executor thread still gets the lock; hand it back once it does
+            acquire.add_done_callback(lambda _: self._lock.release())
+            raise
+        events = asyncio.Queue()
+        fd = self._control.fileno()
+
+        def on_readable():
+            try:
+                while self._control.poll():
+                    events.put_nowait(self._control.recv())
+            except (EOFError, OSError):
+                loop.remove_reader(fd)
+                events.put_nowait(None)
+
+        params = {"model": model, "language": language, "route": route, "stream": stream, "keep_audio": keep_audio}
+        request, utterance, finished = None, None, False
+        try:
+            request = self._begin(capture, params)
+            request_id = request[0]
+            loop.add_reader(fd, on_readable)
+            while True:
+                event = await events.get()
+                if event is None:
+                    raise self._lost()
+                kind, event_id, payload = event
+                if event_id != request_id:
+                    continue
+                if kind == "detect":
+                    result = await loop.run_in_executor(None, detect, payload)
+                    self._send(("detect_reply", request_id, result))
+                elif kind == "final":
+                    utterance, finished = payload, True
+                    return utterance
+                elif kind == "error":
+                    finished = True
+                    raise WorkerError(payload)
+                else:
+                    _notify(kind, payload, on_partial, on_hypothesis)
+        finally:
+            loop.remove_reader(fd)
+            if request is not None:
+                self._end(capture, request, utterance, finished)
+            self._lock.release()
+
+    def dictate(self, capture, model="tiny", language="en", on_text=None):
+        """Blocking dictation (asr.dictation.dictate) in the worker; chunks arrive through on_text."""
+        with self._lock:
+            request = self._begin(capture, {"model": model, "language": language}, "dictate")
+            request_id, result, finished = request[0], None, False
+            try:
+                while True:
+                    kind, event_id, payload = self._recv()
+                    if event_id != request_id:
+                        continue
+                    if kind == "chunk" and on_text is not None:
+                        on_text(payload)
+                    elif kind == "final":
+                        result, finished = payload, True
+                        return result
+                    elif kind == "error":
+                        finished = True
+                        raise WorkerError(payload)
+            finally:
+                self._end(capture, request, result, finished)
+
+
+def _notify(kind, payload, on_partial, on_hypothesis):
+    if kind == "partial" and on_partial is not None:
+        on_partial(payload)
+    elif kind == "hypothesis" and on_hypothesis is not None:
+        on_hypothesis(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,88 @@ UNSPLASH_SECRET_KEY = "your_unsplash_secret_key_here"
 # Get your key from: https://runwayml.com/
 RUNAWAY_API_KEY = "your_runway_api_key_here"
 
+# Speech endpointing (optional, defaults shown)
+# VAD_AGGRESSIVENESS: 0 (keeps most audio) .. 3 (drops most non-speech)
+# VAD_HANGOVER_MS: how long you must pause before Jarvis treats the sentence as finished
+VAD_AGGRESSIVENESS = 2
+VAD_HANGOVER_MS = 600
+VAD_PADDING_MS = 300
+
+# What to do with microphone audio while Jarvis is speaking (optional, defaults shown)
+# "suppress" = treat it as silence, "tag" = keep it but ignore utterances spoken over
+# Jarvis' own voice, "off" = no gating. ECHO_SUPPRESSION lets you interrupt Jarvis by
+# speaking clearly louder than its echo (only with "suppress")
+PLAYBACK_GATING = "suppress"
+PLAYBACK_TAIL_MS = 300
+ECHO_SUPPRESSION = False
+
+# Vosk-only fast path (optional, defaults shown)
+# Short commands Vosk hears clearly skip Whisper when they match a known intent
+FAST_PATH_MIN_CONFIDENCE = 0.85
+FAST_PATH_MIN_INTENT_SCORE = 0.7
+FAST_PATH_MAX_WORDS = 6
+
+# Detect the intent from the Vosk text while Whisper is still transcribing
+SPECULATIVE_INTENT = True
+
+# Speech recognition backend (optional, default shown)
+# "whisper" = openai-whisper, "faster-whisper" = CTranslate2 int8 (fastest on CPU,
+# pip install faster-whisper), "vosk" = Vosk only, no second pass
+ASR_BACKEND = "whisper"
+FASTER_WHISPER_COMPUTE_TYPE = "int8"
+ASR_CPU_THREADS = 0
+
+# Whisper model size: "auto" times each size once on first start (results are cached
+# in ~/.cache/jarvis) and uses the largest one that keeps the wait after you stop
+# talking within these budgets; or pin a size such as "base"
+ASR_MODEL_SIZE = "auto"
+ASR_LATENCY_BUDGETS = {"command": 1.0, "dictation": 1.5, "reply": 0.5}
+
+# Extra languages: a Vosk model per language code, loaded the first time it is used.
+# Models of languages not heard recently are unloaded once the loaded models use
+# more than ASR_MODEL_MEMORY_BUDGET_MB (0 = no limit)
+VOSK_MODEL_PATHS = {
+    # "hi": "/home/your_username/Downloads/vosk-model-small-hi-0.22",
+}
+ASR_MODEL_MEMORY_BUDGET_MB = 0
+
+# Streaming transcription for long answers such as email bodies and notes
+STREAMING_STEP_SECONDS = 1.0
+STREAMING_MIN_SECONDS = 3.0
+
+# Dictation (notes, email bodies) ends on one of these phrases or after a long pause
+DICTATION_STOP_PHRASES = ("stop dictation", "end of note", "end of message")
+DICTATION_PAUSE_SECONDS = 5.0
+
+# Keep recognized utterances (audio + text, intent and timings) for replay and
+# profiling; the oldest are deleted past ASR_ARCHIVE_MAX_MB. Needs ffmpeg.
+# ASR_ARCHIVE_DIR = "/home/your_username/.cache/jarvis/utterances"
+ASR_ARCHIVE_MAX_MB = 200
+ASR_ARCHIVE_FORMAT = "flac"
+
+# Skip webcam face authorization after the wake word when the audio comes from
+# --audio-source wav:/stdin/unix: (headless sessions have no camera); the
+# microphone always requires it. Same as passing --skip-face-auth.
+SKIP_FACE_AUTH = False
+
+# Run speech recognition in a separate worker process so the assistant stays
+# responsive while Whisper transcribes (set False to decode in-process)
+ASR_WORKER_PROCESS = True
+
+# Intent matching model; intent phrase embeddings and the code-worthiness
+# weights are cached in NLU_CACHE_DIR and rebuilt when intents.json,
+# codeworthy.json or the model changes (prebuild: jarvis-prebuild)
+INTENT_MODEL = "all-MiniLM-L6-v2"
+# "onnx" runs it as an int8 ONNX graph (pip install .[fast-nlu], then jarvis-prebuild)
+INTENT_ENCODER = "sentence-transformers"
+# INTENT_MODEL_REVISION = "main"
+# NLU_CACHE_DIR = "/home/your_username/.cache/jarvis"
+INTENT_QUERY_CACHE_SIZE = 256
+# Rerank only the phrases of the k intents closest to the query (0 = every phrase)
+INTENT_PREFILTER_K = 0
+# Store intent embeddings reduced to 64/128 dimensions in float16 (0 = full size)
+INTENT_PCA_DIM = 0
+
 # Instructions:
 # 1. Copy this file to config.py
 # 2. Replace all "your_*_key_here" values with your actual API keys
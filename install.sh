@@ -105,6 +105,9 @@ source venv/bin/activate
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Precompute intent embeddings so the first start doesn't have to
+python -m nlu.prebuild || echo "Could not prebuild NLU artifacts; they will be built on first start."
+
 # Copy config and contact templates if not present
 if [ ! -f config.py ]; then
   cp config_template.py config.py
@@ -1,8 +1,11 @@
-from sentence_transformers import SentenceTransformer, util
-import torch
 import logging
 import json
-import os
+
+import numpy as np
+
+from nlu import settings, embeddings
+from nlu.intent_cache import INTENTS_PATH, load_or_build
+from nlu.lookup import PhraseIndex, QueryCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -12,36 +15,80 @@ logging.basicConfig(
 logger = logging.getLogger("IntentClassifier")
 
 # Load intents from a JSON file for maintainability
-INTENTS_PATH = os.path.join(os.path.dirname(__file__), 'intents.json')
 with open(INTENTS_PATH, 'r') as f:
     intents = json.load(f)
 
-embedder = SentenceTransformer('all-MiniLM-L6-v2')
+# One model shared with secondaryClassifier (see nlu/embeddings.py)
+embeddings.get_model()
+
+# Phrase embeddings are precomputed once per intents.json and model and compiled
+# into a deduplicated bank with per-intent prototypes (see nlu/intent_cache.py)
+intent_bank = load_or_build(INTENTS_PATH, embeddings.encode, embeddings.model_id(), settings.INTENT_MODEL_REVISION,
+                            dim=settings.INTENT_PCA_DIM)
+phrase_embeddings = intent_bank.embeddings
+
+# Literal intents.json phrases skip the encoder; recent queries skip the search
+phrase_index = PhraseIndex(intents)
+query_cache = QueryCache(settings.INTENT_QUERY_CACHE_SIZE)
 
-# Flatten intents into phrases and labels
-intent_phrases = []
-intent_labels = []
+def detect_intents(texts, confidence_threshold=0.55):
+    """
+    Classify many texts at once. Returns (intents, confidences): an object
+    array with None where the best score is below the threshold, and the best
+    scores. Texts not answered by the phrase index or the cache are encoded in
+    batches and scored with one matrix product against the intent bank.
+    """
+    texts = list(texts)
+    top_idx = np.full(len(texts), -1, dtype=np.int64)
+    confidences = np.zeros(len(texts), dtype=np.float32)
+    exact = np.empty(len(texts), dtype=object)
+    pending = {}
+    for i, text in enumerate(texts):
+        exact[i] = phrase_index.lookup(text)
+        if exact[i] is not None:
+            confidences[i] = 1.0
+            continue
+        key = embeddings.text_key(text)
+        cached = query_cache.get(key)
+        if cached is None:
+            pending.setdefault(key, []).append(i)
+        else:
+            top_idx[i], confidences[i] = cached
 
-for intent, phrases in intents.items():
-    for phrase in phrases:
-        intent_phrases.append(phrase.lower().strip())  # Normalize
-        intent_labels.append(intent)
+    if pending:
+        keys = list(pending)
+        # Few texts (a live turn) share the per-turn memo with is_code_worthy(); bulk ones bypass it
+        vectors = embeddings.embed(keys) if len(keys) <= embeddings.MEMO_SIZE else embeddings.encode(keys)
+        for key, index, score in zip(keys, *intent_bank.search_batch(vectors)):
+            query_cache.put(key, (int(index), float(score)))
+            top_idx[pending[key]] = index
+            confidences[pending[key]] = score
+
+    labels = np.array(intent_bank.names, dtype=object)[intent_bank.label_ids[np.maximum(top_idx, 0)]]
+    intents = np.where(exact != None, exact, np.where(confidences >= confidence_threshold, labels, None))  # noqa: E711
+    return intents, confidences
 
-# Precompute embeddings once
-phrase_embeddings = embedder.encode(intent_phrases, convert_to_tensor=True)
 
 def detect_intent(text, confidence_threshold=0.55):
     """Returns (intent, confidence) using semantic similarity"""
-    text = text.lower().strip()
-    query_embedding = embedder.encode(text, convert_to_tensor=True)
-    cosine_scores = util.pytorch_cos_sim(query_embedding, phrase_embeddings)[0]
-
-    top_score, top_idx = float(cosine_scores.max()), int(cosine_scores.argmax())
-    if top_score >= confidence_threshold:
-        return intent_labels[top_idx], top_score
-    else:
-        logger.warning(f"Unrecognized or ambiguous command: '{text}' (score={top_score:.2f})")
-        return None, top_score
+    intents, confidences = detect_intents([text], confidence_threshold)
+    intent, top_score = intents[0], float(confidences[0])
+    if intent is None:
+        logger.warning(f"Unrecognized or ambiguous command: '{text.lower().strip()}' (score={top_score:.2f})")
+    return intent, top_score
+
+
+def cache_stats():
+    """Hit counters of the phrase index and the query cache."""
+    answered = phrase_index.hits + query_cache.hits
+    return {
+        "queries": phrase_index.lookups,
+        "exact_hits": phrase_index.hits,
+        "cache_hits": query_cache.hits,
+        "searches": query_cache.misses,
+        "embedding_hits": embeddings.memo.hits,
+        "hit_rate": answered / phrase_index.lookups if phrase_index.lookups else 0.0,
+    }
       
 #this is primary classifier 
-# this has been used to determine user intent ( defined only )
\ No newline at end of file
+# this has been used to determine user intent ( defined only )
@@ -1,9 +1,10 @@
 import sys
+import argparse
 import logging
 
 from intent_classifier import detect_intent
 from utils import read_recent_unread_emails , clean_text_for_speech, trim_response, clean_input, speak, sleep_now, change_wallpaper
-from utils import listen, get_mistral_response, get_weather, web_search, load_contacts, send_email, count_recent_unread_emails
+from utils import listen_async, get_mistral_response, get_weather, web_search, load_contacts, send_email, count_recent_unread_emails
 from utils import play_music, stop_music, shutdown, update, add_reminder, list_reminders, run_schedule_loop, get_top_news
 import config, asyncio, subprocess
 from secondaryClassifier import is_code_worthy
@@ -13,6 +14,11 @@ from utils import read_pdf, get_weather_forecast, update_assistant_code, get_tim
 from utils import scan_wifi, save_voice_note, get_daily_affirmation, toggle_battery_saver, play_ambient_sound, take_webcam_photo
 from utils import backup_files, download_instagram_reel, convert_md_to_html, generate_password, check_linux_updates, handle_unknown_request
 from utils import decrease_volume, decrease_brightness, increase_volume, increase_brightness, take_screenshot, toggle_night_mode, translate_text
+from utils import preload_speech_models, listen_for_intent_async, wait_for_wake_word, asr_model_for, dictate_async
+from asr.routing import ROUTE_AUTO
+from asr.calibration import TURN_COMMAND, TURN_DICTATION, TURN_REPLY
+from asr.capture import set_audio_input, AudioInputEnded
+from asr.sources import open_audio_input
 from faceAuthorization.faceDetection import check_authorization
 import os
 
@@ -23,6 +29,11 @@ imap_server = 'imap.gmail.com'
 # Get the project root directory
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
+KNOWN_FACE_IMAGE = os.path.join(PROJECT_ROOT, "static", "known_image.jpeg")
+
+# Face authorization needs a webcam; headless sessions (--skip-face-auth) go straight past the wake word
+face_auth_required = True
+
 # Voice model paths - now relative to project directory
 VOICE_MODELS = {
     "Nepali_voice": os.path.join(PROJECT_ROOT, "voice_models", "ne_NP-google-medium.onnx"),
@@ -81,30 +92,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger("JarvisMain")
 
+# Read-only actions that are safe to start from the Vosk hypothesis while
+# Whisper is still transcribing; the result is dropped if the intent changes
+PREFETCH_ACTIONS = {
+    "get_weather": lambda: asyncio.run(get_weather_forecast("Kathmandu")),
+    "news": lambda: asyncio.run(get_top_news(config.NEWS_API_KEY)),
+    "battery_status": get_battery_status,
+    "get_stats": get_system_stats,
+    "get_ip": get_ip,
+    "public_ip": get_public_ip,
+    "uptime": get_uptime,
+}
+
+async def resolve_prefetched(prefetched, action, *args):
+    """Use the speculatively prefetched result if there is one, otherwise run the action now"""
+    if prefetched is not None:
+        return await asyncio.wrap_future(prefetched)
+    result = action(*args)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
+
 async def main():
     """Main interaction loop"""
+    preload_speech_models(language="en", calibration_voice=DEFAULT_VOICE)
     speak("Initialization sequence complete .. Connection established!", DEFAULT_VOICE)
 
+    # Blocking helpers (wake word, webcam, dictated notes) run on threads so the event loop keeps going
+    loop = asyncio.get_running_loop()
     proactive_briefing_given = False
     while True:
-        model = "tiny"
+        # Whisper sizes picked by the startup CPU calibration for each kind of turn
+        model = asr_model_for(TURN_COMMAND)
+        dictation_model = asr_model_for(TURN_DICTATION)
+        reply_model = asr_model_for(TURN_REPLY)
 
         # Wake word loop
         while True:
             selected_voice_model, current_voice_name = get_current_voice_info()
-            audio_input = listen(model, language="en")
-            if not audio_input:
+            # Only the closed-grammar wake-word detector runs until it fires
+            if not await loop.run_in_executor(None, wait_for_wake_word, "en"):
+                continue
+            print("Intent:", "wake_up")
+            if not face_auth_required:
+                break
+            if await loop.run_in_executor(None, check_authorization, KNOWN_FACE_IMAGE):
+                print("Authentication successful!!")
+                break
+            else:
+                speak("Authentication failed!", selected_voice_model)
                 continue
-            command = audio_input.lower()
-            intent, confidence = detect_intent(command)
-            print("Intent:", intent)
-            if intent == "wake_up":
-                if check_authorization(os.path.join(PROJECT_ROOT, "static", "known_image.jpeg")):
-                    print("Authentication successful!!")
-                    break
-                else:
-                    speak("Authentication failed!", selected_voice_model)
-                    continue
 
         # Always reset to Samantha after wake-up
         global current_voice_index
@@ -123,11 +160,13 @@ async def main():
 
         # Main conversation loop
         while True:
-            command = listen(model, language="en")
+            # Streaming keeps long LLM questions from paying their whole transcription at the end;
+            # awaiting lets the event loop run other tasks while the ASR worker transcribes
+            command, intent, confidence, prefetched = await listen_for_intent_async(
+                model, language="en", prefetch=PREFETCH_ACTIONS, stream=True)
             if not command:
                 continue
             commandFinal = command.lower()
-            intent, confidence = detect_intent(commandFinal)
             print("Intent:", intent)
 
             selected_voice_model, current_voice_name = get_current_voice_info()
@@ -156,9 +195,9 @@ async def main():
                 speak(f"Voice changed to {new_voice_name}", new_voice_path)
                 continue
             elif intent == "shutdown":
-                if check_authorization(os.path.join(PROJECT_ROOT, "static", "known_image.jpeg")):
+                if await loop.run_in_executor(None, check_authorization, KNOWN_FACE_IMAGE):
                     speak("do you really want to shutdown??", selected_voice_model)
-                    command = listen(model, language="en")
+                    command = await listen_async(reply_model, language="en", route=ROUTE_AUTO)
                     intent , confidence = detect_intent(command)
                     if intent == "yes":
                         shutdown(selected_voice_model)
@@ -171,7 +210,7 @@ async def main():
             elif intent == "stop_music":
                 stop_music(selected_voice_model)
             elif intent == "get_weather":
-                weather_info = await get_weather_forecast("Kathmandu")
+                weather_info = await resolve_prefetched(prefetched, get_weather_forecast, "Kathmandu")
                 speak(weather_info, selected_voice_model)
 
             # Email
@@ -180,7 +219,7 @@ async def main():
                 unread = count_recent_unread_emails(imap_server, EMAIL_USER, EMAIL_PASSWORD, 7)
                 speak(f"You have {unread} unread emails in the last 7 days", selected_voice_model)
                 speak("Do you want me to read them?", selected_voice_model)
-                reply = listen(model, language="en")
+                reply = await listen_async(reply_model, language="en", route=ROUTE_AUTO)
                 if detect_intent(reply.lower())[0] == "yes":
                     from_, subject, date_, unread_msg_nums = read_recent_unread_emails(imap_server, EMAIL_USER, EMAIL_PASSWORD, 7, 4)
                     command = f"Summarize this mail \n_from_: {from_} \ndate: {date_}\nSubject: {subject}"
@@ -190,15 +229,16 @@ async def main():
             elif intent == "send_email":
                 contacts = load_contacts()
                 speak("Who do you want to send the email to?", selected_voice_model)
-                name = clean_input(listen(model, language="en"))
+                name = clean_input(await listen_async(model, language="en"))
                 email = contacts.get(name)
                 if email:
                     speak("Subject?", selected_voice_model)
-                    subject = listen(model, language="en")
-                    speak("Body?", selected_voice_model)
-                    body = listen(model, language="en")
+                    subject = await listen_async(model, language="en")
+                    speak("Body? Say stop dictation when you are done.", selected_voice_model)
+                    body = await dictate_async(dictation_model, language="en")
                     speak("Want me to check grammar?", selected_voice_model)
-                    if detect_intent(listen(model, language="en").lower())[0] == "yes":
+                    reply = await listen_async(reply_model, language="en", route=ROUTE_AUTO)
+                    if detect_intent(reply.lower())[0] == "yes":
                         body = await get_mistral_response(f"Fix grammar: {body}")
                     send_email(EMAIL_USER, EMAIL_PASSWORD, email, subject, body)
                     speak(f"Email sent to {name}.", selected_voice_model)
@@ -208,13 +248,14 @@ async def main():
             # Web search
             elif intent == "web_search":
                 speak("What should I search?", selected_voice_model)
-                query = listen(model, language="en")
+                query = await listen_async(model, language="en")
                 speak("Searching, please wait.", selected_voice_model)
                 output, link = web_search(query)
                 summary = await get_mistral_response(f"Summarize this in under 100 words:\n{output}")
                 speak(clean_text_for_speech(summary), selected_voice_model)
                 speak("Open in browser?", selected_voice_model)
-                if detect_intent(listen(model, language="en").lower())[0] == "yes":
+                reply = await listen_async(reply_model, language="en", route=ROUTE_AUTO)
+                if detect_intent(reply.lower())[0] == "yes":
                     subprocess.run(f'firefox "{link}"', shell=True)
 
             # Assistant Utility Features
@@ -223,9 +264,9 @@ async def main():
 
             elif intent == "add_reminder":
                 speak("What should I remind you about?", selected_voice_model)
-                task = listen(model, language="en")
+                task = await listen_async(model, language="en")
                 speak("When should I remind you? (e.g., 14:30)", selected_voice_model)
-                time_str = listen(model, language="en")
+                time_str = await listen_async(model, language="en")
                 result = add_reminder(task, time_str, selected_voice_model)
                 speak(result, selected_voice_model)
 
@@ -234,38 +275,38 @@ async def main():
                 speak(result, selected_voice_model)
 
             elif intent == "news":
-                news = await get_top_news(config.NEWS_API_KEY)
+                news = await resolve_prefetched(prefetched, get_top_news, config.NEWS_API_KEY)
                 speak(news, selected_voice_model)
 
             elif intent == "battery_status":
-                percentage , status = get_battery_status()
+                percentage , status = await resolve_prefetched(prefetched, get_battery_status)
                 speak(f"Battery remaining {percentage} and {status}", selected_voice_model)
 
             elif intent == "wiki_summary":
                 speak("What should I look up?", selected_voice_model)
-                query = listen(model, language="en")
+                query = await listen_async(model, language="en")
                 result = wiki_summary(query)
                 speak(result, selected_voice_model)
 
             elif intent == "get_ip":
-                speak(get_ip(), selected_voice_model)
+                speak(await resolve_prefetched(prefetched, get_ip), selected_voice_model)
 
             elif intent == "get_stats":
-                stats = get_system_stats()
+                stats = await resolve_prefetched(prefetched, get_system_stats)
                 speak(stats, selected_voice_model)
 
             elif intent == "translate":
                 speak("What text should I translate?", selected_voice_model)
-                text = listen(model, language="en")
+                text = await listen_async(model, language="en")
                 speak("To which language?", selected_voice_model)
-                lang = listen(model, language="en")
+                lang = await listen_async(model, language="en")
                 translated = translate_text(text, lang)
                 speak(translated, selected_voice_model)
 
             elif intent == "start_timer":
                 speak("How many seconds?", selected_voice_model)
                 try:
-                    seconds = int(listen(model, language="en"))
+                    seconds = int(await listen_async(model, language="en"))
                     start_timer(seconds, selected_voice_model)
                 except ValueError:
                     speak("That wasn't a number.", selected_voice_model)
@@ -274,9 +315,8 @@ async def main():
                 speak(tell_joke(), selected_voice_model)
 
             elif intent == "create_note":
-                speak("What should I write?", selected_voice_model)
-                note = listen(model, language="en")
-                result = create_note(note)
+                speak("What should I write? Say stop dictation when you are done.", selected_voice_model)
+                result = await loop.run_in_executor(None, lambda: create_note(model=dictation_model))
                 speak(result, selected_voice_model)
 
             elif intent == "current_datetime":
@@ -284,13 +324,13 @@ async def main():
 
             elif intent == "youtube_search":
                 speak("What should I play?", selected_voice_model)
-                query = listen(model, language="en")
+                query = await listen_async(model, language="en")
                 result = play_youtube(query)
                 speak(result, selected_voice_model)
 
             elif intent == "find_file":
                 speak("What file are you looking for?", selected_voice_model)
-                filename = listen(model, language="en")
+                filename = await listen_async(model, language="en")
                 path = find_file(filename)
                 speak(path, selected_voice_model)
 
@@ -300,7 +340,7 @@ async def main():
 
             elif intent == "convert_currency":
                 speak("How much and which currency?", selected_voice_model)
-                info = listen(model, language="en")
+                info = await listen_async(model, language="en")
                 parts = info.split()
                 if len(parts) == 3:
                     amount, from_curr, to_curr = parts
@@ -311,7 +351,7 @@ async def main():
 
             elif intent == "generate_image":
                 speak("What should I generate?", selected_voice_model)
-                prompt = listen(model, language="en")
+                prompt = await listen_async(model, language="en")
                 image_url = await generate_image(prompt)
                 speak(f"Image generated: {image_url}", selected_voice_model)
 
@@ -321,7 +361,7 @@ async def main():
 
             elif intent == "read_pdf":
                 speak("Enter PDF file path", selected_voice_model)
-                path = listen(model, language="en")
+                path = await listen_async(model, language="en")
                 text = read_pdf(path)
                 speak(text[:500], selected_voice_model)  # Read a preview
 
@@ -333,16 +373,16 @@ async def main():
                 speak(get_time_based_greeting(), selected_voice_model)
 
             elif intent == "uptime":
-                speak(get_uptime(), selected_voice_model)
+                speak(await resolve_prefetched(prefetched, get_uptime), selected_voice_model)
 
             elif intent == "port_scan":
                 speak("Which IP or host to scan?", selected_voice_model)
-                host = listen(model, language="en")
+                host = await listen_async(model, language="en")
                 result = scan_ports(host)
                 speak(result, selected_voice_model)
 
             elif intent == "public_ip":
-                ip = get_public_ip()
+                ip = await resolve_prefetched(prefetched, get_public_ip)
                 speak(f"Your public IP is {ip}", selected_voice_model)
 
             elif intent == "wifi_scan":
@@ -350,9 +390,8 @@ async def main():
                 speak(result, selected_voice_model)
 
             elif intent == "save_voice_note":
-                speak("Speak your note.", selected_voice_model)
-                text = listen(model, language="en")
-                result = save_voice_note(text)
+                speak("Speak your note. Say stop dictation when you are done.", selected_voice_model)
+                result = await loop.run_in_executor(None, lambda: save_voice_note(model=dictation_model))
                 speak(result, selected_voice_model)
 
             elif intent == "motivation":
@@ -360,13 +399,13 @@ async def main():
 
             elif intent == "battery_saver":
                 speak("Turn battery saver on or off?", selected_voice_model)
-                mode = listen(model, language="en").lower()
+                mode = (await listen_async(model, language="en")).lower()
                 result = toggle_battery_saver(mode)
                 speak(result, selected_voice_model)
 
             elif intent == "play_ambient":
                 speak("What ambient sound? (rain, forest, ocean)", selected_voice_model)
-                type_ = listen(model, language="en")
+                type_ = await listen_async(model, language="en")
                 result = play_ambient_sound(type_)
                 speak(result, selected_voice_model)
 
@@ -376,14 +415,14 @@ async def main():
 
             elif intent == "take_photo":
                 speak("Are you ready?", selected_voice_model)
-                user_status = listen(model="tiny", language="en")
+                user_status = await listen_async(reply_model, language="en", route=ROUTE_AUTO)
                 intent , confidence = detect_intent(user_status)
                 if intent == "yes":
                     speak("cheese!", selected_voice_model)
                     result, path = take_webcam_photo()
                     speak(result, selected_voice_model)
                     speak("You want me to open your photo?", selected_voice_model)
-                    user_choice = listen(model="tiny", language="en")
+                    user_choice = await listen_async(reply_model, language="en", route=ROUTE_AUTO)
                     intent , confidence = detect_intent(user_choice)
                     if intent == "yes":
                         command = f'firefox {path}'
@@ -400,7 +439,7 @@ async def main():
 
             elif intent == "download_instagram":
                 speak("Paste the Instagram reel URL.", selected_voice_model)
-                url = listen(model, language="en")
+                url = await listen_async(model, language="en")
                 result = download_instagram_reel(url)
                 speak(result, selected_voice_model)
 
@@ -418,6 +457,25 @@ async def main():
                 
 # main entry point
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jarvis voice assistant")
+    parser.add_argument("--audio-source", default="mic",
+                        help="mic (default), wav:PATH, stdin (raw 16 kHz mono s16le PCM) or unix:PATH")
+    parser.add_argument("--audio-device", help="input device name or index for --audio-source mic")
+    parser.add_argument("--audio-speed", type=float, default=1.0,
+                        help="replay speed for non-microphone sources, as a multiple of real time")
+    parser.add_argument("--skip-face-auth", action="store_true",
+                        help="skip webcam face authorization after the wake word (non-microphone sources only)")
+    args = parser.parse_args()
+    if args.audio_source != "mic" and (args.skip_face_auth or getattr(config, "SKIP_FACE_AUTH", False)):
+        face_auth_required = False
+    elif args.skip_face_auth:
+        parser.error("--skip-face-auth only applies to non-microphone audio sources")
+    device = int(args.audio_device) if args.audio_device and args.audio_device.isdigit() else args.audio_device
+    try:
+        set_audio_input(open_audio_input(args.audio_source, device=device, speed=args.audio_speed))
+    except ValueError as e:
+        parser.error(str(e))
+
     try:
         missing = config.validate_config()
         if missing:
@@ -429,6 +487,8 @@ if __name__ == "__main__":
         exit(1)
     try:
         asyncio.run(main())
+    except AudioInputEnded:
+        logger.info("🎙️ Audio input ended, shutting down")
     except Exception as e:
         logger.error(f"Unhandled exception in main loop: {e}", exc_info=True)
         print("A critical error occurred. Please check the logs for details.")
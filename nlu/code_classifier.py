@@ -0,0 +1,107 @@
+"""
+Persisted code-worthiness classifier.
+
+A logistic regression over sentence embeddings decides whether an unknown
+request should be answered with generated code. The labelled examples live in
+codeworthy.json; the fitted weights are stored in NLU_CACHE_DIR as
+
+    codeworthy-<key>.npz   coef [dim], intercept []
+
+keyed by the examples, the embedding model and its revision. Scoring is a dot
+product against the query embedding, so nothing is trained on the startup path
+once `jarvis-prebuild` (or the first start) has written the weights.
+
+The fit is the same L2-regularized objective as scikit-learn's default
+LogisticRegression (C=1.0, intercept unpenalized), solved with Newton's
+method in NumPy.
+"""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+
+import numpy as np
+
+from nlu import settings
+from nlu.intent_cache import file_hash
+
+logger = logging.getLogger("CodeClassifier")
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "codeworthy.json")
+FORMAT_VERSION = 1
+PREFIX = "codeworthy-"
+
+
+def cache_key(examples_path, model, revision=None):
+    parts = [str(FORMAT_VERSION), file_hash(examples_path), model, revision or "main"]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def weights_path(key):
+    return os.path.join(settings.NLU_CACHE_DIR, PREFIX + key + ".npz")
+
+
+def load_examples(examples_path):
+    """Return (texts, labels): 1 for code-worthy requests, 0 for conversation."""
+    with open(examples_path, "r") as f:
+        examples = json.load(f)
+    texts = examples["code"] + examples["chat"]
+    labels = np.array([1] * len(examples["code"]) + [0] * len(examples["chat"]), dtype=np.float64)
+    return texts, labels
+
+
+def fit_logistic(X, y, C=1.0, iterations=50, tol=1e-8):
+    """Minimize 0.5·|coef|² + C·Σ log-loss with Newton steps; returns (coef, intercept)."""
+    X = np.hstack([np.asarray(X, dtype=np.float64), np.ones((len(X), 1))])
+    penalty = np.eye(X.shape[1]) / C
+    penalty[-1, -1] = 0.0  # the intercept is not regularized
+    w = np.zeros(X.shape[1])
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-(X @ w)))
+        gradient = X.T @ (p - y) + penalty @ w
+        hessian = (X * (p * (1 - p))[:, None]).T @ X + penalty
+        step = np.linalg.solve(hessian, gradient)
+        w -= step
+        if np.abs(step).max() < tol:
+            break
+    return w[:-1].astype(np.float32), np.float32(w[-1])
+
+
+def train(examples_path, encode, model, revision=None):
+    """Encode the examples with `encode(texts) -> array`, fit and save the weights. Returns their path."""
+    texts, labels = load_examples(examples_path)
+    logger.info(f"🧮 Training the code-worthiness classifier on {len(texts)} examples...")
+    coef, intercept = fit_logistic(encode(texts), labels)
+
+    os.makedirs(settings.NLU_CACHE_DIR, exist_ok=True)
+    path = weights_path(cache_key(examples_path, model, revision))
+    fd, tmp = tempfile.mkstemp(prefix="." + PREFIX, suffix=".npz", dir=settings.NLU_CACHE_DIR)
+    with os.fdopen(fd, "wb") as f:
+        np.savez(f, coef=coef, intercept=intercept)
+    os.replace(tmp, path)
+    for entry in os.scandir(settings.NLU_CACHE_DIR):
+        if entry.name.startswith(PREFIX) and entry.path != path:
+            os.remove(entry.path)
+    return path
+
+
+def load(path):
+    """Return (coef, intercept) from saved weights."""
+    with np.load(path) as weights:
+        return weights["coef"], float(weights["intercept"])
+
+
+def load_or_train(examples_path, encode, model, revision=None):
+    path = weights_path(cache_key(examples_path, model, revision))
+    if os.path.exists(path):
+        try:
+            return load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ Retraining from unreadable weights {path}: {e}")
+    return load(train(examples_path, encode, model, revision))
+
+
+def probability(embeddings, coef, intercept):
+    """P(code-worthy) for each row of `embeddings`."""
+    return 1.0 / (1.0 + np.exp(-(np.asarray(embeddings) @ coef + intercept)))
@@ -0,0 +1,111 @@
+"""
+Process-wide sentence-embedding service.
+
+The intent classifier and the code-worthiness classifier share one model, so
+its weights are resident once. Queries go through embed(), which memoizes the
+texts seen during the current turn: the command is classified by
+detect_intent() and, if no intent matches, again by is_code_worthy(), but
+encoded only once. utils.listen_for_intent() calls new_turn() to forget the
+previous turn's texts. Texts are keyed case-insensitively only if the model's
+tokenizer lowercases anyway (see text_key()).
+
+Embeddings are float32 and L2-normalized, so a dot product is the cosine
+similarity.
+"""
+import logging
+import threading
+
+import numpy as np
+
+from nlu import settings
+from nlu.lookup import QueryCache
+
+logger = logging.getLogger("Embeddings")
+
+MEMO_SIZE = 32  # texts remembered per turn
+
+_model = None
+_model_lock = threading.Lock()
+_ignores_case = False  # set once the model is loaded
+memo = QueryCache(MEMO_SIZE)
+
+ENCODER_TORCH = "sentence-transformers"
+ENCODER_ONNX = "onnx"
+
+
+def model_id():
+    """Identifies the embeddings for cache keys: the model and, unless PyTorch, the encoder."""
+    if settings.INTENT_ENCODER == ENCODER_ONNX:
+        return f"{settings.INTENT_MODEL}+onnx-int8"
+    return settings.INTENT_MODEL
+
+
+def load_model(model=None, revision=None, encoder=ENCODER_TORCH):
+    """Load a sentence-embedding model, by default the one named in the settings."""
+    model = model or settings.INTENT_MODEL
+    revision = revision or settings.INTENT_MODEL_REVISION
+    if encoder == ENCODER_ONNX:
+        from nlu.onnx_encoder import OnnxEncoder
+        return OnnxEncoder.load(model, revision)
+    if encoder != ENCODER_TORCH:
+        raise ValueError(f"Unknown INTENT_ENCODER: {encoder} (choose {ENCODER_TORCH} or {ENCODER_ONNX})")
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model, revision=revision) if revision else SentenceTransformer(model)
+
+
+def ignores_case(model):
+    """True if the model's tokenizer lowercases its input, so case cannot change an embedding."""
+    if hasattr(model, "ignores_case"):  # OnnxEncoder
+        return model.ignores_case
+    ids = model.tokenize(["Hello", "hello"])["input_ids"]
+    return ids[0].tolist() == ids[1].tolist()
+
+
+def get_model():
+    """The shared model, loaded on first use."""
+    global _model, _ignores_case
+    with _model_lock:
+        if _model is None:
+            logger.info(f"🧠 Loading sentence embedder {model_id()}...")
+            _model = load_model(encoder=settings.INTENT_ENCODER)
+            _ignores_case = ignores_case(_model)
+        return _model
+
+
+def normalize(embeddings):
+    """L2-normalize rows so a dot product is the cosine similarity."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def encode(texts):
+    """Encode a batch of texts without memoizing, e.g. to build a phrase bank."""
+    return normalize(get_model().encode(list(texts)))
+
+
+def text_key(text):
+    """
+    Cache key for a query text. With an uncased tokenizer (MiniLM's) case and
+    outer whitespace don't change the embedding, so they are folded; a cased
+    model is keyed on the exact text.
+    """
+    return text.lower().strip() if _ignores_case else text
+
+
+def embed(texts):
+    """Return normalized embeddings for `texts` [n, dim], encoding only texts not seen this turn."""
+    keys = [text_key(text) for text in texts]
+    vectors = [memo.get(key) for key in keys]
+    missing = list(dict.fromkeys(key for key, vector in zip(keys, vectors) if vector is None))
+    if missing:
+        encoded = dict(zip(missing, encode(missing)))
+        for key, vector in encoded.items():
+            memo.put(key, vector)
+        vectors = [encoded[key] if vector is None else vector for key, vector in zip(keys, vectors)]
+    return np.stack(vectors)
+
+
+def new_turn():
+    """Forget the texts memoized for the previous turn."""
+    memo.clear()
@@ -0,0 +1,86 @@
+"""
+Offline evaluation of the intent classifier.
+
+Every HOLDOUT_EVERY-th distinct phrase of each intent in intents.json is held
+out; a bank is compiled from the rest and the held-out phrases are classified
+against it. Accuracy is measured against their intent, agreement against the
+brute-force scan of the full-dimension bank. Both the prototype prefilter
+(`k`) and PCA-reduced banks (`pca`) are compared with that baseline. Run it
+with `jarvis-bench intents`.
+"""
+import json
+import time
+
+import numpy as np
+
+from nlu import embeddings
+from nlu.embeddings import normalize
+from nlu.intent_bank import IntentBank, compile_bank, reduce_bank
+from nlu.intent_cache import INTENTS_PATH, flatten_intents
+from nlu.lookup import normalize_phrase
+
+HOLDOUT_EVERY = 5
+
+
+def split_intents(intents, every=HOLDOUT_EVERY):
+    """Return (train_intents, held_out) where held_out is [(phrase, intent)]."""
+    train, held_out = {}, []
+    for intent, phrases in intents.items():
+        seen, distinct = set(), []
+        for phrase in phrases:
+            if normalize_phrase(phrase) not in seen:
+                seen.add(normalize_phrase(phrase))
+                distinct.append(phrase)
+        train[intent] = [phrase for i, phrase in enumerate(distinct) if i % every != every - 1]
+        held_out += [(phrase, intent) for i, phrase in enumerate(distinct) if i % every == every - 1]
+    return train, held_out
+
+
+def build_bank(bank_embeddings, label_ids, names, k=0, dim=0):
+    """Compile an in-memory IntentBank, like the cached one, from normalized phrase embeddings."""
+    projection = None
+    if dim:
+        bank_embeddings, projection = reduce_bank(bank_embeddings, dim)
+    offsets, centroids = compile_bank(bank_embeddings.astype(np.float32), label_ids, len(names))
+    return IntentBank(bank_embeddings, label_ids, names, offsets, centroids, k=k, projection=projection)
+
+
+def _score(bank, queries, truth, reference, threshold, k=0):
+    start = time.perf_counter()
+    indices, scores = bank.search_batch(queries, k=k)
+    elapsed = time.perf_counter() - start
+    # Label ids, with -1 where the classifier would answer "no intent"
+    predicted = np.where(scores >= threshold, bank.label_ids[indices], -1)
+    return {
+        "accuracy": round(float(np.mean(predicted == truth)), 4),
+        "agreement": round(float(np.mean(indices == reference)), 4),
+        "us_per_query": round(elapsed / len(queries) * 1e6, 2),
+        # Reduced banks are cached as float16 but widened to float32 when loaded
+        "bank_bytes": int(bank.embeddings.nbytes),
+        "disk_bytes": int(bank.embeddings.size * 2 if bank.projection is not None else bank.embeddings.nbytes),
+    }
+
+
+def run_intent_benchmark(ks=(0, 4, 8, 16), dims=(), threshold=0.55, intents_path=INTENTS_PATH, encode=None):
+    encode = encode or embeddings.encode
+    with open(intents_path, "r") as f:
+        train, held_out = split_intents(json.load(f))
+    phrases, label_ids, names = flatten_intents(train)
+    bank_embeddings = normalize(encode(phrases))
+    queries = normalize(encode([embeddings.text_key(phrase) for phrase, _ in held_out]))
+    truth = np.array([names.index(intent) for _, intent in held_out])
+
+    bank = build_bank(bank_embeddings, label_ids, names)
+    reference = bank.search_batch(queries)[0]
+    report = {"intents": len(names), "phrases": len(bank), "held_out": len(held_out),
+              "threshold": threshold, "k": {}, "pca": {}}
+    for k in ks:
+        report["k"][str(k)] = _score(bank, queries, truth, reference, threshold, k=k)
+
+    baseline = report["k"].get("0") or _score(bank, queries, truth, reference, threshold)
+    for dim in dims:
+        scores = _score(build_bank(bank_embeddings, label_ids, names, dim=dim), queries, truth, reference, threshold)
+        # Phrase indices are the same in the reduced bank, so agreement still compares with the full scan
+        scores["accuracy_delta"] = round(scores["accuracy"] - baseline["accuracy"], 4)
+        report["pca"][str(dim)] = scores
+    return report
@@ -0,0 +1,152 @@
+"""
+Compiled intent phrase bank.
+
+intents.json lists many phrases that only differ by case or punctuation
+("play some music", "Play some music!"). The bank keeps one embedding per
+normalized phrase, grouped by intent so each intent's phrases are a contiguous
+slice, plus one prototype per intent: the normalized centroid of its phrases.
+
+A query is scored against the prototypes first, then only the phrases of the
+`k` best intents are reranked, so the scan grows with the number of intents
+rather than the number of phrases. With k=0 every phrase is scanned, which is
+the brute-force reference; `jarvis-bench intents` measures how often the two
+agree on held-out phrases.
+
+Optionally the bank is reduced with PCA: phrases and queries are centered,
+projected onto the leading components and re-normalized, and the phrases are
+stored as float16 (NumPy has no fast float16 product, so they are widened once
+when loaded). At 64 or 128 dimensions that cuts the memory and the scan 3-6x
+for a small accuracy loss, which `jarvis-bench intents --pca 64 128` reports.
+"""
+import numpy as np
+
+from nlu.embeddings import normalize
+
+
+def compile_bank(embeddings, label_ids, n_intents):
+    """Return (offsets, centroids) for embeddings sorted by label id."""
+    counts = np.bincount(label_ids, minlength=n_intents)
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+    centroids = np.zeros((n_intents, embeddings.shape[1]), dtype=np.float32)
+    for intent, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        if end > start:
+            centroids[intent] = normalize(embeddings[start:end].mean(axis=0))
+    return offsets, centroids
+
+
+def fit_projection(embeddings, dim):
+    """Return (mean, components [dim, input dim]) of a PCA of the phrase embeddings."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    mean = embeddings.mean(axis=0)
+    _, _, vt = np.linalg.svd(embeddings - mean, full_matrices=False)
+    return mean, np.ascontiguousarray(vt[:dim])
+
+
+def project(embeddings, projection):
+    """Reduce normalized embeddings with a fitted projection and re-normalize them."""
+    mean, components = projection
+    return normalize((np.asarray(embeddings, dtype=np.float32) - mean) @ components.T)
+
+
+def reduce_bank(embeddings, dim):
+    """Return (reduced float16 embeddings, projection) for a bank of normalized embeddings."""
+    projection = fit_projection(embeddings, dim)
+    return project(embeddings, projection).astype(np.float16), projection
+
+
+class IntentBank:
+    """Phrase embeddings with integer labels and per-intent prototypes."""
+
+    def __init__(self, embeddings, label_ids, names, offsets, centroids, k=0, projection=None):
+        if embeddings.dtype == np.float16:
+            embeddings = embeddings.astype(np.float32)
+        self.embeddings = embeddings
+        self.label_ids = label_ids
+        self.names = names
+        self.offsets = offsets
+        self.centroids = centroids
+        self.k = k
+        self.projection = projection
+
+    def __len__(self):
+        return len(self.label_ids)
+
+    def search(self, query, k=None):
+        """Return (phrase index, score) of the phrase closest to a normalized `query`."""
+        if self.projection is not None:
+            query = project(query, self.projection)
+        return self._search_projected(query, self.k if k is None else k)
+
+    def _search_projected(self, query, k):
+        if not k or k >= len(self.names):
+            scores = self.embeddings @ query
+            best = int(scores.argmax())
+            return best, float(scores[best])
+
+        prototype_scores = self.centroids @ query
+        best, best_score = -1, -np.inf
+        for intent in np.argpartition(-prototype_scores, k - 1)[:k]:
+            start, end = int(self.offsets[intent]), int(self.offsets[intent + 1])
+            if start == end:
+                continue
+            scores = self.embeddings[start:end] @ query
+            index = int(scores.argmax())
+            if scores[index] > best_score:
+                best, best_score = start + index, float(scores[index])
+        return best, best_score
+
+    def search_batch(self, queries, k=None, chunk=1024):
+        """
+        Vectorized search() for normalized `queries` [n, dim]: returns arrays of
+        phrase indices and scores. With the prefilter, queries are grouped by
+        candidate intent and each intent's phrases are scored only against the
+        queries that picked it, so the cost stays that of search(): k intents'
+        phrases per query, not the whole bank.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if self.projection is not None:
+            queries = project(queries, self.projection)
+        k = self.k if k is None else k
+        indices = np.zeros(len(queries), dtype=np.int64)
+        scores = np.zeros(len(queries), dtype=np.float32)
+        for start in range(0, len(queries), chunk):
+            block = queries[start:start + chunk]
+            if k and k < len(self.names) and len(block) == 1:
+                # A single live command: the per-intent loop has the least overhead
+                best, best_scores = self._search_projected(block[0], k)
+            elif k and k < len(self.names):
+                best, best_scores = self._rerank_batch(block, k)
+            else:
+                phrase_scores = block @ self.embeddings.T
+                best = phrase_scores.argmax(axis=1)
+                best_scores = phrase_scores[np.arange(len(block)), best]
+            indices[start:start + chunk] = best
+            scores[start:start + chunk] = best_scores
+        return indices, scores
+
+    def _rerank_batch(self, block, k):
+        candidates = np.argpartition(-(block @ self.centroids.T), k - 1, axis=1)[:, :k]
+        # (query, intent) pairs sorted by intent, so each intent's queries are one slice
+        rows = np.repeat(np.arange(len(block)), k)
+        intents = candidates.ravel()
+        order = np.argsort(intents, kind="stable")
+        rows, intents = rows[order], intents[order]
+        groups = np.searchsorted(intents, np.arange(len(self.names) + 1))
+
+        best = np.zeros(len(block), dtype=np.int64)
+        best_scores = np.full(len(block), -np.inf, dtype=np.float32)
+        for intent in np.unique(intents):
+            start, end = int(self.offsets[intent]), int(self.offsets[intent + 1])
+            if start == end:
+                continue
+            members = rows[groups[intent]:groups[intent + 1]]
+            scores = block[members] @ self.embeddings[start:end].T
+            local = scores.argmax(axis=1)
+            top = scores[np.arange(len(members)), local]
+            better = top > best_scores[members]
+            best_scores[members[better]] = top[better]
+            best[members[better]] = start + local[better]
+        return best, best_scores
+
+    def label(self, index):
+        return self.names[self.label_ids[index]]
@@ -0,0 +1,174 @@
+"""
+On-disk cache of the intent phrase embeddings.
+
+Encoding every phrase in intents.json is the largest part of the assistant's
+cold start. The embeddings are computed once and stored, compiled into an
+intent bank (nlu/intent_bank.py), as an artifact directory in NLU_CACHE_DIR:
+
+    intents-<key>/embeddings.npy   float32 [phrases, dim], L2-normalized, grouped by intent
+    intents-<key>/labels.npy       int16 intent index per phrase
+    intents-<key>/offsets.npy      int32 [intents + 1], start of each intent's phrases
+    intents-<key>/centroids.npy    float32 [intents, dim], normalized prototype per intent
+    intents-<key>/meta.json        intent names and what the key was built from
+
+With INTENT_PCA_DIM set, the embeddings are reduced and stored as float16,
+next to projection_mean.npy and projection.npy.
+
+The key hashes intents.json together with the model name, its revision and the
+artifact format, so editing intents or switching models rebuilds it; otherwise
+startup memory-maps the arrays instead of running the encoder. A build deletes
+the model's artifacts for earlier versions of the intents file but keeps those
+of other models and PCA dims. Prebuild at install time with `jarvis-prebuild`.
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+
+import numpy as np
+
+from nlu import settings
+from nlu.embeddings import normalize
+from nlu.intent_bank import IntentBank, compile_bank, reduce_bank
+from nlu.lookup import normalize_phrase
+
+logger = logging.getLogger("IntentCache")
+
+INTENTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "intents.json")
+FORMAT_VERSION = 3
+PREFIX = "intents-"
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def cache_key(intents_path, model, revision=None, dim=0):
+    parts = [str(FORMAT_VERSION), file_hash(intents_path), model, revision or "main"]
+    if dim:
+        parts.append(f"pca{dim}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def artifact_dir(key):
+    return os.path.join(settings.NLU_CACHE_DIR, PREFIX + key)
+
+
+def flatten_intents(intents):
+    """
+    Return (phrases, label_ids, names): the phrases grouped by intent, with the
+    index of their intent. Phrases that normalize to one already listed for the
+    same intent are dropped.
+    """
+    phrases, label_ids = [], []
+    names = list(intents)
+    for index, phrases_for_intent in enumerate(intents.values()):
+        seen = set()
+        for phrase in phrases_for_intent:
+            key = normalize_phrase(phrase)
+            if key in seen:
+                continue
+            seen.add(key)
+            phrases.append(phrase.lower().strip())
+            label_ids.append(index)
+    return phrases, np.array(label_ids, dtype=np.int16), names
+
+
+def build(intents_path, encode, model, revision=None, dim=0, force=False):
+    """
+    Encode every phrase with `encode(texts) -> array` and write the artifact.
+    Returns its directory. An existing artifact is replaced only with `force`;
+    otherwise it is assumed to have been built concurrently and kept.
+    """
+    with open(intents_path, "r") as f:
+        intents = json.load(f)
+    phrases, label_ids, names = flatten_intents(intents)
+    key = cache_key(intents_path, model, revision, dim)
+    logger.info(f"🧮 Encoding {len(phrases)} intent phrases with {model}...")
+    embeddings = normalize(encode(phrases))
+    projection = None
+    if dim:
+        embeddings, projection = reduce_bank(embeddings, dim)
+    offsets, centroids = compile_bank(embeddings.astype(np.float32), label_ids, len(names))
+
+    os.makedirs(settings.NLU_CACHE_DIR, exist_ok=True)
+    # Write next to the final location and rename, so readers never see half an artifact
+    tmp = tempfile.mkdtemp(prefix="." + PREFIX, dir=settings.NLU_CACHE_DIR)
+    np.save(os.path.join(tmp, "embeddings.npy"), embeddings)
+    np.save(os.path.join(tmp, "labels.npy"), label_ids)
+    np.save(os.path.join(tmp, "offsets.npy"), offsets)
+    np.save(os.path.join(tmp, "centroids.npy"), centroids)
+    if projection is not None:
+        np.save(os.path.join(tmp, "projection_mean.npy"), projection[0])
+        np.save(os.path.join(tmp, "projection.npy"), projection[1])
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump({"format": FORMAT_VERSION, "model": model, "revision": revision, "dim": dim,
+                   "intents_path": os.path.abspath(intents_path), "intents_sha256": file_hash(intents_path),
+                   "intents": names, "phrases": len(phrases)}, f, indent=2)
+    path = artifact_dir(key)
+    if force and os.path.isdir(path):
+        # Move the old artifact aside first: rename() won't replace a non-empty directory
+        old = tempfile.mkdtemp(prefix="." + PREFIX, dir=settings.NLU_CACHE_DIR)
+        os.rename(path, os.path.join(old, "artifact"))
+        shutil.rmtree(old, ignore_errors=True)
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)  # built concurrently by another process
+        if force or not os.path.isdir(path):
+            raise
+    _prune(intents_path, model)
+    return path
+
+
+def _prune(intents_path, model):
+    """
+    Delete artifacts of an older format, and those built by `model` from an
+    earlier version of `intents_path`. Banks for other models or PCA dims
+    stay, so switching back to them doesn't re-encode every phrase.
+    """
+    current = file_hash(intents_path)
+    for entry in os.scandir(settings.NLU_CACHE_DIR):
+        if not entry.name.startswith(PREFIX):
+            continue
+        try:
+            with open(os.path.join(entry.path, "meta.json"), "r") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        stale = (meta.get("intents_path") == os.path.abspath(intents_path) and meta.get("model") == model
+                 and meta.get("intents_sha256") != current)
+        if meta.get("format") != FORMAT_VERSION or stale:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def load(path, k=None):
+    """Return the IntentBank stored in an artifact, its embeddings memory-mapped."""
+    with open(os.path.join(path, "meta.json"), "r") as f:
+        meta = json.load(f)
+    embeddings = np.load(os.path.join(path, "embeddings.npy"), mmap_mode="r")
+    label_ids = np.load(os.path.join(path, "labels.npy"))
+    offsets = np.load(os.path.join(path, "offsets.npy"))
+    centroids = np.load(os.path.join(path, "centroids.npy"))
+    projection = None
+    if os.path.exists(os.path.join(path, "projection.npy")):
+        projection = (np.load(os.path.join(path, "projection_mean.npy")), np.load(os.path.join(path, "projection.npy")))
+    if meta.get("format") != FORMAT_VERSION or not len(embeddings) == len(label_ids) == meta["phrases"]:
+        raise ValueError("inconsistent intent cache")
+    return IntentBank(embeddings, label_ids, meta["intents"], offsets, centroids,
+                      k=settings.INTENT_PREFILTER_K if k is None else k, projection=projection)
+
+
+def load_or_build(intents_path, encode, model, revision=None, k=None, dim=0):
+    """Load the intent bank for the current intents.json and model, building it first if needed."""
+    path = artifact_dir(cache_key(intents_path, model, revision, dim))
+    if os.path.isdir(path):
+        try:
+            return load(path, k)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ Rebuilding unreadable intent cache {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+    return load(build(intents_path, encode, model, revision, dim), k)
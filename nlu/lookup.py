@@ -0,0 +1,85 @@
+"""
+Shortcuts in front of the semantic intent search.
+
+Many commands are literal phrases from intents.json ("yes", "stop the music",
+"power off"). PhraseIndex maps every normalized phrase to its intent, so those
+are answered by a dictionary lookup instead of a transformer forward pass.
+Other queries repeat across turns; QueryCache keeps the most recent results.
+Both count their hits so the hit rate can be checked in practice.
+"""
+import string
+import threading
+from collections import OrderedDict
+
+_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def normalize_phrase(text):
+    """Lowercase, strip punctuation and collapse whitespace, as utils.clean_input does."""
+    return " ".join(text.translate(_PUNCTUATION).lower().split())
+
+
+class PhraseIndex:
+    """Exact lookup from normalized phrase to intent."""
+
+    def __init__(self, intents):
+        index, ambiguous = {}, set()
+        for intent, phrases in intents.items():
+            for phrase in phrases:
+                key = normalize_phrase(phrase)
+                if index.setdefault(key, intent) != intent:
+                    ambiguous.add(key)
+        # A phrase listed under two intents is left to the semantic search
+        for key in ambiguous:
+            del index[key]
+        self._index = index
+        self.hits = 0
+        self.lookups = 0
+
+    def __len__(self):
+        return len(self._index)
+
+    def lookup(self, text):
+        """Return the intent whose phrase `text` is, or None."""
+        self.lookups += 1
+        intent = self._index.get(normalize_phrase(text))
+        if intent is not None:
+            self.hits += 1
+        return intent
+
+
+class QueryCache:
+    """Thread-safe LRU cache with hit and miss counters."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
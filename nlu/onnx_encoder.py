@@ -0,0 +1,149 @@
+"""
+ONNX Runtime backend for the sentence embedder.
+
+SentenceTransformer.encode() drags PyTorch into the process and has a high
+fixed cost per call, which dominates when embedding one short command on a
+CPU. With INTENT_ENCODER = "onnx" the transformer runs instead as an ONNX
+graph with dynamically quantized int8 weights, tokenized by the Rust
+`tokenizers` library; mean pooling and normalization, the rest of the MiniLM
+pipeline, are done in NumPy.
+
+The graph is exported once per model and revision into NLU_CACHE_DIR by
+`jarvis-prebuild`, which needs torch and sentence-transformers; at runtime
+only onnxruntime and tokenizers are imported. Embeddings stay within a small
+cosine distance of the PyTorch ones (see tests/test_nlu.py), but cached
+artifacts are keyed by encoder so the two are never mixed.
+"""
+import os
+import re
+import json
+import shutil
+import logging
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+
+from nlu import settings
+
+logger = logging.getLogger("OnnxEncoder")
+
+MODEL_FILE = "model_int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+TOKEN_CACHE_SIZE = 1024  # tokenized texts kept; commands repeat a lot
+BATCH_SIZE = 64
+
+
+def model_dir(model=None, revision=None):
+    model = model or settings.INTENT_MODEL
+    revision = revision or settings.INTENT_MODEL_REVISION or "main"
+    return os.path.join(settings.NLU_CACHE_DIR, "onnx-" + re.sub(r"[^\w.-]+", "_", f"{model}-{revision}"))
+
+
+def export(model=None, revision=None):
+    """Export the sentence-transformers model to an int8 ONNX graph plus tokenizer. Returns the directory."""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from nlu.embeddings import load_model
+
+    path = model_dir(model, revision)
+    sentence_model = load_model(model, revision)
+    transformer, tokenizer = sentence_model[0].auto_model, sentence_model[0].tokenizer
+    logger.info(f"📦 Exporting {model or settings.INTENT_MODEL} to ONNX int8...")
+
+    class _HiddenStates(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.transformer = transformer
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.transformer(input_ids=input_ids, attention_mask=attention_mask,
+                                    token_type_ids=token_type_ids)[0]
+
+    os.makedirs(settings.NLU_CACHE_DIR, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".onnx-", dir=settings.NLU_CACHE_DIR)
+    try:
+        names = ["input_ids", "attention_mask", "token_type_ids"]
+        sample = tokenizer(["turn on the lights"], return_tensors="pt", return_token_type_ids=True)
+        fp32_path = os.path.join(tmp, "model.onnx")
+        with torch.no_grad():
+            torch.onnx.export(_HiddenStates().eval(), tuple(sample[name] for name in names), fp32_path,
+                              input_names=names, output_names=["last_hidden_state"],
+                              dynamic_axes={name: {0: "batch", 1: "sequence"} for name in names + ["last_hidden_state"]},
+                              opset_version=14)
+        quantize_dynamic(fp32_path, os.path.join(tmp, MODEL_FILE), weight_type=QuantType.QInt8)
+        os.remove(fp32_path)
+        tokenizer.backend_tokenizer.save(os.path.join(tmp, TOKENIZER_FILE))
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump({"model": model or settings.INTENT_MODEL, "revision": revision,
+                       "max_seq_length": sentence_model.max_seq_length}, f, indent=2)
+        shutil.rmtree(path, ignore_errors=True)
+        os.rename(tmp, path)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return path
+
+
+def mean_pool(hidden_states, attention_mask):
+    """Average the token vectors of each row, ignoring padding."""
+    mask = attention_mask[..., None].astype(hidden_states.dtype)
+    return (hidden_states * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+
+class OnnxEncoder:
+    """Drop-in for SentenceTransformer.encode() backed by onnxruntime."""
+
+    def __init__(self, path):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(path, "meta.json"), "r") as f:
+            meta = json.load(f)
+        self.session = onnxruntime.InferenceSession(os.path.join(path, MODEL_FILE),
+                                                    providers=["CPUExecutionProvider"])
+        self.input_names = {node.name for node in self.session.get_inputs()}
+        self.dimension = self.session.get_outputs()[0].shape[-1]
+        self.tokenizer = Tokenizer.from_file(os.path.join(path, TOKENIZER_FILE))
+        self.tokenizer.no_padding()
+        self.tokenizer.enable_truncation(meta["max_seq_length"])
+        self._token_ids = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._tokenize)
+        # Uncased tokenizers (MiniLM's) lowercase in their normalizer
+        self.ignores_case = self._tokenize("Hello") == self._tokenize("hello")
+
+    @classmethod
+    def load(cls, model=None, revision=None):
+        """Load the exported model, exporting it first if this is the first use."""
+        path = model_dir(model, revision)
+        if not os.path.exists(os.path.join(path, MODEL_FILE)):
+            path = export(model, revision)
+        return cls(path)
+
+    def _tokenize(self, text):
+        return tuple(self.tokenizer.encode(text).ids)
+
+    def encode(self, texts, batch_size=BATCH_SIZE):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        token_ids = [self._token_ids(text) for text in texts]
+        # Batch texts of similar length together to keep padding short
+        order = sorted(range(len(texts)), key=lambda i: len(token_ids[i]))
+        batches = []
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            length = max(len(token_ids[i]) for i in rows)
+            input_ids = np.zeros((len(rows), length), dtype=np.int64)
+            attention_mask = np.zeros((len(rows), length), dtype=np.int64)
+            for row, i in enumerate(rows):
+                input_ids[row, :len(token_ids[i])] = token_ids[i]
+                attention_mask[row, :len(token_ids[i])] = 1
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask,
+                     "token_type_ids": np.zeros_like(input_ids)}
+            hidden_states = self.session.run(None, {name: feeds[name] for name in self.input_names})[0]
+            batches.append(mean_pool(hidden_states, attention_mask))
+        embeddings = np.empty((len(texts), batches[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(batches)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.maximum(norms, 1e-12)
+        return embeddings[0] if single else embeddings
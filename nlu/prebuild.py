@@ -0,0 +1,49 @@
+"""
+Precompute the NLU artifacts the assistant loads at startup.
+
+    jarvis-prebuild           # build whatever is missing or stale
+    jarvis-prebuild --force   # rebuild everything
+
+Run by install.sh after the Python dependencies are installed; the assistant
+also builds missing artifacts on first start, just more slowly.
+"""
+import os
+import argparse
+import logging
+
+from nlu import settings
+from nlu import embeddings
+from nlu import code_classifier
+from nlu.onnx_encoder import export, model_dir
+from nlu.intent_cache import INTENTS_PATH, artifact_dir, build, cache_key
+
+logger = logging.getLogger("NLUPrebuild")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="jarvis-prebuild", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild artifacts that are up to date")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    model, revision = embeddings.model_id(), settings.INTENT_MODEL_REVISION
+    if settings.INTENT_ENCODER == embeddings.ENCODER_ONNX:
+        path = model_dir()
+        if args.force or not os.path.isdir(path):
+            path = export()
+        print(f"ONNX encoder: {path}")
+
+    path = artifact_dir(cache_key(INTENTS_PATH, model, revision, settings.INTENT_PCA_DIM))
+    if args.force or not os.path.isdir(path):
+        path = build(INTENTS_PATH, embeddings.encode, model, revision, settings.INTENT_PCA_DIM, force=args.force)
+    print(f"Intent embeddings: {path}")
+
+    path = code_classifier.weights_path(code_classifier.cache_key(code_classifier.EXAMPLES_PATH, model, revision))
+    if args.force or not os.path.exists(path):
+        path = code_classifier.train(code_classifier.EXAMPLES_PATH, embeddings.encode, model, revision)
+    print(f"Code-worthiness weights: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
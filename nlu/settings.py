@@ -0,0 +1,40 @@
+"""
+Tunable settings for intent classification.
+
+Every value can be overridden by defining the same name in config.py, like the
+speech settings in asr/settings.py.
+"""
+import os
+
+try:
+    import config
+except ImportError:
+    config = None
+
+
+def setting(name, default):
+    return getattr(config, name, default)
+
+
+# Sentence-embedding model for intent matching; the revision pins a Hugging Face commit
+INTENT_MODEL = setting("INTENT_MODEL", "all-MiniLM-L6-v2")
+INTENT_MODEL_REVISION = setting("INTENT_MODEL_REVISION", None)
+
+# How the embedding model runs: "sentence-transformers" (PyTorch) or "onnx"
+# (int8 onnxruntime, see nlu/onnx_encoder.py)
+INTENT_ENCODER = setting("INTENT_ENCODER", "sentence-transformers")
+
+# Intents whose phrases are reranked after the prototype prefilter. 0 scans every
+# phrase, which is still the fastest for a few thousand phrases; check the
+# accuracy of a prefilter with `jarvis-bench intents` before enabling it
+INTENT_PREFILTER_K = setting("INTENT_PREFILTER_K", 0)
+
+# Reduce intent embeddings to this many PCA dimensions, stored as float16 (0 keeps
+# the full embeddings); `jarvis-bench intents --pca` reports the accuracy cost
+INTENT_PCA_DIM = setting("INTENT_PCA_DIM", 0)
+
+# Recent detect_intent() results kept per query text (0 disables the cache)
+INTENT_QUERY_CACHE_SIZE = setting("INTENT_QUERY_CACHE_SIZE", 256)
+
+# Precomputed phrase embeddings and other NLU artifacts
+NLU_CACHE_DIR = os.path.expanduser(setting("NLU_CACHE_DIR", os.path.join("~", ".cache", "jarvis")))
@@ -55,10 +55,19 @@ setup(
             "sphinx>=4.0",
             "sphinx-rtd-theme>=1.0",
         ],
+        "fast-asr": [
+            "faster-whisper>=1.0.0",
+        ],
+        "fast-nlu": [
+            "onnxruntime>=1.15.0",
+            "tokenizers>=0.13.0",
+        ],
     },
     entry_points={
         "console_scripts": [
             "jarvis=main:main",
+            "jarvis-bench=asr.bench:main",
+            "jarvis-prebuild=nlu.prebuild:main",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,598 @@
+"""
+Unit tests for the speech pipeline helpers in asr/.
+These run without a microphone or any ASR model.
+"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asr.audio import pcm16_to_float32, duration_seconds
+
+
+def test_pcm16_to_float32_normalizes():
+    pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16).tobytes()
+    audio = pcm16_to_float32(pcm)
+    assert audio.dtype == np.float32
+    assert audio.tolist()[:3] == [0.0, 0.5, -1.0]
+    assert audio[3] < 1.0
+
+
+def test_pcm16_to_float32_reuses_output_buffer():
+    pcm = bytearray(np.arange(8, dtype=np.int16).tobytes())
+    out = np.empty(8, dtype=np.float32)
+    assert pcm16_to_float32(pcm, out=out) is out
+
+
+def test_duration_seconds():
+    assert duration_seconds(b"\x00" * 32000) == 1.0
+
+
+def _pcm(values):
+    return np.asarray(values, dtype=np.int16).tobytes()
+
+
+def test_ring_buffer_wraps_and_keeps_absolute_positions():
+    from asr.capture import RingBuffer
+    ring = RingBuffer(4)
+    ring.write(_pcm([1, 2, 3]))
+    ring.write(_pcm([4, 5, 6]))
+    assert ring.write_pos == 6
+    assert ring.oldest_pos == 2
+    start, pcm = ring.read(2, 10)
+    assert start == 2
+    assert np.frombuffer(pcm, dtype=np.int16).tolist() == [3, 4, 5, 6]
+
+
+def test_ring_buffer_read_skips_overwritten_samples():
+    from asr.capture import RingBuffer
+    ring = RingBuffer(4)
+    ring.write(_pcm(range(10)))
+    start, pcm = ring.read(0, 2)
+    assert start == 6
+    assert np.frombuffer(pcm, dtype=np.int16).tolist() == [6, 7]
+
+
+def test_cursor_preroll_does_not_replay_consumed_audio():
+    from asr.capture import CaptureService
+    service = CaptureService(ring_seconds=1)
+    service.ring.write(_pcm([0] * 8000))
+    with service.cursor(preroll_ms=250) as cursor:
+        assert cursor.position == 4000
+        assert len(cursor.read(2000)) == 4000
+    cursor = service.cursor(preroll_ms=250)
+    assert cursor.position == 6000
+    assert len(cursor.read(2000)) == 4000
+    assert cursor.read(10, timeout=0.01) == b""
+
+
+def _scripted_endpointer(**kwargs):
+    """Endpointer whose VAD decision is read from each frame's first sample."""
+    pytest.importorskip("webrtcvad")
+    from asr.vad import Endpointer
+
+    endpointer = Endpointer(**kwargs)
+    endpointer.is_speech = lambda frame: np.frombuffer(frame[:2], dtype=np.int16)[0] != 0
+    return endpointer
+
+
+def _frames(pattern):
+    from asr.vad import FRAME_BYTES
+    return b"".join((b"\x01\x00" if voiced else b"\x00\x00") * (FRAME_BYTES // 2) for voiced in pattern)
+
+
+def test_endpointer_drops_leading_silence_and_trims_tail():
+    from asr.vad import FRAME_BYTES
+    endpointer = _scripted_endpointer(hangover_ms=150, padding_ms=60, start_ms=60)
+    assert endpointer.feed(_frames([0] * 10)) == b""
+    assert not endpointer.triggered
+
+    endpointer.feed(_frames([1] * 6 + [0] * 10))
+    assert endpointer.ended
+    # 2 frames of leading padding, 6 voiced frames, 2 frames of trailing padding
+    assert len(endpointer.utterance()) == 10 * FRAME_BYTES
+
+
+def test_endpointer_ignores_short_blips():
+    endpointer = _scripted_endpointer(hangover_ms=90, start_ms=30, min_speech_ms=150)
+    endpointer.feed(_frames([1] + [0] * 5))
+    assert endpointer.ended
+    assert not endpointer.has_speech
+
+
+def test_word_confidence_uses_weakest_word():
+    from asr.routing import word_confidence
+    result = {"text": "stop the music", "result": [{"conf": 0.99}, {"conf": 0.8}, {"conf": 1.0}]}
+    assert word_confidence(result) == 0.8
+    assert word_confidence({"text": ""}) == 0.0
+
+
+def test_vosk_is_enough_requires_confident_known_command():
+    from asr.routing import vosk_is_enough
+    detect = lambda text: ("stop_music", 0.9) if text == "stop the music" else (None, 0.3)
+    assert vosk_is_enough("stop the music", 0.95, detect)[0]
+    assert not vosk_is_enough("stop the music", 0.5, detect)[0]
+    assert not vosk_is_enough("what is the meaning of life", 0.95, detect)[0]
+    assert not vosk_is_enough("write an email to my boss about the meeting", 0.95, detect)[0]
+
+
+def test_wav_file_source_resamples_and_pads(tmp_path):
+    import wave
+    from asr.sources import WavFileSource
+
+    path = str(tmp_path / "clip.wav")
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(np.full(8000 * 2, 1000, dtype=np.int16).tobytes())
+
+    source = WavFileSource(path, tail_silence_ms=500)
+    assert source.duration_seconds == 1.5
+    first = np.frombuffer(source.read(16000), dtype=np.int16)
+    assert len(first) == 16000 and first[100] == 1000
+    assert len(source.read(16000)) == 8000 * 2
+    assert source.read(16000) == b""
+
+
+class _ScriptedBackend:
+    """Backend that 'hears' one word per second of audio from a fixed script."""
+
+    def __init__(self, script):
+        self.script = script.split()
+        self.heard = 0
+        self.calls = 0
+
+    def transcribe_words(self, audio, language="en", prompt=None):
+        self.calls += 1
+        offset = self.heard
+        words = []
+        for i in range(int(len(audio) / 16000)):
+            words.append((self.script[offset + i], float(i), float(i + 1)))
+        return words
+
+
+def test_agreed_prefix_ignores_case_and_punctuation():
+    from asr.streaming import agreed_prefix
+    previous = [("Send", 0, 1), ("the", 1, 2), ("report", 2, 3)]
+    current = [("send", 0, 1), ("the", 1, 2), ("reports,", 2, 3)]
+    assert agreed_prefix(previous, current) == 2
+
+
+def test_streaming_transcriber_commits_agreed_words_and_trims_window():
+    from asr.streaming import StreamingTranscriber
+    backend = _ScriptedBackend("please write down that the meeting moved to friday")
+    streamer = StreamingTranscriber(backend, step_seconds=1.0, min_seconds=1.0)
+    streamer.cancel()
+    second = b"\x00\x00" * 16000
+
+    streamer._window += second * 2
+    streamer._step(bytes(streamer._window))
+    assert streamer.committed == []
+    streamer._window += second
+    streamer._step(bytes(streamer._window))
+    assert streamer.committed == ["please", "write"]
+    assert len(streamer._window) == len(second)
+
+
+def test_worker_queue_source_drops_stale_blocks_and_rechunks():
+    import queue
+    from asr.worker import QueueSource
+    inbox = queue.Queue()
+    inbox.put((1, b"\x01\x00" * 4))  # left over from the previous request
+    inbox.put((2, b"\x02\x00" * 3))
+    inbox.put((2, b"\x03\x00" * 3))
+    source = QueueSource(inbox, request_id=2)
+    assert source.read(4) == b"\x02\x00" * 3 + b"\x03\x00"
+    assert source.read(2) == b"\x03\x00" * 2
+
+
+def test_worker_queue_source_ends_at_a_newer_request_and_keeps_its_block():
+    from asr.worker import Inbox, QueueSource
+    inbox = Inbox()
+    inbox.put((1, b"\x01\x00" * 2))
+    inbox.put((2, b"\x02\x00" * 2))  # request 1 was abandoned by the parent
+    first = QueueSource(inbox, request_id=1)
+    assert first.read(4) == b"\x01\x00" * 2
+    assert first.read(4) == b""
+    assert QueueSource(inbox, request_id=2).read(2) == b"\x02\x00" * 2
+
+
+def test_worker_queue_source_ends_when_the_parent_is_gone():
+    from asr.worker import Inbox, QueueSource
+    inbox = Inbox()
+    inbox.put((1, b"\x01\x00"))
+    inbox.close()  # the audio connection reached EOF
+    assert QueueSource(inbox, request_id=1).read(4) == b"\x01\x00"
+    assert QueueSource(inbox, request_id=2).read(4) == b""  # no wait for audio that can't come
+    assert inbox.closed
+
+
+def test_model_registry_evicts_least_recently_used_over_budget():
+    pytest.importorskip("vosk")
+    pytest.importorskip("psutil")
+    from asr.model_registry import ModelRegistry
+    registry = ModelRegistry(memory_budget_bytes=250)
+    sizes = {}
+
+    def load(key, size):
+        sizes[key] = size
+        model = registry._get_or_load(key, lambda: object())
+        registry._stats[key]["rss_bytes"] = size  # measured RSS is noisy in tests
+        registry._enforce_budget(keep=key)
+        return model
+
+    load(("vosk", "small", "en"), 100)
+    load(("vosk", "small", "hi"), 100)
+    registry._get_or_load(("vosk", "small", "en"), None)  # touch en, hi is now least recent
+    load(("vosk", "small", "fr"), 100)
+    resident = {key[2] for key in registry._models}
+    assert resident == {"en", "fr"}
+    assert registry.stats()["evictions"] == 1
+
+
+def test_select_sizes_picks_largest_size_within_each_budget():
+    pytest.importorskip("vosk")
+    from asr.calibration import select_sizes
+    rtfs = {"tiny": 0.05, "base": 0.2, "small": 0.6}
+    budgets = {"command": 1.0, "dictation": 3.0, "reply": 0.05}
+    turn_seconds = {"command": 3.0, "dictation": 4.0, "reply": 1.5}
+    assert select_sizes(rtfs, budgets, turn_seconds) == {"command": "base", "dictation": "small", "reply": "tiny"}
+
+
+def test_raw_pcm_input_feeds_capture_until_end_of_stream():
+    import io
+    from asr.capture import CaptureService
+    from asr.sources import RawPCMInput
+    pcm = np.arange(2500, dtype=np.int16).tobytes() + b"\x01"  # odd trailing byte is dropped
+    service = CaptureService(blocksize=1000, audio_input=RawPCMInput(io.BytesIO(pcm), speed=0))
+    service.start()
+    cursor = service.cursor(preroll_ms=0)
+    cursor.position = 0
+    assert cursor.read(2000, timeout=2) == pcm[:4000]
+    assert cursor.read(1000, timeout=2) == pcm[4000:5000]
+    assert cursor.read(1000, timeout=2) == b""
+    assert service.ended
+
+
+def test_open_audio_input_rejects_unknown_spec():
+    from asr.sources import open_audio_input, UnixSocketInput
+    assert isinstance(open_audio_input("unix:/tmp/jarvis.sock"), UnixSocketInput)
+    with pytest.raises(ValueError):
+        open_audio_input("wav:")
+
+
+def test_capture_suppresses_and_tags_playback():
+    from asr.capture import CaptureService, EchoSuppressor, GATING_SUPPRESS
+    service = CaptureService(gating=GATING_SUPPRESS, playback_tail_ms=0)
+    loud = (np.ones(800, dtype=np.int16) * 1000).tobytes()
+
+    service.ring.write(service._gate(loud))
+    with service.playback():
+        service.ring.write(service._gate(loud))
+    service.ring.write(service._gate(loud))
+
+    _, pcm = service.ring.read(0, 2400)
+    assert pcm == loud + bytes(len(loud)) + loud
+    assert service.playback_fraction(0, 2400) == pytest.approx(1 / 3)
+
+    suppressor = EchoSuppressor(ratio=3.0)
+    for _ in range(EchoSuppressor.WARMUP_BLOCKS):
+        assert not suppressor.passes(loud)
+    assert suppressor.passes((np.ones(800, dtype=np.int16) * 5000).tobytes())
+
+
+def test_find_stop_phrase_only_matches_at_the_end():
+    pytest.importorskip("vosk")
+    from asr.dictation import find_stop_phrase
+    phrases = ("stop dictation", "end of note")
+    assert find_stop_phrase("buy milk stop dictation".split(), phrases) == 2
+    assert find_stop_phrase("Stop dictation".split(), phrases) == 0
+    assert find_stop_phrase("stop dictation is a phrase".split(), phrases) is None
+
+
+def test_utterance_archive_writes_metadata_and_caps_size(tmp_path):
+    import json
+    import shutil
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg is not installed")
+    from asr.archive import UtteranceArchive
+    archive = UtteranceArchive(str(tmp_path), max_bytes=60_000)
+    # Noise barely compresses, so four seconds are well over the cap
+    speech = np.random.default_rng(0).integers(-8000, 8000, 16000, dtype=np.int16).tobytes()
+
+    records = [archive.submit(speech, {"text": f"utterance {i}"}) for i in range(4)]
+    records[-1].annotate(intent="play_music")
+    archive.flush()
+
+    assert os.path.exists(records[-1].audio_path)
+    assert not os.path.exists(records[0].audio_path)
+    assert sum(entry.stat().st_size for entry in os.scandir(tmp_path)) <= 60_000
+    with open(records[-1].metadata_path) as f:
+        assert json.load(f)["intent"] == "play_music"
+
+
+def test_utterance_archive_only_prunes_its_own_files_in_pairs(tmp_path):
+    from asr.archive import UtteranceArchive
+    archive = UtteranceArchive(str(tmp_path), max_bytes=2_000)
+    (tmp_path / "calibration.json").write_bytes(b"x" * 5_000)  # another cache sharing the directory
+    for stem, audio_size in (("20250101-120000-000001", 900), ("20250101-120001-000002", 900),
+                             ("20250101-120002-000003", 900)):
+        (tmp_path / f"{stem}.flac").write_bytes(b"x" * audio_size)
+        (tmp_path / f"{stem}.json").write_bytes(b"x" * 50)
+
+    archive._enforce_limit()
+    assert sorted(os.listdir(tmp_path)) == ["20250101-120001-000002.flac", "20250101-120001-000002.json",
+                                            "20250101-120002-000003.flac", "20250101-120002-000003.json",
+                                            "calibration.json"]
+
+
+class _InlinePool:
+    """Executor stand-in: runs calls at once, except `deferred` ones, which stay pending."""
+
+    def __init__(self, deferred=()):
+        self.deferred = deferred
+        self.futures = []
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        future = Future()
+        self.futures.append(future)
+        if fn not in self.deferred:
+            future.set_result(fn(*args))
+        return future
+
+
+def test_intent_speculation_reuses_or_discards_the_vosk_guess(monkeypatch):
+    utils = pytest.importorskip("utils")
+    intents = {"play some music": ("play_music", 0.9), "play some music please": ("play_music", 0.85),
+               "stop the music": ("stop_music", 0.8)}
+    classified = []
+
+    def detect(text):
+        classified.append(text)
+        return intents.get(text, (None, 0.0))
+
+    def fetch_playlist():
+        return "playlist"
+
+    pool = _InlinePool(deferred=(fetch_playlist,))
+    monkeypatch.setattr(utils, "detect_intent", detect)
+    monkeypatch.setattr(utils, "_speculation_pool", pool)
+
+    def speculate(hypothesis):
+        speculation = utils._IntentSpeculation({"play_music": fetch_playlist})
+        speculation.on_hypothesis(hypothesis)
+        return speculation
+
+    # Whisper only changed case and punctuation: the speculative intent is reused as is
+    text, intent, confidence, prefetched = speculate("play some music").resolve("Play some music.")
+    assert (text, intent, confidence) == ("Play some music.", "play_music", 0.9)
+    assert prefetched is pool.futures[-1] and not prefetched.cancelled()
+    assert classified == ["play some music"]
+
+    # A different text with the same intent keeps the prefetch
+    _, intent, confidence, prefetched = speculate("play some music").resolve("Play some music please")
+    assert (intent, confidence) == ("play_music", 0.85)
+    assert prefetched is pool.futures[-1] and not prefetched.cancelled()
+
+    # Whisper disagrees: the prefetch is cancelled and dropped
+    _, intent, _, prefetched = speculate("play some music").resolve("Stop the music")
+    assert intent == "stop_music" and prefetched is None
+    assert pool.futures[-1].cancelled()
+
+    # Nothing heard
+    assert speculate("play some music").resolve("") == ("", None, 0.0, None)
+    assert utils._IntentSpeculation().resolve(None) == (None, None, 0.0, None)
+
+
+def test_wake_word_detector_matches_normalized_wake_phrases(tmp_path, monkeypatch):
+    pytest.importorskip("vosk")
+    import json
+    from asr import wake_word
+    assert wake_word.grammar_phrase("Hey, are you there?") == "hey are you there"
+    assert wake_word.grammar_phrase("  It's time to WAKE up!! ") == "it's time to wake up"
+    path = tmp_path / "intents.json"
+    path.write_text(json.dumps({"wake_up": ["Wake up!", "wake up", "Hey, Jarvis", "?!"], "greet": ["hi"]}))
+    assert wake_word.load_wake_phrases(str(path)) == ["hey jarvis", "wake up"]
+
+    class FakeRecognizer:
+        def __init__(self, results):
+            self.results = list(results)
+            self.audio = b""
+
+        def AcceptWaveform(self, pcm):
+            self.audio += pcm
+
+        def FinalResult(self):
+            return json.dumps({"text": self.results.pop(0)})
+
+        def Reset(self):
+            self.audio = b""
+
+    class ScriptedEndpointer:
+        """Returns the scripted (speech, ended) pair for each fed block."""
+
+        def __init__(self, script):
+            self.script = list(script)
+            self.ended = False
+
+        def feed(self, pcm):
+            speech, self.ended = self.script.pop(0)
+            return speech
+
+        def reset(self):
+            self.ended = False
+
+    recognizer = FakeRecognizer(["[unk] wake up", "[unk]", "wake up [unk]", "[unk] hey jarvis [unk]",
+                                 "[unk] [unk] wake up"])
+    grammars = []
+
+    def vosk_recognizer(language, words=True, grammar=None):
+        grammars.append(grammar)
+        return recognizer
+
+    monkeypatch.setattr(wake_word.registry, "vosk_recognizer", vosk_recognizer)
+    detector = wake_word.WakeWordDetector(phrases=wake_word.load_wake_phrases(str(path)))
+    assert grammars == [["hey jarvis", "wake up", wake_word.UNKNOWN]]
+    detector.endpointer = ScriptedEndpointer([(b"\x01\x00", False), (b"\x02\x00", True),
+                                              (b"\x03\x00", True), (b"\x04\x00", True),
+                                              (b"\x05\x00", True), (b"\x06\x00", True)])
+
+    assert detector.accept(b"block") is None  # still speaking
+    assert recognizer.audio == b"\x01\x00"
+    assert detector.accept(b"block") == "wake up"  # one leading noise token is tolerated
+    assert recognizer.audio == b""  # reset for the next utterance
+    assert detector.accept(b"block") is None  # only unknown speech
+    assert detector.accept(b"block") is None  # a wake phrase followed by more words
+    assert detector.accept(b"block") is None  # a wake phrase inside a sentence
+    assert detector.accept(b"block") is None  # more than one word before it
+
+
+def test_backends_share_the_transcribe_contract(monkeypatch):
+    import json
+    import types
+    from asr.backends import FasterWhisperBackend, VoskBackend, WhisperBackend
+    seen = []
+
+    class FakeWhisperModel:
+        def transcribe(self, audio, language=None, **options):
+            seen.append((audio.dtype, len(audio), language))
+            words = [{"word": " hello", "start": 0.0, "end": 0.4}] if len(audio) else []
+            return {"text": " Hello." if len(audio) else "", "segments": [{"words": words}]}
+
+    class FakeFasterWhisperModel:
+        def __init__(self, size, device, compute_type, cpu_threads):
+            pass
+
+        def transcribe(self, audio, language=None, **options):
+            seen.append((audio.dtype, len(audio), language))
+            word = types.SimpleNamespace(word=" hello", start=0.0, end=0.4)
+            segments = [types.SimpleNamespace(text=" Hello. ", words=[word])] if len(audio) else []
+            return iter(segments), None
+
+    class FakeRecognizer:
+        def __init__(self, language):
+            seen.append(("vosk", language))
+            self.pcm = b""
+
+        def AcceptWaveform(self, pcm):
+            self.pcm += pcm
+
+        def FinalResult(self):
+            samples = np.frombuffer(self.pcm, dtype=np.int16)
+            if not len(samples):
+                return json.dumps({"text": ""})
+            assert samples.max() == 16384  # float32 [-1, 1) scaled back to int16
+            return json.dumps({"text": "hello", "result": [{"word": "hello", "start": 0.0, "end": 0.4}]})
+
+    monkeypatch.setitem(sys.modules, "whisper", types.SimpleNamespace(load_model=lambda size: FakeWhisperModel()))
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=FakeFasterWhisperModel))
+    audio = np.full(1600, 0.5, dtype=np.float32)
+    silence = np.zeros(0, dtype=np.float32)
+
+    for backend in (WhisperBackend("tiny"), FasterWhisperBackend("tiny"),
+                    VoskBackend(recognizer_factory=FakeRecognizer)):
+        seen.clear()
+        assert backend.transcribe(audio, language="ne") in ("Hello.", "hello")
+        assert seen[-1][-1] == "ne"  # the language is passed through
+        if backend.refines:
+            assert seen[-1][:2] == (np.float32, 1600)
+        assert backend.transcribe_words(audio, language="ne") == [("hello", 0.0, 0.4)]
+        assert backend.transcribe(silence) == ""
+        assert backend.transcribe_words(silence) == []
+
+
+def test_dictation_ends_on_silence_and_cuts_the_stop_phrase(monkeypatch):
+    pytest.importorskip("vosk")
+    import json
+    from asr import dictation
+    from asr.pipeline import READ_BLOCK
+    vocabulary = {1: "buy", 2: "milk", 3: "stop", 4: "dictation"}
+
+    class Source:
+        """One READ_BLOCK per word (samples hold the word's id), then silence."""
+
+        def __init__(self, word_ids, silence_seconds):
+            self.pcm = b"".join(np.full(READ_BLOCK, i, dtype=np.int16).tobytes() for i in word_ids)
+            self.pcm += bytes(int(silence_seconds * 16000) * 2)
+            self.consumed = 0
+
+        def read(self, frames, timeout=None):
+            chunk = self.pcm[self.consumed:self.consumed + frames * 2]
+            self.consumed += len(chunk)
+            return chunk
+
+    class EnergyEndpointer:
+        """Non-zero blocks are speech; three silent blocks end the utterance."""
+
+        def __init__(self, **kwargs):
+            self.reset()
+
+        def reset(self):
+            self.triggered = self.ended = self.has_speech = False
+            self._speech, self._silent = bytearray(), 0
+
+        def feed(self, data):
+            if np.frombuffer(data, dtype=np.int16).any():
+                self.triggered = self.has_speech = True
+                self._silent = 0
+            elif not self.triggered:
+                return b""
+            else:
+                self._silent += 1
+                self.ended = self._silent >= 3 or not data
+            self._speech += data
+            return data
+
+        def utterance(self):
+            return bytes(self._speech)
+
+    class Recognizer:
+        def __init__(self):
+            self.pcm = b""
+
+        def AcceptWaveform(self, pcm):
+            self.pcm += pcm
+
+        def FinalResult(self):
+            blocks = np.frombuffer(self.pcm, dtype=np.int16).reshape(-1, READ_BLOCK)[:, 0]
+            return json.dumps({"result": [{"word": vocabulary[i], "start": n * 0.1, "end": n * 0.1 + 0.1}
+                                          for n, i in enumerate(blocks) if i]})
+
+    monkeypatch.setattr(dictation, "Endpointer", EnergyEndpointer)
+    monkeypatch.setattr(dictation.registry, "vosk_recognizer", lambda language: Recognizer())
+    monkeypatch.setattr(dictation.registry, "backend", lambda size, name=None: type("Vosk", (), {"refines": False})())
+
+    # Nothing said after the prompt: the pause ends dictation long before the input does
+    source = Source([], silence_seconds=60)
+    assert dictation.dictate(source, pause_seconds=1.0) is None
+    assert source.consumed <= 2 * 16000 * 2
+
+    chunks = []
+    result = dictation.dictate(Source([1, 2, 3, 4], silence_seconds=2), pause_seconds=1.0, on_text=chunks.append)
+    assert (result["text"], result["stop"]) == ("buy milk", "stop phrase")
+    assert chunks == ["buy milk"]
+
+
+def test_dictated_note_file_is_only_created_with_the_first_chunk(tmp_path, monkeypatch):
+    utils = pytest.importorskip("utils")
+    path = tmp_path / "notes" / "note_1.txt"
+
+    monkeypatch.setattr(utils, "dictate", lambda model, language="en", on_text=None: "")
+    assert utils._dictate_to_file(str(path), "tiny") == ""
+    assert not path.exists()
+
+    def dictate(model, language="en", on_text=None):
+        on_text("buy milk")
+        on_text("and eggs")
+        return "buy milk and eggs"
+
+    monkeypatch.setattr(utils, "dictate", dictate)
+    utils._dictate_to_file(str(path), "tiny")
+    assert path.read_text() == "buy milk and eggs"
@@ -0,0 +1,245 @@
+"""
+Unit tests for the intent-classification helpers in nlu/.
+These run without downloading any embedding model.
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlu import intent_cache
+
+
+def _fake_encode(texts):
+    # Deterministic stand-in for the sentence encoder: one dimension per letter
+    out = np.zeros((len(texts), 26), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for char in text:
+            if char.isalpha() and char.isascii():
+                out[row, ord(char) - ord("a")] += 1
+    return out + 0.01
+
+
+@pytest.fixture
+def intents_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(intent_cache.settings, "NLU_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "intents.json"
+    path.write_text(json.dumps({"play_music": ["Play some music", "start the music", "play some music!"],
+                                "greet": ["hello"]}))
+    return path
+
+
+def test_intent_cache_builds_once_and_memory_maps(intents_file):
+    calls = []
+
+    def encode(texts):
+        calls.append(texts)
+        return _fake_encode(texts)
+
+    bank = intent_cache.load_or_build(str(intents_file), encode, "fake")
+    assert calls == [["play some music", "start the music", "hello"]]  # duplicates collapsed
+    assert bank.names == ["play_music", "greet"] and bank.label_ids.tolist() == [0, 0, 1]
+    assert bank.offsets.tolist() == [0, 2, 3]
+    assert np.allclose(np.linalg.norm(bank.embeddings, axis=1), 1.0)
+
+    bank = intent_cache.load_or_build(str(intents_file), encode, "fake")
+    assert len(calls) == 1
+    assert isinstance(bank.embeddings, np.memmap)
+
+
+def test_intent_cache_forced_build_replaces_the_artifact(intents_file):
+    path = intent_cache.build(str(intents_file), _fake_encode, "fake")
+    rebuilt = intent_cache.build(str(intents_file), lambda texts: _fake_encode(texts)[:, ::-1], "fake", force=True)
+    assert rebuilt == path
+    assert np.allclose(intent_cache.load(path).embeddings, intent_cache.normalize(_fake_encode(
+        ["play some music", "start the music", "hello"])[:, ::-1]))
+
+
+def test_intent_cache_rebuilds_when_intents_or_model_change(intents_file):
+    first = intent_cache.artifact_dir(intent_cache.cache_key(str(intents_file), "fake"))
+    intent_cache.load_or_build(str(intents_file), _fake_encode, "fake")
+    assert intent_cache.cache_key(str(intents_file), "other") != intent_cache.cache_key(str(intents_file), "fake")
+    # Banks for other PCA dims and other models are kept side by side
+    reduced = intent_cache.build(str(intents_file), _fake_encode, "fake", dim=2)
+    other = intent_cache.build(str(intents_file), _fake_encode, "other")
+    assert os.path.exists(first) and os.path.exists(reduced)
+
+    intents_file.write_text(json.dumps({"greet": ["hello", "hi there"]}))
+    bank = intent_cache.load_or_build(str(intents_file), _fake_encode, "fake")
+    assert bank.names == ["greet"] and len(bank) == 2
+    # Stale artifacts of this model are pruned, whatever their dim
+    assert not os.path.exists(first) and not os.path.exists(reduced)
+    assert os.path.exists(other)
+
+
+def test_embed_memoizes_texts_within_a_turn(monkeypatch):
+    from nlu import embeddings
+    calls = []
+
+    def encode(texts):
+        calls.append(list(texts))
+        return embeddings.normalize(_fake_encode(texts))
+
+    monkeypatch.setattr(embeddings, "encode", encode)
+    # An uncased tokenizer: texts that only differ in case share an entry
+    monkeypatch.setattr(embeddings, "_ignores_case", True)
+    embeddings.new_turn()
+    first = embeddings.embed(["Play some music"])
+    again = embeddings.embed(["play some music ", "hello"])
+    assert calls == [["play some music"], ["hello"]]
+    assert np.array_equal(first[0], again[0])
+
+    # A cased model is keyed on the exact text
+    monkeypatch.setattr(embeddings, "_ignores_case", False)
+    embeddings.new_turn()
+    embeddings.embed(["Play some music", "play some music", "Play some music"])
+    assert calls[-1] == ["Play some music", "play some music"]
+
+    embeddings.new_turn()
+    embeddings.embed(["hello"])
+    assert calls[-1] == ["hello"]
+
+
+def test_logistic_fit_matches_scikit_learn():
+    linear_model = pytest.importorskip("sklearn.linear_model")
+    from nlu.code_classifier import fit_logistic, probability
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 16)).astype(np.float32)
+    y = (X[:, :3].sum(axis=1) + 0.5 * rng.normal(size=400) > 0).astype(float)
+
+    reference = linear_model.LogisticRegression(solver="newton-cg", tol=1e-8).fit(X, y)
+    coef, intercept = fit_logistic(X, y)
+    assert np.allclose(probability(X, coef, intercept), reference.predict_proba(X)[:, 1], atol=1e-4)
+
+
+def test_code_classifier_weights_are_trained_once(tmp_path, monkeypatch):
+    from nlu import code_classifier
+    monkeypatch.setattr(code_classifier.settings, "NLU_CACHE_DIR", str(tmp_path / "cache"))
+    examples = tmp_path / "codeworthy.json"
+    examples.write_text(json.dumps({"code": ["plot a sine wave", "parse a csv file"],
+                                    "chat": ["how are you", "tell me a joke"]}))
+    calls = []
+
+    def encode(texts):
+        calls.append(texts)
+        return _fake_encode(texts)
+
+    coef, intercept = code_classifier.load_or_train(str(examples), encode, "fake")
+    again = code_classifier.load_or_train(str(examples), encode, "fake")
+    assert len(calls) == 1
+    assert np.array_equal(coef, again[0]) and intercept == again[1]
+    scores = code_classifier.probability(_fake_encode(["plot a sine wave", "how are you"]), coef, intercept)
+    assert scores[0] > 0.5 > scores[1]
+
+
+def test_phrase_index_matches_normalized_phrases_only():
+    from nlu.lookup import PhraseIndex, normalize_phrase
+    assert normalize_phrase("  Play   some music! ") == "play some music"
+    index = PhraseIndex({"play_music": ["Play some music!"], "stop_music": ["stop the music", "yes"],
+                         "affirm": ["Yes."]})
+    assert index.lookup("play SOME music") == "play_music"
+    assert index.lookup("yes") is None  # listed under two intents
+    assert index.lookup("play some more music") is None
+    assert (index.hits, index.lookups) == (1, 3)
+
+
+def test_query_cache_evicts_least_recently_used():
+    from nlu.lookup import QueryCache
+    cache = QueryCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_intent_bank_prefilter_matches_brute_force_scan():
+    from nlu.embeddings import normalize
+    from nlu.intent_bank import IntentBank, compile_bank
+    rng = np.random.default_rng(0)
+    n_intents, per_intent, dim = 40, 30, 64
+    centers = normalize(rng.normal(size=(n_intents, dim)))
+    label_ids = np.repeat(np.arange(n_intents), per_intent).astype(np.int16)
+    phrases = normalize(centers[label_ids] + 0.1 * rng.normal(size=(len(label_ids), dim)))
+    bank = IntentBank(phrases, label_ids, [f"intent{i}" for i in range(n_intents)],
+                      *compile_bank(phrases, label_ids, n_intents), k=8)
+
+    queries = normalize(centers[rng.integers(0, n_intents, 500)] + 0.1 * rng.normal(size=(500, dim)))
+    for query in queries:
+        index, score = bank.search(query)
+        assert (index, score) == (bank.search(query, k=0)[0], pytest.approx(bank.search(query, k=0)[1]))
+
+
+def test_split_intents_holds_out_distinct_phrases():
+    from nlu.evaluate import split_intents
+    train, held_out = split_intents({"greet": ["hi", "Hi!", "hello", "hey", "good morning", "yo", "howdy"]}, every=3)
+    assert train == {"greet": ["hi", "hello", "good morning", "yo"]}
+    assert held_out == [("hey", "greet"), ("howdy", "greet")]
+
+
+def test_mean_pool_ignores_padding():
+    from nlu.onnx_encoder import mean_pool
+    hidden = np.array([[[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]]], dtype=np.float32)
+    assert mean_pool(hidden, np.array([[1, 1, 0]])).tolist() == [[2.0, 3.0]]
+
+
+@pytest.mark.slow
+def test_onnx_encoder_stays_close_to_pytorch(tmp_path, monkeypatch):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("torch")
+    pytest.importorskip("sentence_transformers")
+    from nlu import embeddings, onnx_encoder
+    monkeypatch.setattr(onnx_encoder.settings, "NLU_CACHE_DIR", str(tmp_path))
+    texts = ["play some music", "what's the weather like in Kathmandu tomorrow", "yes", "Shut down the computer!"]
+
+    reference = embeddings.normalize(embeddings.load_model().encode(texts))
+    quantized = embeddings.load_model(encoder=embeddings.ENCODER_ONNX).encode(texts)
+    cosines = (reference * quantized).sum(axis=1)
+    assert cosines.min() > 0.98
+
+
+def test_pca_bank_keeps_clustered_matches(intents_file):
+    from nlu.embeddings import normalize
+    from nlu.evaluate import build_bank
+    rng = np.random.default_rng(1)
+    n_intents, per_intent, dim = 20, 25, 384
+    # Embeddings that really live in a low-dimensional subspace, as sentence embeddings mostly do
+    basis = normalize(rng.normal(size=(24, dim)))
+    centers = rng.normal(size=(n_intents, 24))
+    label_ids = np.repeat(np.arange(n_intents), per_intent).astype(np.int16)
+    phrases = normalize((centers[label_ids] + 0.3 * rng.normal(size=(len(label_ids), 24))) @ basis)
+    full = build_bank(phrases, label_ids, [str(i) for i in range(n_intents)])
+    reduced = build_bank(phrases, label_ids, full.names, dim=32)
+    assert reduced.embeddings.shape == (len(phrases), 32)
+
+    queries = normalize((centers[label_ids[::5]] + 0.3 * rng.normal(size=(len(label_ids[::5]), 24))) @ basis)
+    agree = np.mean([full.label(full.search(q)[0]) == reduced.label(reduced.search(q)[0]) for q in queries])
+    assert agree >= 0.95
+
+    bank = intent_cache.load_or_build(str(intents_file), _fake_encode, "fake", dim=2)
+    assert bank.projection is not None and bank.embeddings.shape == (3, 2)
+    assert bank.label(bank.search(intent_cache.normalize(_fake_encode(["hello"]))[0])[0]) == "greet"
+
+
+def test_search_batch_matches_single_queries():
+    from nlu.embeddings import normalize
+    from nlu.evaluate import build_bank
+    rng = np.random.default_rng(2)
+    centers = normalize(rng.normal(size=(30, 48)))
+    label_ids = np.repeat(np.arange(30), 20).astype(np.int16)
+    phrases = normalize(centers[label_ids] + 0.1 * rng.normal(size=(len(label_ids), 48)))
+    queries = normalize(centers[rng.integers(0, 30, 200)] + 0.3 * rng.normal(size=(200, 48)))
+
+    for k, dim in ((0, 0), (4, 0), (0, 16)):
+        bank = build_bank(phrases, label_ids, [str(i) for i in range(30)], k=k, dim=dim)
+        indices, scores = bank.search_batch(queries, chunk=64)
+        single = [bank.search(query) for query in queries]
+        assert indices.tolist() == [index for index, _ in single]
+        assert np.allclose(scores, [score for _, score in single], atol=1e-5)
@@ -4,13 +4,13 @@ import re
 import shlex
 import time
 import json
-import queue
+import atexit
 import asyncio
 import string
-import tempfile
 import subprocess
 import threading
 import collections
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import webbrowser
 import imaplib
@@ -20,6 +20,7 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from intent_classifier import detect_intent
+from nlu.embeddings import new_turn as new_embedding_turn
 import psutil
 import pyjokes
 from deep_translator import GoogleTranslator
@@ -35,16 +36,11 @@ import requests
 import aiohttp
 import openai
 import schedule
-import whisper
-import sounddevice as sd
 import numpy as np
-from scipy.io.wavfile import write
 from googlesearch import search
 from duckduckgo_search import DDGS
-from vosk import Model, KaldiRecognizer
 import speech_recognition as sr
 #from playsound import playsound
-import webrtcvad
 import keyword
 import ast
 import tokenize
@@ -61,6 +57,18 @@ logger = logging.getLogger("JarvisUtils")
 import config
 #import web_ui
 from secondaryClassifier import is_code_worthy
+from asr.model_registry import registry as asr_models
+from asr.capture import get_capture_service, AudioInputEnded, GATING_TAG, playback as capture_playback
+from asr.audio import SAMPLE_RATE
+from asr.wake_word import WakeWordDetector
+from asr.routing import ROUTE_AUTO, ROUTE_WHISPER
+from asr.pipeline import recognize_utterance
+from asr.dictation import dictate as dictate_from
+from asr.archive import UtteranceArchive
+from asr.worker import ASRWorker, WorkerError, WorkerStartError
+from asr.calibration import model_sizes, TURN_COMMAND, TURN_DICTATION, TURN_REPLY
+from asr.settings import VAD_AGGRESSIVENESS, SPECULATIVE_INTENT, ASR_WORKER_PROCESS
+from asr.settings import ASR_ARCHIVE_DIR, ASR_ARCHIVE_MAX_MB, ASR_ARCHIVE_FORMAT
 
 MISTRAL_API_KEY = config.MISTRAL_API_KEY
 
@@ -76,7 +84,9 @@ BRIGHTNESS_SCRIPT = os.path.join(PROJECT_ROOT, "scripts", "brightness_control.sh
 
 # Other paths
 CONTACTS_FILE = os.path.join(PROJECT_ROOT, "contact.json")
-VOSK_MODEL_PATH = os.path.join(os.path.expanduser("~"), "Downloads", "vosk-model-small-en-us-0.15")
+
+# Classify the Vosk hypothesis while Whisper is still running
+_speculation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jarvis-speculate")
 
 # Weather Information
 async def get_weather(city="Kathmandu"):
@@ -267,83 +277,341 @@ def load_contacts(filename=CONTACTS_FILE):
     with open(filename, "r") as f:
         return json.load(f)
 
-# function to listen 
-def listen(model="tiny", language="en"):
-    # Vosk configuration
-    vosk_model_paths = {
-        "en": VOSK_MODEL_PATH
-        #"en": "/home/khagendra/Downloads/vosk-model-small-en-in-0.4"
-        # You can extend this with other language paths if needed
-    }
+# Whisper size per turn type, chosen by preload_speech_models()
+_asr_model_sizes = {TURN_COMMAND: "tiny", TURN_DICTATION: "tiny", TURN_REPLY: "tiny"}
+
+def asr_model_for(turn=TURN_COMMAND):
+    """Whisper size to use for a turn type (TURN_COMMAND, TURN_DICTATION or TURN_REPLY)."""
+    return _asr_model_sizes[turn]
 
-    if language not in vosk_model_paths:
-        raise ValueError(f"No Vosk model path configured for language: {language}")
+# preload speech models
+def preload_speech_models(model=None, language="en", calibration_voice=None):
+    """
+    Load the Vosk and Whisper models once at startup and start the microphone
+    capture service, so every listen() call starts capturing audio immediately.
+
+    Without an explicit `model`, the Whisper size for each turn type comes
+    from the CPU calibration (asr/calibration.py); its clip is synthesized
+    with the `calibration_voice` Piper model on first run.
 
-    vosk_model_path = vosk_model_paths[language]
-    logger.info("🔁 Loading Vosk model...")
-    vosk_model = Model(vosk_model_path)
-    vosk_recognizer = KaldiRecognizer(vosk_model, 16000)
-    vosk_recognizer.SetWords(True)
+    With ASR_WORKER_PROCESS the backend is loaded by the ASR worker process
+    instead; this process only keeps the Vosk model for the wake word.
+    """
+    if model is None:
+        _asr_model_sizes.update(model_sizes(calibration_voice))
+    else:
+        _asr_model_sizes.update(dict.fromkeys(_asr_model_sizes, model))
+    sizes = sorted(set(_asr_model_sizes.values()))
+
+    if ASR_WORKER_PROCESS:
+        get_asr_worker(sizes, language)
+        asr_models.vosk_model(language)
+        stats = asr_models.stats()
+    else:
+        stats = asr_models.preload(size=sizes, language=language)
+    get_capture_service()
+    for entry in stats["models"]:
+        logger.info(f"📦 {entry['backend']} {entry['size']} ({entry['language']}): "
+                    f"{entry['load_seconds']}s, {entry['rss_bytes'] / (1024 * 1024):.1f} MB")
+    logger.info(f"📦 Process RSS: {stats['process_rss_bytes'] / (1024 * 1024):.1f} MB")
+    return stats
+
+# ASR worker process
+_asr_worker = None
+_asr_worker_lock = threading.Lock()
+ASR_WORKER_MAX_RESTARTS = 3  # within ASR_WORKER_RESTART_WINDOW seconds, then give up
+ASR_WORKER_RESTART_WINDOW = 60
+_asr_worker_restarts = collections.deque(maxlen=ASR_WORKER_MAX_RESTARTS)
+
+def get_asr_worker(models=None, language="en"):
+    """
+    Return the ASR worker process, (re)starting it if it is not running. It
+    preloads `models`, by default every size in use for some turn type.
+
+    Raises WorkerStartError if the worker cannot load its models, or if it
+    keeps exiting, rather than respawning it on every turn.
+    """
+    global _asr_worker
+    with _asr_worker_lock:
+        if _asr_worker is None or not _asr_worker.alive:
+            if _asr_worker is not None:
+                now = time.monotonic()
+                if (len(_asr_worker_restarts) == ASR_WORKER_MAX_RESTARTS
+                        and now - _asr_worker_restarts[0] < ASR_WORKER_RESTART_WINDOW):
+                    raise WorkerStartError(f"ASR worker exited {ASR_WORKER_MAX_RESTARTS} times within "
+                                           f"{ASR_WORKER_RESTART_WINDOW}s, not restarting it again")
+                _asr_worker_restarts.append(now)
+                logger.warning("⚠️ ASR worker process exited, restarting it")
+            _asr_worker = ASRWorker(preload_sizes=models or sorted(set(_asr_model_sizes.values())),
+                                    language=language)
+            _asr_worker.start()
+            atexit.register(_asr_worker.stop)
+        return _asr_worker
+
+def _print_partial(text):
+    print(f"📝 Vosk Partial: {text}", end="\r", flush=True)
+
+# Opt-in archive of recognized utterances for replay and profiling
+_archive = (UtteranceArchive(ASR_ARCHIVE_DIR, ASR_ARCHIVE_MAX_MB * 1024 * 1024, ASR_ARCHIVE_FORMAT)
+            if ASR_ARCHIVE_DIR else None)
+_last_archive_record = None
+
+def _archive_utterance(utterance, model, route):
+    """Queue the utterance's audio and metadata for the archive; the hot path only pays a queue put."""
+    global _last_archive_record
+    _last_archive_record = None
+    audio = utterance.pop("audio", None) if utterance else None
+    if _archive is None or not audio:
+        return
+    _last_archive_record = _archive.submit(audio, {
+        "model": model, "route": route, "engine": utterance["engine"], "text": utterance["text"],
+        "vosk_text": utterance["vosk_text"], "whisper_text": utterance["whisper_text"],
+        "confidence": utterance["confidence"], "timings": utterance["timings"],
+    })
+
+def _spoken_over_playback(capture, utterance):
+    """With PLAYBACK_GATING = "tag": True if the utterance is mostly the assistant's own voice."""
+    if utterance is None or capture.gating != GATING_TAG:
+        return False
+    end = utterance["capture_end"]
+    start = end - int(utterance["timings"]["audio_seconds"] * SAMPLE_RATE)
+    if capture.playback_fraction(start, end) <= 0.5:
+        return False
+    logger.info(f"🔇 Ignoring speech captured during playback: {utterance['text']}")
+    return True
 
-    logger.info(f"🧠 Loading Whisper model ({model})...")
-    whisper_model = whisper.load_model(model)
+# function to listen 
+def listen(model="tiny", language="en", route=ROUTE_WHISPER, on_hypothesis=None, stream=False):
+    """
+    Capture one utterance and return its transcription.
 
-    # Audio stream setup
-    q = queue.Queue()
-    samplerate = 16000
-    blocksize = 8000
+    With route=ROUTE_AUTO, short commands that Vosk recognized with high word
+    confidence and that match a known intent are returned without running
+    Whisper. Use the default ROUTE_WHISPER for free-form answers.
 
-    def audio_callback(indata, frames, time, status):
-        if status:
-            logger.warning(f"⚠️ {status}")
-        q.put(bytes(indata))
+    on_hypothesis, if given, is called with the Vosk text just before Whisper
+    starts so callers can overlap their own work with the transcription.
 
-    def save_audio_to_temp_file(audio_chunks):
-        audio = b''.join(audio_chunks)
-        audio_np = np.frombuffer(audio, dtype=np.int16)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmpfile:
-            write(tmpfile.name, samplerate, audio_np)
-            return tmpfile.name
+    stream=True transcribes long utterances (dictation, questions) while the
+    user is still speaking, so the wait after they stop stays short.
+    """
+    # Audio comes from the always-on capture service; the cursor starts slightly
+    # in the past so the first syllable spoken after a prompt is kept
+    capture = get_capture_service()
 
     logger.info("\n🎙️ Speak into the mic... (Ctrl+C to stop)\n")
-    audio_chunks = []
 
     try:
-        with sd.RawInputStream(samplerate=samplerate, blocksize=blocksize, dtype='int16',
-                               channels=1, callback=audio_callback):
-            while True:
-                data = q.get()
-                audio_chunks.append(data)
-
-                if vosk_recognizer.AcceptWaveform(data):
-                    result = json.loads(vosk_recognizer.Result())
-                    final_text = result.get("text", "").strip()
-                    if final_text:
-                        logger.info(f"\n✅ Vosk Final: {final_text}")
-                        
-                        logger.info("🧠 Passing to Whisper for better transcription...")
-                        audio_path = save_audio_to_temp_file(audio_chunks)
-                        whisper_result = whisper_model.transcribe(audio_path, language=language)
-                        whisper_text = whisper_result.get("text", "").strip()
-                        os.remove(audio_path)
-
-                        logger.info(f"🔍 Whisper: {whisper_text}\n")
-                        audio_chunks = []
-
-                        # Return transcription if you want to exit after one sentence
-                        return whisper_text
+        while True:
+            if ASR_WORKER_PROCESS:
+                utterance = get_asr_worker(language=language).recognize(
+                    capture, model=model, language=language, route=route, stream=stream, detect=detect_intent,
+                    on_partial=_print_partial, on_hypothesis=on_hypothesis, keep_audio=_archive is not None)
+            else:
+                with capture.cursor(preroll_ms=500) as cursor:
+                    utterance = recognize_utterance(cursor, model=model, language=language, route=route,
+                                                    detect=detect_intent, on_hypothesis=on_hypothesis, stream=stream,
+                                                    on_partial=_print_partial, keep_audio=_archive is not None)
+                    if utterance is not None:
+                        utterance["capture_end"] = cursor.position
+            if not _spoken_over_playback(capture, utterance):
+                break
+        _archive_utterance(utterance, model, route)
+        if utterance is None and capture.ended:
+            raise AudioInputEnded()
+        return utterance["text"] if utterance else None
 
-                else:
-                    partial_result = json.loads(vosk_recognizer.PartialResult())
-                    partial_text = partial_result.get("partial", "").strip()
-                    if partial_text:
-                        logger.info(f"📝 Vosk Partial: {partial_text}")
-                        print(f"📝 Vosk Partial: {partial_text}", end="\r", flush=True)
+    except KeyboardInterrupt:
+        logger.info("\n🛑 Stopped listening.")
+        return None
+    except WorkerError as e:
+        # get_asr_worker() restarts a worker that has exited on the next call
+        logger.error(f"❌ Speech recognition failed: {e}")
+        return None
+
+async def listen_async(model="tiny", language="en", route=ROUTE_WHISPER, on_hypothesis=None, stream=False):
+    """
+    Awaitable listen(). Decoding runs in the ASR worker process, so the event
+    loop keeps serving timers and other tasks while the user speaks and while
+    Whisper runs. Without ASR_WORKER_PROCESS, listen() runs on a thread instead.
+    """
+    if not ASR_WORKER_PROCESS:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: listen(model, language=language, route=route,
+                                                               on_hypothesis=on_hypothesis, stream=stream))
+
+    logger.info("\n🎙️ Speak into the mic...\n")
+    capture = get_capture_service()
+    while True:
+        try:
+            utterance = await get_asr_worker(language=language).recognize_async(
+                capture, model=model, language=language, route=route, stream=stream, detect=detect_intent,
+                on_partial=_print_partial, on_hypothesis=on_hypothesis, keep_audio=_archive is not None)
+        except WorkerError as e:
+            logger.error(f"❌ Speech recognition failed: {e}")
+            return None
+        if not _spoken_over_playback(capture, utterance):
+            break
+    _archive_utterance(utterance, model, route)
+    if utterance is None and capture.ended:
+        raise AudioInputEnded()
+    return utterance["text"] if utterance else None
+
+# long-form dictation
+def dictate(model="tiny", language="en", on_text=None):
+    """
+    Capture dictation until a stop phrase ("stop dictation") or a long pause
+    and return the text. Chunks are transcribed in the background while the
+    user keeps talking and passed to `on_text` as they are ready.
+    """
+    capture = get_capture_service()
+    logger.info("\n🖊️ Dictation started, say 'stop dictation' when you are done\n")
+    try:
+        if ASR_WORKER_PROCESS:
+            result = get_asr_worker(language=language).dictate(capture, model=model, language=language,
+                                                               on_text=on_text)
+        else:
+            with capture.cursor(preroll_ms=500) as cursor:
+                result = dictate_from(cursor, model=model, language=language, on_text=on_text)
+        if result is None and capture.ended:
+            raise AudioInputEnded()
+        return result["text"] if result else ""
+    except KeyboardInterrupt:
+        logger.info("\n🛑 Stopped dictation.")
+        return ""
+    except WorkerError as e:
+        logger.error(f"❌ Dictation failed: {e}")
+        return ""
+
+async def dictate_async(model="tiny", language="en", on_text=None):
+    """Awaitable dictate(); it runs on a thread so the event loop keeps going while the user talks."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lambda: dictate(model, language=language, on_text=on_text))
+
+def _dictate_to_file(path, model):
+    # Each chunk is appended as soon as it is transcribed, so a crash loses at most one chunk;
+    # the file is only created with the first chunk, so an empty dictation leaves nothing behind
+    files = []
+
+    def append(text):
+        if not files:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            files.append(open(path, "a"))
+        f = files[0]
+        f.write(("" if f.tell() == 0 else " ") + text)
+        f.flush()
+
+    try:
+        return dictate(model, language="en", on_text=append)
+    finally:
+        for f in files:
+            f.close()
+
+# wait for the wake word
+_wake_detectors = {}
+
+def wait_for_wake_word(language="en"):
+    """
+    Block until one of the wake_up phrases is spoken and return it.
 
+    Only webrtcvad and a closed-grammar Vosk recognizer run while waiting, so
+    the idle loop costs a fraction of a full listen() + detect_intent() turn.
+    """
+    detector = _wake_detectors.get(language)
+    if detector is None:
+        detector = _wake_detectors[language] = WakeWordDetector(language=language,
+                                                                vad_aggressiveness=VAD_AGGRESSIVENESS)
+    detector.reset()
+    capture = get_capture_service()
+
+    try:
+        with capture.cursor(preroll_ms=300) as cursor:
+            while True:
+                pcm = cursor.read(1600)
+                if not pcm and capture.ended:
+                    raise AudioInputEnded()
+                phrase = detector.accept(pcm)
+                if phrase:
+                    return phrase
     except KeyboardInterrupt:
         logger.info("\n🛑 Stopped listening.")
         return None
 
+# listen and classify, overlapping intent detection with Whisper
+class _IntentSpeculation:
+    """Classifies the Vosk hypothesis on a worker thread while Whisper refines it."""
+
+    def __init__(self, prefetch=None):
+        self.prefetch = prefetch
+        self.text = None
+        self.future = None
+
+    def _speculate(self, hypothesis):
+        intent, confidence = detect_intent(hypothesis.lower())
+        prefetched = None
+        if self.prefetch and intent in self.prefetch:
+            prefetched = _speculation_pool.submit(self.prefetch[intent])
+        return intent, confidence, prefetched
+
+    def on_hypothesis(self, hypothesis):
+        self.text = hypothesis
+        self.future = _speculation_pool.submit(self._speculate, hypothesis)
+
+    def resolve(self, text):
+        """Return (text, intent, confidence, prefetched) for the final transcription."""
+        if not text:
+            return text, None, 0.0, None
+
+        speculative_intent, prefetched = None, None
+        if self.future is not None:
+            speculative_intent, speculative_confidence, prefetched = self.future.result()
+            if clean_input(text) == clean_input(self.text):
+                logger.info(f"🔮 Speculative intent confirmed: {speculative_intent}")
+                return text, speculative_intent, speculative_confidence, prefetched
+
+        intent, confidence = detect_intent(text.lower())
+        if prefetched is not None and intent != speculative_intent:
+            logger.info(f"🔮 Discarding speculative {speculative_intent}, Whisper says {intent}")
+            prefetched.cancel()
+            prefetched = None
+        return text, intent, confidence, prefetched
+
+
+def listen_for_intent(model="tiny", language="en", route=ROUTE_AUTO, prefetch=None, stream=False):
+    """
+    Capture one command and return (text, intent, confidence, prefetched).
+
+    While Whisper refines the transcription, the Vosk hypothesis is classified
+    on a worker thread. If Whisper agrees with Vosk, that speculative intent is
+    used as is. `prefetch` maps intents to side-effect free callables; the one
+    matching the speculative intent is started early and returned as a Future
+    in `prefetched` only when the final intent confirms it, otherwise it is
+    discarded.
+    """
+    new_embedding_turn()
+    speculation = _IntentSpeculation(prefetch)
+    text = listen(model, language=language, route=route,
+                  on_hypothesis=speculation.on_hypothesis if SPECULATIVE_INTENT else None, stream=stream)
+    return _annotate_archive(speculation.resolve(text))
+
+
+async def listen_for_intent_async(model="tiny", language="en", route=ROUTE_AUTO, prefetch=None, stream=False):
+    """Awaitable listen_for_intent() built on listen_async()."""
+    new_embedding_turn()
+    speculation = _IntentSpeculation(prefetch)
+    text = await listen_async(model, language=language, route=route,
+                              on_hypothesis=speculation.on_hypothesis if SPECULATIVE_INTENT else None, stream=stream)
+    loop = asyncio.get_running_loop()
+    return _annotate_archive(await loop.run_in_executor(None, speculation.resolve, text))
+
+
+def _annotate_archive(result):
+    # The intent is only known after listen() returned; add it to the archived utterance
+    text, intent, confidence, _ = result
+    if _last_archive_record is not None and text:
+        _last_archive_record.annotate(intent=intent, intent_confidence=float(confidence))
+    return result
+
 
 async def get_mistral_response(prompt):
     """Get response from Mistral AI API"""
@@ -409,7 +677,9 @@ def speak(text, selected_model=None):
 
         # Use subprocess to execute the echo command and pipe it to piper
         command = f"echo {escaped_text} | piper --model {selected_model} --output-raw | aplay -r 22050 -f S16_LE -t raw -"
-        subprocess.run(command, shell=True, check=True)
+        # The microphone would otherwise transcribe (and act on) our own voice
+        with capture_playback():
+            subprocess.run(command, shell=True, check=True)
     except subprocess.CalledProcessError as e:
         logger.error(f"Error occurred while trying to speak: {e}")
 
@@ -438,17 +708,11 @@ def speak(text, selected_model=None):
 
         
 def sleep_now(selected_model):
-    model = "tiny"
     speak("Okay sir!", selected_model)
-    while True:
-            audio_input = listen(model, language="en")
-            if not audio_input: 
-                continue
-            command = audio_input.lower()
-            intent , confidence = detect_intent(command)
-            if intent == "wake_up":
-                speak("I'm here, sir!", selected_model)
-                return 
+    # Idle on the cheap wake-word detector instead of full transcription
+    while not wait_for_wake_word(language="en"):
+        continue
+    speak("I'm here, sir!", selected_model)
             
 def check_script_exists(script_path):
     import os
@@ -459,7 +723,7 @@ def check_script_exists(script_path):
 
 # Example usage in play_music, change_wallpaper, etc.
 def play_music(selected_model):
-    model = whisper.load_model("tiny")
+    model = asr_model_for(TURN_REPLY)
     if not check_script_exists(MUSIC_SCRIPT):
         speak("Music player script is missing or not executable.", selected_model)
         return
@@ -467,7 +731,7 @@ def play_music(selected_model):
         subprocess.Popen([MUSIC_SCRIPT, "play"])
         speak("Launching your music player now. Enjoy the vibes.", selected_model)
         while True:
-            audio_input = listen(model, language="en")
+            audio_input = listen(model, language="en", route=ROUTE_AUTO)
             if not audio_input:
                 continue
             command = audio_input.lower()
@@ -639,11 +903,17 @@ def start_timer(seconds, selected_model):
 def tell_joke():
     return pyjokes.get_joke()
 # create note
-def create_note(content):
+def create_note(content=None, model="tiny"):
+    """Save `content` as a new note, or dictate the note when no content is given."""
     filename = f"note_{int(time.time())}.txt"
     path = os.path.join(os.path.expanduser("~/Documents/Notes"), filename)
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
+    if content is None:
+        if not _dictate_to_file(path, model):
+            return "I didn't catch anything to write down."
+        return f"Note saved as {filename}"
+
     with open(path, "w") as f:
         f.write(content)
 
@@ -831,11 +1101,16 @@ def scan_wifi():
         logger.error(f"Error scanning Wi-Fi: {e}")
         return f"Error scanning Wi-Fi: {e}"
 # voice note
-def save_voice_note(text):
+def save_voice_note(text=None, model="tiny"):
+    """Save `text` as a voice note, or dictate the note when no text is given."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"voice_note_{timestamp}.txt"
     path = os.path.join(os.path.expanduser("~/Documents/VoiceNotes"), filename)
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    if text is None:
+        if not _dictate_to_file(path, model):
+            return "I didn't catch anything to save."
+        return f"Saved voice note: {filename}"
     with open(path, "w") as f:
         f.write(text)
     return f"Saved voice note: {filename}"